@@ -1,4 +1,5 @@
 import csv
+from contextlib import asynccontextmanager
 import io
 import tempfile
 import shutil
@@ -16,7 +17,7 @@ from app.services.auth.auth_dependents import require_privileges
 from app.services.registrars.assay_result_registrar import AssayResultsRegistrar
 from app.services.registrars.assay_run_registrar import AssayRunRegistrar
 from app.services.registrars.batch_registrar import BatchRegistrar
-from app.services.registrars.compound_registrar import CompoundRegistrar
+from app.services.registrars.compound_registrar import CompoundRegistrar, shutdown_mol_pool
 from app import models
 from app import crud
 from app.services.registrars.writer import StreamingResultWriter
@@ -44,7 +45,14 @@ except ImportError:
 # models.Base.metadata.create_all(bind=engine)
 
 
-app = FastAPI(title="MolTrack API", description="API for managing chemical compounds and batches")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Stop the RDKit worker processes shared by the registrars
+    shutdown_mol_pool()
+
+
+app = FastAPI(title="MolTrack API", description="API for managing chemical compounds and batches", lifespan=lifespan)
 router = APIRouter(prefix="/v1")
 
 
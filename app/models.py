@@ -1,6 +1,7 @@
 import json
+from functools import lru_cache
 from typing import Any, Dict, List, NamedTuple, Optional, Set, Union, Literal, get_args
-from pydantic import ConfigDict, field_validator, model_validator, validator
+from pydantic import ConfigDict, conlist, field_validator, model_validator, validator
 from sqlalchemy import Column, DateTime, Enum, CheckConstraint, String
 from sqlalchemy.dialects.postgresql import ARRAY, CIDR
 from sqlmodel import SQLModel, Field, Relationship
@@ -732,6 +733,10 @@ def validate_field(v: str) -> str:
     return v
 
 
+# Field paths repeat heavily across conditions and requests; invalid ones raise and are therefore never cached
+_validate_field_cached = lru_cache(maxsize=4096)(validate_field)
+
+
 # Advanced Search Models - New Recursive Structure
 class AtomicCondition(SQLModel):
     """Individual atomic search condition with field, operator, and value"""
@@ -743,7 +748,7 @@ class AtomicCondition(SQLModel):
 
     @field_validator("field")
     def validate_field_format(cls, v):
-        return validate_field(v)
+        return _validate_field_cached(v)
 
     @model_validator(mode="before")
     def validate_threshold(cls, values):
@@ -774,7 +779,9 @@ class LogicalNode(SQLModel):
         return v
 
 
-# Filter is a union type - can be either AtomicCondition or LogicalNode
+# Filter is a union type - can be either AtomicCondition or LogicalNode.
+# The "Filter" forward reference in LogicalNode is resolved by pydantic on first use, so there is no eager
+# LogicalNode.model_rebuild() at import time.
 Filter = Union[AtomicCondition, LogicalNode]
 
 
@@ -790,22 +797,16 @@ class Aggregation(SQLModel):
 
     @field_validator("field", mode="after")
     def validate_field_format(cls, v):
-        return validate_field(v)
+        return _validate_field_cached(v)
 
 
 class BaseSearchRequest(SQLModel):
-    output: List[str]  # Columns to return
+    output: conlist(str, min_length=1)  # Columns to return
     aggregations: Optional[List[Aggregation]] = Field(default_factory=list)
     filter: Optional[Filter] = None
     output_format: enums.SearchOutputFormat = enums.SearchOutputFormat.json
     limit: Optional[int] = None
 
-    @field_validator("output")
-    def validate_output(cls, v):
-        if not v:
-            raise ValueError("Output must specify at least one column")
-        return v
-
 
 class SearchRequest(BaseSearchRequest):
     """Main search request model with recursive filter structure"""
@@ -823,10 +824,6 @@ class SearchResponse(SQLModel):
     columns: List[str]
 
 
-# Update forward references for recursive types
-LogicalNode.model_rebuild()
-
-
 class Token(NamedTuple):
     type: str
     value: Union[str, float, bool, None]
@@ -1,6 +1,7 @@
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import FrozenSet, List, Optional, Tuple
 import uuid
 from fastapi import status
 
@@ -35,12 +36,40 @@ def create_key(owner_id: uuid.UUID, privileges: List[enums.AuthPrivileges], ip_a
     return full_api_key
 
 
+@dataclass(slots=True, frozen=True)
+class KeyRecordSnapshot:
+    """
+    Immutable copy of the api key fields needed to authenticate a request.
+    Unlike the ORM instance it is safe to cache and share between sessions.
+    """
+
+    status: enums.APIKeyStatus
+    secret_hash: str
+    privileges: FrozenSet[str]
+    ip_allowlist: Tuple[str, ...]
+    expires_at_epoch: Optional[float]
+
+    @classmethod
+    def from_record(cls, rec: ApiKey) -> "KeyRecordSnapshot":
+        expires_at = rec.expires_at
+        if expires_at is not None and expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return cls(
+            status=rec.status,
+            secret_hash=rec.secret_hash,
+            privileges=frozenset(rec.privileges or ()),
+            ip_allowlist=tuple(str(cidr) for cidr in rec.ip_allowlist or ()),
+            expires_at_epoch=expires_at.timestamp() if expires_at else None,
+        )
+
+
 @lru_cache(maxsize=128)
-def get_key_record(db: Session, prefix: str) -> Optional[Dict[str, Any]]:
+def get_key_record(db: Session, prefix: str) -> Optional[KeyRecordSnapshot]:
     """
     Fetch key record by prefix.
-    Returns dict with: stored_hash (str), status (str), scopes (list[str]),
-    owner_id (UUID), ip_allowlist (list[str])
+    Returns a KeyRecordSnapshot with: secret_hash (str), status, privileges (frozenset[str]),
+    ip_allowlist (tuple[str]) and expires_at_epoch (float or None)
     """
 
-    return db.query(ApiKey).filter(ApiKey.prefix == prefix).first()
+    rec = db.query(ApiKey).filter(ApiKey.prefix == prefix).first()
+    return KeyRecordSnapshot.from_record(rec) if rec else None
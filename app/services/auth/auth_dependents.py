@@ -1,5 +1,5 @@
-from datetime import datetime, timezone
 import hmac
+import time
 from sqlalchemy.orm import Session
 from fastapi import Depends, HTTPException, Header, Request
 from fastapi import status
@@ -23,10 +23,10 @@ def verify_api_key(
     if not x_api_key:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Missing API key")
 
-    try:
-        prefix, secret = x_api_key.split(".", 1)
-    except ValueError:
+    sep = x_api_key.find(".")
+    if sep <= 0:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Malformed API key")
+    prefix = x_api_key[:sep]
 
     rec = get_key_record(db, prefix)
     if not rec or rec.status != enums.APIKeyStatus.active:
@@ -38,11 +38,9 @@ def verify_api_key(
     if not hmac.compare_digest(calc, rec.secret_hash):
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
 
-    expires_at = rec.expires_at
-    if expires_at:
-        now = datetime.now(timezone.utc)
-        if expires_at < now:
-            raise HTTPException(status_code=401, detail="API key expired")
+    expires_at_epoch = rec.expires_at_epoch
+    if expires_at_epoch is not None and expires_at_epoch < time.time():
+        raise HTTPException(status_code=401, detail="API key expired")
 
     client_ip = request.client.host if request.client else "0.0.0.0"
     if not ip_allowed(client_ip, rec.ip_allowlist):
@@ -52,8 +50,10 @@ def verify_api_key(
 
 
 def require_privileges(*required: str):
+    required_set = frozenset(required)
+
     def dep(auth=Depends(verify_api_key)):
-        if not set(required).intersection(auth["privileges"]):
+        if required_set.isdisjoint(auth["privileges"]):
             raise HTTPException(status.HTTP_403_FORBIDDEN, detail="You do not have privileges to access this resource")
         return auth
 
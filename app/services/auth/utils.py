@@ -16,21 +16,16 @@ else:
     logger.warning("APIKEY_HMAC_KEY_B64 not set, HMAC operations will not work.")
 
 
-def _b64url(nbytes: int) -> str:
-    return base64.urlsafe_b64encode(secrets.token_bytes(nbytes)).rstrip(b"=").decode()
-
-
-def generate_api_key(prefix_len_bytes: int = 5) -> Tuple[str, str, str]:
+def generate_api_key(prefix_len_bytes: int = 5) -> Tuple[str, str]:
     """
     Returns (full_key, prefix).
-    Format: sk_{env}_{prefixid}.{secret}
+    Format: {prefixid}.{secret}
     secret: 32 bytes (~256-bit) base64url, no padding.
     """
 
-    prefix_id = _b64url(prefix_len_bytes)  # short, non-secret lookup id
-    secret = _b64url(32)
-    full_key = f"{prefix_id}.{secret}"
-    return full_key, prefix_id
+    prefix_id = secrets.token_urlsafe(prefix_len_bytes)  # short, non-secret lookup id
+    secret = secrets.token_urlsafe(32)
+    return f"{prefix_id}.{secret}", prefix_id
 
 
 def hmac_hash(full_key: str) -> bytes:
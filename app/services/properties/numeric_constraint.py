@@ -77,32 +77,27 @@ class NumericConstraint:
 
         return None
 
+    # Operator -> predicate(constraint, x); replaces a chain of comparisons evaluated per value
+    _checks = {
+        NONE: lambda c, x: False,
+        GT: lambda c, x: x > c.v1,
+        GTOE: lambda c, x: x >= c.v1,
+        LT: lambda c, x: x < c.v1,
+        LTOE: lambda c, x: x <= c.v1,
+        EQUALS: lambda c, x: x == c.v1,
+        NOT_EQUALS: lambda c, x: x != c.v1,
+        IN: lambda c, x: x in c.values,
+        NOT_IN: lambda c, x: x not in c.values,
+        RANGE: lambda c, x: c.v1 <= x <= c.v2,
+        IS_NULL: lambda c, x: False,
+        IS_NOT_NULL: lambda c, x: True,
+    }
+
     def is_satisfied_for(self, x: Optional[Union[int, float]]) -> bool:
         if x is None:
             return self.op in (self.NONE, self.IS_NULL)
 
-        if self.op == self.NONE:
-            return False
-        if self.op == self.GT:
-            return x > self.v1
-        if self.op == self.GTOE:
-            return x >= self.v1
-        if self.op == self.LT:
-            return x < self.v1
-        if self.op == self.LTOE:
-            return x <= self.v1
-        if self.op == self.EQUALS:
-            return x == self.v1
-        if self.op == self.NOT_EQUALS:
-            return x != self.v1
-        if self.op == self.IN:
-            return x in self.values
-        if self.op == self.NOT_IN:
-            return x not in self.values
-        if self.op == self.RANGE:
-            return self.v1 <= x <= self.v2
-        if self.op == self.IS_NULL:
-            return False
-        if self.op == self.IS_NOT_NULL:
-            return True
-        raise ValueError(f"Unknown operation {self.op}")
+        check = self._checks.get(self.op)
+        if check is None:
+            raise ValueError(f"Unknown operation {self.op}")
+        return check(self, x)
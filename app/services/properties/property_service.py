@@ -7,11 +7,17 @@ from app.services.properties.complex_validator import ComplexValidator
 from app.services.properties.property_validator import PropertyValidator
 from app.utils import type_casting_utils, enums
 from app.utils.admin_utils import admin
-from typing import Dict, Any, List, Optional, Tuple, Type
+from typing import Dict, Any, List, Optional, Set, Tuple, Type
 from app.utils.registrar_utils import get_validation_prefix
 
 
 _LIST_SPLIT_RE = re.compile(r"[,;|]")
+_QUALIFIER_TYPES = frozenset(("double", "int"))
+_QUALIFIER_MAP = {
+    "<": enums.ValueQualifier.LESS_THAN,
+    ">": enums.ValueQualifier.GREATER_THAN,
+    "=": enums.ValueQualifier.EQUALS,
+}
 
 
 class PropertyService:
@@ -20,6 +26,7 @@ class PropertyService:
         self.institution_synonym_dict = self._load_institution_synonym_dict()
         self.entity = entity
         self.validators = self._load_validators(db, entity)
+        self._detail_templates: Dict[Tuple[Type, str], Dict[str, Any]] = {}
 
     def _load_validators(self, db, entity: str) -> List[str]:
         results = db.query(Validator.expression).filter(Validator.entity_type == entity).all()
@@ -59,6 +66,25 @@ class PropertyService:
             "cast_fn": type_casting_utils.value_type_cast_map[value_type],
         }
 
+    def _detail_template(self, model: Type, field_name: str) -> Dict[str, Any]:
+        """
+        Defaults for the value columns of `model` other than `field_name`, in column order.
+        Depends only on the model and the target value column, so it is computed once per pair.
+        """
+        template = self._detail_templates.get((model, field_name))
+        if template is None:
+            mapper = inspect(model)
+            template = {}
+            for col in mapper.columns:
+                if not col.key.startswith("value") or col.key in field_name:
+                    continue
+                default = None
+                if col.default is not None and not callable(col.default.arg):
+                    default = col.default.arg
+                template[col.key] = default
+            self._detail_templates[(model, field_name)] = template
+        return template
+
     def iter_property_values(self, properties, entity_type):
         for prop_name, raw_value in properties.items():
             prop_info = self.get_property_info(prop_name, entity_type)
@@ -82,11 +108,11 @@ class PropertyService:
         entity_type: enums.EntityType,
         include_user_fields: bool = True,
         additional_details: Optional[Dict[str, Any]] = None,
+        prevalidated: Optional[Set[str]] = None,
     ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         records_to_insert = []
         records_to_validate = {}
 
-        mapper = inspect(model)
         for prop_name, prop_info, value in self.iter_property_values(properties, entity_type):
             prop = prop_info["property"]
             value_type = prop_info["value_type"]
@@ -99,7 +125,9 @@ class PropertyService:
 
             value_qualifier, value = self.extract_qualifiers(value_type, value)
 
-            PropertyValidator.validate_value(value, prop)
+            PropertyValidator.validate_value(
+                value, prop, check_numeric=not prevalidated or prop_name not in prevalidated
+            )
 
             try:
                 casted_value = cast_fn(value)
@@ -112,21 +140,9 @@ class PropertyService:
                 field_name: casted_value,
             }
 
-            value_columns = [
-                col.key for col in mapper.columns if col.key.startswith("value") and col.key not in field_name
-            ]
-
-            for col_name in value_columns:
-                if col_name == "value_qualifier":
-                    detail[col_name] = value_qualifier
-                    continue
-
-                column = mapper.columns[col_name]
-                default = None
-                if column.default is not None:
-                    if not callable(column.default.arg):
-                        default = column.default.arg
-                detail[col_name] = default
+            detail.update(self._detail_template(model, field_name))
+            if "value_qualifier" in detail:
+                detail["value_qualifier"] = value_qualifier
 
             records_to_validate.update({prop_name: casted_value})
 
@@ -142,18 +158,56 @@ class PropertyService:
 
         return records_to_insert, records_to_validate
 
+    def prevalidate_numeric_columns(
+        self, details_rows: List[Dict[str, Any]], entity_type: enums.EntityType
+    ) -> List[Set[str]]:
+        """
+        Check the min/max constraints of double properties column by column for a whole chunk.
+        Returns, for every row, the names of the properties whose range was already verified, so that
+        build_details_records can skip the per-value check. Anything not covered here (unknown properties,
+        list inputs, unparsable or out-of-range values) is left to the scalar path, which reports the error.
+        """
+        prevalidated: List[Set[str]] = [set() for _ in details_rows]
+        columns: Dict[str, Tuple[Any, List[int], List[Any]]] = {}
+
+        for idx, details in enumerate(details_rows):
+            for prop_name, value in details.items():
+                # A tuple rather than a set: list inputs are unhashable
+                if value in (None, "", "none"):
+                    continue
+
+                column = columns.get(prop_name)
+                if column is None:
+                    try:
+                        prop_info = self.get_property_info(prop_name, entity_type)
+                    except HTTPException:
+                        prop_info = None
+                    column = columns[prop_name] = (prop_info, [], [])
+
+                prop_info, indices, values = column
+                if prop_info is None or prop_info["value_type"] != enums.ValueType.double:
+                    continue
+                if getattr(prop_info["property"], "input_type", None) == "list":
+                    continue
+
+                _, value = self.extract_qualifiers(prop_info["value_type"], value)
+                indices.append(idx)
+                values.append(value)
+
+        for prop_name, (prop_info, indices, values) in columns.items():
+            if not values:
+                continue
+            mask = PropertyValidator.validate_numeric_column(values, prop_info["property"])
+            for idx, valid in zip(indices, mask.tolist()):
+                if valid:
+                    prevalidated[idx].add(prop_name)
+
+        return prevalidated
+
     def extract_qualifiers(self, value_type: str, value: Any):
         #  Detect and parse value qualifiers
-        value_qualifier = 0
-        if value_type in ("double", "int") and isinstance(value, str):
-            qualifiers = {
-                "<": enums.ValueQualifier.LESS_THAN,
-                ">": enums.ValueQualifier.GREATER_THAN,
-                "=": enums.ValueQualifier.EQUALS,
-            }
-
-            first_char = value[0] if value else ""
-            if first_char in qualifiers:
-                value_qualifier = qualifiers[first_char]
-                value = value[1:].strip()
-        return value_qualifier, value
+        if value_type in _QUALIFIER_TYPES and type(value) is str:
+            value_qualifier = _QUALIFIER_MAP.get(value[:1])
+            if value_qualifier is not None:
+                return value_qualifier, value[1:].strip()
+        return 0, value
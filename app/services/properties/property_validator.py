@@ -1,21 +1,37 @@
 import json
-from typing import Any
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
 from app import models
 from app.services.properties.numeric_constraint import NumericConstraint
 
 
+@lru_cache(maxsize=256)
+def parse_validators(validators: str) -> Tuple[Tuple[str, Optional[NumericConstraint]], ...]:
+    """
+    Parse a property's validators string into (validator, constraint) pairs.
+    Cached by the raw string, so each distinct validator list is parsed once rather than once per value.
+    """
+    return tuple(
+        (validator, NumericConstraint.parse(validator)) for validator in json.loads(validators.replace("'", '"'))
+    )
+
+
 class PropertyValidator:
     """
     Validates properties based on their type and associated constraints.
     """
 
     @classmethod
-    def validate_value(cls, value: Any, property: models.Property) -> None:
+    def validate_value(cls, value: Any, property: models.Property, check_numeric: bool = True) -> None:
         """
         Validate a string against a regex pattern and/or a list of choices.
+        Numeric range checks can be skipped when the value was already checked by validate_numeric_column.
         """
 
-        if property.value_type in ("int", "double"):
+        if check_numeric and property.value_type in ("int", "double"):
             cls.check_numeric_constraints(value, property)
 
         if property.value_type == "string":
@@ -35,9 +51,7 @@ class PropertyValidator:
         except (ValueError, TypeError):
             raise ValueError(f"Value '{value}' must be a {property.value_type}")
 
-        validators = json.loads(property.validators.replace("'", '"'))
-        for validator in validators:
-            constraint = NumericConstraint.parse(validator)
+        for validator, constraint in parse_validators(property.validators):
             if constraint:
                 if not constraint.is_satisfied_for(coerced_value):
                     raise ValueError(f"Value '{coerced_value}' does not satisfy the validator: {validator}")
@@ -59,6 +73,33 @@ class PropertyValidator:
         if property.max is not None and coerced_value > property.max:
             raise ValueError(f"Value {coerced_value} is greater than the maximum allowed {property.max}")
 
+    @classmethod
+    def validate_numeric_column(cls, values: List[Any], property: models.Property) -> np.ndarray:
+        """
+        Check a whole column of values against the min/max constraints in a single vectorized pass.
+        Returns a boolean mask that is True for values known to satisfy the constraints. Values that
+        cannot be parsed or are out of range are False and must go through check_numeric_constraints.
+        """
+
+        try:
+            arr = np.asarray(values, dtype=np.float64)
+        except (ValueError, TypeError):
+            arr = np.fromiter((cls._to_float(v) for v in values), dtype=np.float64, count=len(values))
+
+        mask = ~np.isnan(arr)
+        if property.min is not None:
+            mask &= arr >= property.min
+        if property.max is not None:
+            mask &= arr <= property.max
+        return mask
+
+    @staticmethod
+    def _to_float(value: Any) -> float:
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return np.nan
+
     @classmethod
     def check_string_constraints(cls, value: str, property: models.Property) -> None:
         """
@@ -17,9 +17,10 @@ class AssayResultsRegistrar(BaseRegistrar):
         db: Session,
         mapping: Optional[Dict[str, str]],
         error_handling: str = enums.ErrorHandlingOptions.reject_all,
+        parallel_workers: Optional[int] = None,
     ):
         self.entity_type = enums.EntityType.ASSAY_RESULT
-        super().__init__(db, mapping, error_handling)
+        super().__init__(db, mapping, error_handling, parallel_workers)
         self.assay_results_to_insert = []
         self.entity_type = enums.EntityType.ASSAY_RESULT
         self.batch_details_cache = {}
@@ -190,12 +191,15 @@ class AssayResultsRegistrar(BaseRegistrar):
         return sql_utils.generate_sql(assay_results_sql, details_sql)
 
     def _generate_assay_result_sql(self, assay_results) -> str:
-        cols = list(assay_results[0].keys())
-        values_sql = sql_utils.values_sql(assay_results, cols)
+        # Numbered by position so they are inserted, and get their ids, in input order
+        numbered = [{"rn": rn, **record} for rn, record in enumerate(assay_results, 1)]
+        cols = sql_utils.copy_to_temp_table(
+            self.db, "tmp_assay_results", numbered, models.AssayResult.__table__, key=sql_utils.ROW_NUMBER_KEY
+        )
         return f"""
             WITH inserted_assay_results AS (
                 INSERT INTO moltrack.assay_results ({", ".join(cols)})
-                VALUES {values_sql}
+                SELECT {", ".join(cols)} FROM tmp_assay_results ORDER BY rn
                 RETURNING id
             ),
             numbered_assay_results AS (
@@ -207,12 +211,18 @@ class AssayResultsRegistrar(BaseRegistrar):
         if not details:
             return ""
 
-        cols_without_key, values_sql = sql_utils.prepare_sql_parts(details)
+        cols_without_key = sql_utils.copy_to_temp_table(
+            self.db,
+            "tmp_assay_result_details",
+            details,
+            models.AssayResultDetail.__table__,
+            key=sql_utils.ROW_NUMBER_KEY,
+        )
         return f"""
             inserted_assay_result_details AS (
                 INSERT INTO moltrack.assay_result_details (assay_result_id, {", ".join(cols_without_key)})
                 SELECT nr.id, {", ".join([f"d.{col}" for col in cols_without_key])}
-                FROM (VALUES {values_sql}) AS d(rn, {", ".join(cols_without_key)})
+                FROM tmp_assay_result_details d
                 JOIN numbered_assay_results nr ON d.rn = nr.rn
             )"""
 
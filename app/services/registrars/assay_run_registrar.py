@@ -12,10 +12,14 @@ from app.utils.registrar_utils import get_details_for_entity
 
 class AssayRunRegistrar(BaseRegistrar):
     def __init__(
-        self, db: Session, mapping: Optional[str], error_handling: str = enums.ErrorHandlingOptions.reject_all
+        self,
+        db: Session,
+        mapping: Optional[str],
+        error_handling: str = enums.ErrorHandlingOptions.reject_all,
+        parallel_workers: Optional[int] = None,
     ):
         self.entity_type = enums.EntityType.ASSAY_RUN
-        super().__init__(db, mapping, error_handling)
+        super().__init__(db, mapping, error_handling, parallel_workers)
         self._assay_records_map = None
         self.assay_runs_to_insert = []
         self.entity_type = enums.EntityType.ASSAY_RUN
@@ -24,7 +28,9 @@ class AssayRunRegistrar(BaseRegistrar):
     @property
     def assay_records_map(self):
         if self._assay_records_map is None:
-            self._assay_records_map = self._load_reference_map(models.Assay, "name")
+            self._assay_records_map = self._load_reference_map(
+                models.Assay, "name", columns=(models.Assay.id, models.Assay.name)
+            )
         return self._assay_records_map
 
     def _build_assay_run_record(self, assay_data: Dict[str, Any], assay_details: Dict[str, Any]) -> Dict[str, Any]:
@@ -85,12 +91,15 @@ class AssayRunRegistrar(BaseRegistrar):
 
     # TODO: Think of a more robust key than row number for joining
     def _generate_assay_run_sql(self, assay_runs) -> str:
-        cols = list(assay_runs[0].keys())
-        values_sql = sql_utils.values_sql(assay_runs, cols)
+        # Numbered by position so they are inserted, and get their ids, in input order
+        numbered = [{"rn": rn, **record} for rn, record in enumerate(assay_runs, 1)]
+        cols = sql_utils.copy_to_temp_table(
+            self.db, "tmp_assay_runs", numbered, models.AssayRun.__table__, key=sql_utils.ROW_NUMBER_KEY
+        )
         return f"""
             WITH inserted_assay_runs AS (
                 INSERT INTO moltrack.assay_runs ({", ".join(cols)})
-                VALUES {values_sql}
+                SELECT {", ".join(cols)} FROM tmp_assay_runs ORDER BY rn
                 RETURNING id
             ),
             numbered_assay_runs AS (
@@ -102,12 +111,14 @@ class AssayRunRegistrar(BaseRegistrar):
         if not details:
             return ""
 
-        cols_without_key, values_sql = sql_utils.prepare_sql_parts(details)
+        cols_without_key = sql_utils.copy_to_temp_table(
+            self.db, "tmp_assay_run_details", details, models.AssayRunDetail.__table__, key=sql_utils.ROW_NUMBER_KEY
+        )
         return f"""
             inserted_assay_run_details AS (
                 INSERT INTO moltrack.assay_run_details (assay_run_id, {", ".join(cols_without_key)})
                 SELECT nr.id, {", ".join([f"d.{col}" for col in cols_without_key])}
-                FROM (VALUES {values_sql}) AS d(rn, {", ".join(cols_without_key)})
+                FROM tmp_assay_run_details d
                 JOIN numbered_assay_runs nr ON d.rn = nr.rn
             )"""
 
@@ -1,8 +1,16 @@
 import csv
 import io
+import itertools
 import json
+import os
+import sys
 from abc import ABC, abstractmethod
-from typing import Iterator, List, Dict, Any, Optional
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Deque, Iterator, List, Dict, Any, Optional, Tuple
 
 from sqlalchemy import select, text
 from fastapi import HTTPException
@@ -15,21 +23,80 @@ from app import models
 from rdkit import Chem
 
 
+@dataclass(slots=True, frozen=True)
+class PropertyRow:
+    """Lightweight, read-only view of the property columns used during registration."""
+
+    id: int
+    name: str
+    entity_type: enums.EntityType
+    value_type: enums.ValueType
+    input_type: Optional[str]
+    pattern: Optional[str]
+    min: Optional[float]
+    max: Optional[float]
+    choices: Optional[str]
+    validators: Optional[str]
+    nullable: bool
+
+
+PROPERTY_ROW_COLUMNS = tuple(getattr(models.Property, name) for name in PropertyRow.__slots__)
+
+_PREFIX_BASE = MappingProxyType(
+    {
+        enums.EntityType.COMPOUND: "compound_details",
+        enums.EntityType.BATCH: "batch_details",
+        enums.EntityType.ASSAY_RUN: "assay_run_details",
+        enums.EntityType.ASSAY_RESULT: "assay_result_details",
+    }
+)
+
+# Number of workers for the RDKit stages of file processing (threads for parsing, processes for compound
+# standardization and hashing); 1 keeps them serial
+REGISTRATION_PARALLEL_WORKERS = int(os.environ.get("REGISTRATION_PARALLEL_WORKERS", "1"))
+
+
+@lru_cache(maxsize=64)
+def _column_keys(model) -> tuple:
+    return tuple(c.key for c in model.__table__.columns)
+
+
+def _intern_key(key: Any) -> Any:
+    return sys.intern(key) if type(key) is str else key
+
+
+def _molblock_to_smiles(molfile_str: str) -> Optional[str]:
+    mol = Chem.MolFromMolBlock(molfile_str)
+    return Chem.MolToSmiles(mol) if mol is not None else None
+
+
 class BaseRegistrar(ABC):
-    def __init__(self, db, mapping: Optional[str], error_handling: str = enums.ErrorHandlingOptions.reject_all):
+    def __init__(
+        self,
+        db,
+        mapping: Optional[str],
+        error_handling: str = enums.ErrorHandlingOptions.reject_all,
+        parallel_workers: Optional[int] = None,
+    ):
         """
         Base class for processing and registering data to a database.
         :param db: SQLAlchemy database session.
         :param mapping: Optional JSON string defining field mappings.
         :param error_handling: Strategy for handling errors during processing.
+        :param parallel_workers: Workers for the RDKit stages (defaults to REGISTRATION_PARALLEL_WORKERS).
         """
         self.db = db
         self.error_handling = error_handling
+        self.parallel_workers = parallel_workers or REGISTRATION_PARALLEL_WORKERS
         self._property_records_map = None
+        self._property_entity_types = None
+        self._property_name_to_id = None
+        self._prop_by_name_entity = None
         self._addition_records_map = None
 
         self.property_service = property_service.PropertyService(self.property_records_map, db, self.entity_type.value)
         self.user_mapping = self._load_mapping(mapping)
+        self._mapping_layouts: Dict[Optional[str], Tuple[Dict[str, str], tuple]] = {}
         self.output_rows = []
 
         self.stop_registration = False
@@ -38,13 +105,44 @@ class BaseRegistrar(ABC):
     @property
     def property_records_map(self):
         if self._property_records_map is None:
-            self._property_records_map = self._load_reference_map(models.Property, "name", allow_list=True)
+            self._property_records_map = self._load_reference_map(
+                models.Property, "name", allow_list=True, columns=PROPERTY_ROW_COLUMNS, row_factory=PropertyRow
+            )
         return self._property_records_map
 
+    @property
+    def property_entity_types(self) -> Dict[str, frozenset]:
+        if self._property_entity_types is None:
+            self._property_entity_types = {
+                name: frozenset(r.entity_type for r in records) for name, records in self.property_records_map.items()
+            }
+        return self._property_entity_types
+
+    @property
+    def property_name_to_id(self) -> Dict[str, int]:
+        if self._property_name_to_id is None:
+            self._property_name_to_id = {
+                name: prop.id for name, props in self.property_records_map.items() for prop in props
+            }
+        return self._property_name_to_id
+
+    @property
+    def prop_by_name_entity(self) -> Dict[Tuple[str, Any], PropertyRow]:
+        if self._prop_by_name_entity is None:
+            index = {}
+            for name, props in self.property_records_map.items():
+                for prop in props:
+                    # Keep the first match, as the linear scan it replaces did
+                    index.setdefault((name, prop.entity_type), prop)
+            self._prop_by_name_entity = index
+        return self._prop_by_name_entity
+
     @property
     def addition_records_map(self):
         if self._addition_records_map is None:
-            self._addition_records_map = self._load_reference_map(models.Addition, "name")
+            self._addition_records_map = self._load_reference_map(
+                models.Addition, "name", columns=(models.Addition.id, models.Addition.name)
+            )
         return self._addition_records_map
 
     # === Input processing methods ===
@@ -74,15 +172,10 @@ class BaseRegistrar(ABC):
                 self.normalized_mapping[col] = assigned
 
         chunk = [first_row]
-
-        for row in reader:
-            chunk.append(row)
-            if len(chunk) >= chunk_size:
-                yield chunk
-                chunk = []
-
-        if chunk:
+        chunk.extend(itertools.islice(reader, chunk_size - 1))
+        while chunk:
             yield chunk
+            chunk = list(itertools.islice(reader, chunk_size))
 
     def process_sdf(self, file_stream: io.TextIOBase, chunk_size=5000) -> Iterator[List[Dict[str, Any]]]:
         chunk: List[Dict[str, Any]] = []
@@ -96,16 +189,9 @@ class BaseRegistrar(ABC):
 
             if line == "$$$$":
                 row = dict(current_props)
-                molfile_str = "\n".join(current_mol_lines)
-                row["original_molfile"] = molfile_str
-
-                # Get smiles
-                mol = Chem.MolFromMolBlock(molfile_str)
-                if mol is not None:
-                    smiles = Chem.MolToSmiles(mol)
-                else:
-                    smiles = None
-                row["smiles"] = smiles
+                row["original_molfile"] = "\n".join(current_mol_lines)
+                # Filled in for the whole chunk by _add_smiles
+                row["smiles"] = None
 
                 if not mapping_initialized:
                     if self.user_mapping:
@@ -117,7 +203,7 @@ class BaseRegistrar(ABC):
                 chunk.append(row)
 
                 if len(chunk) >= chunk_size:
-                    yield chunk
+                    yield self._add_smiles(chunk)
                     chunk = []
 
                 current_mol_lines = []
@@ -140,24 +226,28 @@ class BaseRegistrar(ABC):
             current_mol_lines.append(line)
 
         if chunk:
-            yield chunk
+            yield self._add_smiles(chunk)
 
         if not chunk and not current_mol_lines and not current_props:
             raise HTTPException(status_code=400, detail="SDF file is empty or invalid")
 
+    def _add_smiles(self, chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        molfiles = [row["original_molfile"] for row in chunk]
+        if self.parallel_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
+                smiles = list(executor.map(_molblock_to_smiles, molfiles))
+        else:
+            smiles = map(_molblock_to_smiles, molfiles)
+
+        for row, row_smiles in zip(chunk, smiles):
+            row["smiles"] = row_smiles
+        return chunk
+
     def _assign_column(self, col: str) -> str:
-        prefix_base = {
-            enums.EntityType.COMPOUND: "compound_details",
-            enums.EntityType.BATCH: "batch_details",
-            enums.EntityType.ASSAY_RUN: "assay_run_details",
-            enums.EntityType.ASSAY_RESULT: "assay_result_details",
-        }
-
-        records = self.property_records_map.get(col)
-        if records:
-            entity_types = {r.entity_type for r in records}
+        entity_types = self.property_entity_types.get(col)
+        if entity_types:
             prefix_key = self.entity_type if self.entity_type in entity_types else next(iter(entity_types), None)
-            prefix = prefix_base.get(prefix_key)
+            prefix = _PREFIX_BASE.get(prefix_key)
             return f"{prefix}.{col}" if prefix else col
 
         if col in self.addition_records_map:
@@ -165,33 +255,82 @@ class BaseRegistrar(ABC):
 
         return col
 
+    def _mapping_layout(self, entity_name: Optional[str]) -> Tuple[Tuple[str, str, str], ...]:
+        """
+        (source column, table, field) triples for the current mapping, split once rather than per row.
+        Recomputed whenever normalized_mapping is replaced.
+        """
+        cached = self._mapping_layouts.get(entity_name)
+        if cached is None or cached[0] is not self.normalized_mapping:
+            default_table = entity_name if entity_name else "compound"
+            layout = tuple(
+                (
+                    src_key,
+                    *map(sys.intern, mapped_key.split(".", 1) if "." in mapped_key else (default_table, mapped_key)),
+                )
+                for src_key, mapped_key in self.normalized_mapping.items()
+            )
+            cached = self._mapping_layouts[entity_name] = (self.normalized_mapping, layout)
+        return cached[1]
+
     def _group_data(self, row: Dict[str, Any], entity_name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         grouped = {}
-        for src_key, mapped_key in self.normalized_mapping.items():
-            value = row.get(src_key)
-            table, field = (
-                mapped_key.split(".", 1)
-                if "." in mapped_key
-                else (entity_name if entity_name else "compound", mapped_key)
-            )
-            grouped.setdefault(table, {})[field] = value
+        for src_key, table, field in self._mapping_layout(entity_name):
+            group = grouped.get(table)
+            if group is None:
+                group = grouped[table] = {}
+            group[field] = row.get(src_key)
         return grouped
 
     # === Reference loading methods ===
 
-    def _load_reference_map(self, model, key: str = "id", allow_list: bool = False):
-        result = self.db.execute(select(model)).scalars().all()
+    def _load_reference_map(
+        self, model, key: str = "id", allow_list: bool = False, columns=None, row_factory: Optional[Callable] = None
+    ):
+        """
+        Load a reference table into a dict keyed by `key`.
+        When `columns` is given, only those columns are selected and plain rows are returned instead of ORM
+        instances (optionally converted with `row_factory`), which avoids ORM hydration for large tables.
+        """
+        if columns is None:
+            result = self.db.execute(select(model)).scalars().all()
+        else:
+            result = self.db.execute(select(*columns)).all()
+            if row_factory is not None:
+                result = [row_factory(*row) for row in result]
+
         if allow_list:
-            reference_map = {}
+            reference_map = defaultdict(list)
             for row in result:
-                k = getattr(row, key)
-                reference_map.setdefault(k, []).append(row)
-            return reference_map
+                reference_map[_intern_key(getattr(row, key))].append(row)
+            return dict(reference_map)
         else:
-            return {getattr(row, key): row for row in result}
+            return {_intern_key(getattr(row, key)): row for row in result}
+
+    def _bulk_nextval(self, counts: Dict[str, int]) -> Dict[str, Deque[int]]:
+        """
+        Fetch counts[sequence] values of every sequence with a single statement,
+        instead of one nextval round-trip per row and sequence.
+        """
+        pools = {sequence: deque() for sequence in counts}
+        n = max(counts.values(), default=0)
+        if n <= 0:
+            return pools
+
+        sequences = list(counts)
+        # CASE only evaluates nextval for the rows it is needed in, so no sequence value is consumed beyond its count
+        columns = ", ".join(
+            f"CASE WHEN g <= :n{i} THEN nextval('{sequence}') END" for i, sequence in enumerate(sequences)
+        )
+        params = {f"n{i}": counts[sequence] for i, sequence in enumerate(sequences)}
+        rows = self.db.execute(text(f"SELECT {columns} FROM generate_series(1, :n) g"), {"n": n, **params}).all()
+        for sequence, ids in zip(sequences, zip(*rows)):
+            pools[sequence].extend(value for value in ids if value is not None)
+        return pools
 
     def model_to_dict(self, obj):
-        return {c.key: getattr(obj, c.key) for c in obj.__table__.columns}
+        get = obj.__getattribute__
+        return {key: get(key) for key in _column_keys(type(obj))}
 
     # === SQL construction and registration methods ===
 
@@ -204,23 +343,40 @@ class BaseRegistrar(ABC):
         pass
 
     def register_all(self, rows: List[Dict[str, Any]]):
-        batch_sql = self.build_sql(rows)
-
-        if batch_sql:
-            try:
-                self.db.execute(text(batch_sql))
+        try:
+            # build_sql may already stage row data in temporary tables, so it runs inside the same transaction
+            batch_sql = self.build_sql(rows)
+            if batch_sql:
+                # The statement is fully rendered (no bind parameters), so send it straight to the driver
+                # instead of having text() scan it for bind parameters.
+                self.db.connection().exec_driver_sql(batch_sql, execution_options={"no_parameters": True})
                 self.db.commit()
-            except Exception as e:
-                logger.error(f"An exception occurred: {e}")
-                self.db.rollback()
+        except Exception as e:
+            logger.error(f"An exception occurred: {e}")
+            self.db.rollback()
+            self._fail_chunk(rows, e)
 
-    def _process_row(self, row: Dict[str, Any], process_func):
+    def _fail_chunk(self, rows: List[Dict[str, Any]], exception: Exception):
+        """
+        Report every row of a rolled back chunk as failed: rows already marked "success" were not registered,
+        and rows that build_sql never reached would otherwise be missing from the output.
+        """
+        error_msg = f"Chunk was not registered: {exception}"
+        reported = {id(row) for row in self.output_rows}
+        for row in rows:
+            if id(row) not in reported or row["registration_status"] == "success":
+                row["registration_status"] = "failed"
+                row["registration_error_message"] = error_msg
+        # Output rows are the input row dicts, so this keeps them in input order
+        self.output_rows[:] = rows
+
+    def _process_row(self, row: Dict[str, Any], process_func, *args):
         if self.stop_registration:
             self._add_output_row(row, "not_processed")
             return
 
         try:
-            process_func(row)
+            process_func(row, *args)
             self._add_output_row(row, "success")
         except Exception as e:
             self.handle_row_error(row, e)
@@ -239,7 +395,11 @@ class BaseRegistrar(ABC):
         self.cleanup_chunk()
         self.user_mapping.clear()
         self.normalized_mapping.clear()
+        self._mapping_layouts.clear()
         self._property_records_map = None
+        self._property_entity_types = None
+        self._property_name_to_id = None
+        self._prop_by_name_entity = None
         self._addition_records_map = None
         self.property_service = None
 
@@ -2,22 +2,60 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from fastapi import HTTPException
 from pytest import Session
-from app.services.registrars.compound_registrar import CompoundRegistrar
+from app.services.registrars.compound_registrar import MOLREGNO_SEQ, CompoundRegistrar
 from app.utils.admin_utils import admin
 from app import models
 from app.utils import enums, sql_utils
-from sqlalchemy.sql import text
+
+BATCH_REGNO_SEQ = "moltrack.batch_regno_seq"
+
+# Addition values treated as "not given" in the batch_additions columns
+_EMPTY_ADDITION_VALUES = frozenset({"", "none", None})
+
+# CTE templates; only the column lists vary between chunks
+_INSERTED_BATCHES_CTE = """
+            inserted_batches AS (
+                INSERT INTO moltrack.batches (compound_id, {columns})
+                SELECT ic.id, {select_columns}
+                FROM tmp_batches b
+                JOIN available_compounds ic ON b.molregno = ic.molregno
+                ON CONFLICT (batch_regno) DO NOTHING
+                RETURNING id, batch_regno
+            )"""
+
+_INSERTED_BATCH_DETAILS_CTE = """,
+            inserted_batch_details AS (
+                INSERT INTO moltrack.batch_details (batch_id, {columns})
+                SELECT ib.id, {select_columns}
+                FROM tmp_batch_details bd
+                JOIN inserted_batches ib ON bd.batch_regno = ib.batch_regno
+            )"""
+
+_INSERTED_BATCH_ADDITIONS_CTE = """,
+            inserted_batch_additions AS (
+                INSERT INTO moltrack.batch_additions (batch_id, {columns})
+                SELECT ib.id, {select_columns}
+                FROM tmp_batch_additions ba
+                JOIN inserted_batches ib ON ba.batch_regno = ib.batch_regno
+            )"""
 
 
 class BatchRegistrar(CompoundRegistrar):
     def __init__(
-        self, db: Session, mapping: Optional[str], error_handling: str = enums.ErrorHandlingOptions.reject_all
+        self,
+        db: Session,
+        mapping: Optional[str],
+        error_handling: str = enums.ErrorHandlingOptions.reject_all,
+        parallel_workers: Optional[int] = None,
     ):
         self.entity_type = enums.EntityType.BATCH
-        super().__init__(db, mapping, error_handling)
+        super().__init__(db, mapping, error_handling, parallel_workers)
         self._additions_map = None
+        self._additions_id_map = None
 
         self.batches_to_insert = []
+        # Number of filled slots in batches_to_insert, which build_sql pre-sizes to one slot per row
+        self._batch_count = 0
         self.batch_details = []
         self.batch_additions = []
 
@@ -26,45 +64,74 @@ class BatchRegistrar(CompoundRegistrar):
     @property
     def additions_map(self):
         if self._additions_map is None:
-            self._additions_map = self._load_reference_map(models.Addition, "name")
+            self._additions_map = self._load_reference_map(
+                models.Addition, "name", columns=(models.Addition.id, models.Addition.name)
+            )
         return self._additions_map
 
+    @property
+    def additions_id_map(self) -> Dict[str, int]:
+        if self._additions_id_map is None:
+            self._additions_id_map = {name: addition.id for name, addition in self.additions_map.items()}
+        return self._additions_id_map
+
     def _next_batch_regno(self) -> int:
-        return self.db.execute(text("SELECT nextval('moltrack.batch_regno_seq');")).scalar()
+        return self._next_id(BATCH_REGNO_SEQ)
 
     def check_existing_compound(self, hash_mol: str, new_details: dict):
         return self._check_existing_compound(hash_mol, new_details, True)
 
+    def _chunk_id_counts(
+        self, grouped_rows: List[Dict[str, Any]], chunk_mol_fields: List[Optional[Dict[str, Any]]]
+    ) -> Dict[str, int]:
+        # One batch per new compound, plus one per row matching an existing compound with the same details
+        new_hashes = self._new_compound_hashes(chunk_mol_fields)
+        n_batches = len(new_hashes)
+        for grouped, fields in zip(grouped_rows, chunk_mol_fields):
+            existing = self._existing_compounds.get(fields["hash_mol"]) if fields and "hash_mol" in fields else None
+            if existing and self._compare_compound_details(existing.details, grouped.get("compound_details", {})):
+                n_batches += 1
+        return {MOLREGNO_SEQ: len(new_hashes), BATCH_REGNO_SEQ: n_batches}
+
     def _build_batch_record(self, inchikey: str) -> Dict[str, Any]:
+        uid = admin.admin_user_id
         return {
             "inchikey": inchikey,
             "notes": None,
-            "created_by": admin.admin_user_id,
-            "updated_by": admin.admin_user_id,
-            "created_at": datetime.now(),
+            "created_by": uid,
+            "updated_by": uid,
+            "created_at": self.chunk_now or datetime.now(),
             "batch_regno": self._next_batch_regno(),
         }
 
     def _build_batch_addition_record(self, batch_additions: Dict[str, Any], batch_regno: int) -> List[Dict[str, Any]]:
         records = []
+        additions_id_map = self.additions_id_map
+        uid = admin.admin_user_id
         for name, value in batch_additions.items():
-            if value in ("", "none", None):
+            if value in _EMPTY_ADDITION_VALUES:
                 continue
 
-            addition = self.additions_map.get(name)
-            if addition is None:
+            addition_id = additions_id_map.get(name)
+            if addition_id is None:
                 raise HTTPException(status_code=400, detail=f"Unknown addition: {name}")
             records.append(
                 {
                     "batch_regno": batch_regno,
-                    "addition_id": getattr(addition, "id"),
+                    "addition_id": addition_id,
                     "addition_equivalent": float(value),
-                    "created_by": admin.admin_user_id,
-                    "updated_by": admin.admin_user_id,
+                    "created_by": uid,
+                    "updated_by": uid,
                 }
             )
         return records
 
+    def build_sql(self, rows: List[Dict[str, Any]]) -> str:
+        # At most one batch per row, so allocate the slots once instead of growing the list row by row
+        self.batches_to_insert = [None] * len(rows)
+        self._batch_count = 0
+        return super().build_sql(rows)
+
     def get_additional_records(self, row, grouped, molregno, compound_details):
         batch_record = self._build_batch_record(molregno)
         batch_regno = batch_record["batch_regno"]
@@ -80,59 +147,72 @@ class BatchRegistrar(CompoundRegistrar):
         )
         additions = self._build_batch_addition_record(grouped.get("batch_additions", {}), batch_regno)
 
-        self.batches_to_insert.append(batch_record)
+        self.batches_to_insert[self._batch_count] = batch_record
+        self._batch_count += 1
         self.batch_details.extend(inserted)
         self.batch_additions.extend(additions)
 
     def get_additional_cte(self):
+        # Drop the slots of rows that failed or were not processed
+        del self.batches_to_insert[self._batch_count :]
         if not self.batches_to_insert:
             return ""
         return self._build_batch_ctes(self.batches_to_insert, self.batch_details, self.batch_additions)
 
     def _build_batch_ctes(self, batches, details, additions) -> str:
-        batch_cte = self._build_inserted_batches_cte(batches)
-        if details:
-            batch_cte += self._build_batch_details_cte(details)
-        if additions:
-            batch_cte += self._build_batch_additions_cte(additions)
-
-        return batch_cte
+        if not batches:
+            # Details and additions join on inserted_batches, so there is nothing to insert without batches
+            return ""
+        return "".join(
+            (
+                self._build_inserted_batches_cte(batches),
+                self._build_batch_details_cte(details),
+                self._build_batch_additions_cte(additions),
+            )
+        )
 
     def _build_inserted_batches_cte(self, batches) -> str:
-        cols_without_key, values_sql = sql_utils.prepare_sql_parts(batches)
-        return f"""
-            inserted_batches AS (
-                INSERT INTO moltrack.batches (compound_id, {", ".join(cols_without_key)})
-                SELECT ic.id, {", ".join([f"b.{col}" for col in cols_without_key])}
-                FROM (VALUES {values_sql}) AS b (molregno, {", ".join(cols_without_key)})
-                JOIN available_compounds ic ON b.molregno = ic.molregno
-                ON CONFLICT (batch_regno) DO NOTHING
-                RETURNING id, batch_regno
-            )"""
+        if not batches:
+            return ""
+        cols_without_key = sql_utils.copy_to_temp_table(
+            self.db, "tmp_batches", batches, models.Batch.__table__, key=models.Compound.__table__.c.molregno
+        )
+        return _INSERTED_BATCHES_CTE.format(
+            columns=", ".join(cols_without_key), select_columns=", ".join([f"b.{col}" for col in cols_without_key])
+        )
 
     def _build_batch_details_cte(self, details) -> str:
-        cols_without_key, values_sql = sql_utils.prepare_sql_parts(details)
-        return f""",
-            inserted_batch_details AS (
-                INSERT INTO moltrack.batch_details (batch_id, {", ".join(cols_without_key)})
-                SELECT ib.id, {", ".join([f"bd.{col}" for col in cols_without_key])}
-                FROM (VALUES {values_sql}) AS bd(batch_regno, {", ".join(cols_without_key)})
-                JOIN inserted_batches ib ON bd.batch_regno = ib.batch_regno
-            )"""
+        if not details:
+            return ""
+        cols_without_key = sql_utils.copy_to_temp_table(
+            self.db,
+            "tmp_batch_details",
+            details,
+            models.BatchDetail.__table__,
+            key=models.Batch.__table__.c.batch_regno,
+        )
+        return _INSERTED_BATCH_DETAILS_CTE.format(
+            columns=", ".join(cols_without_key), select_columns=", ".join([f"bd.{col}" for col in cols_without_key])
+        )
 
     def _build_batch_additions_cte(self, additions) -> str:
-        cols_without_key, values_sql = sql_utils.prepare_sql_parts(additions)
-        return f""",
-            inserted_batch_additions AS (
-                INSERT INTO moltrack.batch_additions (batch_id, {", ".join(cols_without_key)})
-                SELECT ib.id, {", ".join([f"ba.{col}" for col in cols_without_key])}
-                FROM (VALUES {values_sql}) AS ba(batch_regno, {", ".join(cols_without_key)})
-                JOIN inserted_batches ib ON ba.batch_regno = ib.batch_regno
-            )"""
+        if not additions:
+            return ""
+        cols_without_key = sql_utils.copy_to_temp_table(
+            self.db,
+            "tmp_batch_additions",
+            additions,
+            models.BatchAddition.__table__,
+            key=models.Batch.__table__.c.batch_regno,
+        )
+        return _INSERTED_BATCH_ADDITIONS_CTE.format(
+            columns=", ".join(cols_without_key), select_columns=", ".join([f"ba.{col}" for col in cols_without_key])
+        )
 
     def cleanup_chunk(self):
         super().cleanup_chunk()
         self.batches_to_insert.clear()
+        self._batch_count = 0
         self.batch_details.clear()
         self.batch_additions.clear()
 
@@ -140,3 +220,4 @@ class BatchRegistrar(CompoundRegistrar):
         super().cleanup()
         self.cleanup_chunk()
         self._additions_map = None
+        self._additions_id_map = None
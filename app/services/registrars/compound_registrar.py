@@ -1,8 +1,16 @@
+import multiprocessing
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import repeat
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import text
 from rdkit import Chem
 from rdkit.Chem import rdMolDescriptors
 
@@ -12,57 +20,151 @@ from app import models
 from app.utils import enums, sql_utils, chemistry_utils
 from app.utils.logging_utils import logger
 from app.services.registrars.base_registrar import BaseRegistrar
-from sqlalchemy.sql import text
+
+MOLREGNO_SEQ = "moltrack.molregno_seq"
+
+# Every compound column, so a matched compound is returned without loading it again
+_COMPOUND_COLUMNS = tuple(models.Compound.__table__.columns)
+
+# Existing compounds and their details for a set of hashes, in one round trip.
+# A Python list binds as text[]; cast it to bpchar[] to match hash_mol (CHAR(40)), otherwise the column is
+# coerced to text and its unique index cannot be used.
+_EXISTING_COMPOUNDS_SQL = text(
+    f"""
+    SELECT {", ".join(f"c.{column.name}" for column in _COMPOUND_COLUMNS)},
+        cd.property_id, cd.value_string, cd.value_num, cd.value_datetime, cd.value_uuid
+    FROM moltrack.compounds c
+    LEFT JOIN moltrack.compound_details cd ON cd.compound_id = c.id
+    WHERE c.hash_mol = ANY(CAST(:hashes AS bpchar[]))
+    """
+)
+
+# Static: the staged hashes are read back from tmp_compounds, so nothing in it depends on the chunk
+_AVAILABLE_COMPOUNDS_CTE = """
+            available_compounds AS (
+                SELECT id, molregno, hash_mol FROM inserted_compounds
+                UNION
+                SELECT id, molregno, hash_mol FROM moltrack.compounds
+                WHERE hash_mol = ANY(ARRAY(SELECT hash_mol FROM tmp_compounds))
+            )
+        """
+
+# RDKit worker processes shared by every registrar of this server process, see get_mol_pool
+_mol_pool: Optional[ProcessPoolExecutor] = None
+_mol_pool_lock = threading.Lock()
+
+
+def get_mol_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool for the RDKit stage of compound registration.
+    Started on first use with `max_workers` processes and reused by later registrations, so an upload does not
+    pay for starting fresh interpreters; the app shuts it down with shutdown_mol_pool.
+    """
+    global _mol_pool
+    with _mol_pool_lock:
+        if _mol_pool is None:
+            # Spawned rather than forked: forking the server process would copy its threads, locks and
+            # open database connections into the workers
+            _mol_pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+        return _mol_pool
+
+
+def shutdown_mol_pool():
+    global _mol_pool
+    with _mol_pool_lock:
+        pool, _mol_pool = _mol_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def _mol_error(exc: Exception) -> Tuple[Optional[int], str]:
+    # HTTPException does not survive pickling, so errors cross the process boundary as (status_code, detail)
+    if isinstance(exc, HTTPException):
+        return exc.status_code, exc.detail
+    return None, str(exc)
+
+
+def _raise_mol_error(error: Optional[Tuple[Optional[int], str]]):
+    if error is None:
+        return
+    status_code, detail = error
+    if status_code is None:
+        raise ValueError(detail)
+    raise HTTPException(status_code=status_code, detail=detail)
+
+
+def _compute_mol_fields(smiles: str, matching_setting: HashScheme, config: dict) -> Dict[str, Any]:
+    """
+    Run the RDKit stage of compound registration for one SMILES and return plain, picklable values.
+
+    Parsing errors are returned under "error" and InChI errors under "inchi_error", so the caller can raise
+    them in the same order as before: a duplicate compound is reported before a failing InChI.
+    """
+    try:
+        mol = chemistry_utils.validate_rdkit_call(
+            Chem.MolFromSmiles, smiles, err_msg_prefix=f"Invalid SMILES '{smiles}':"
+        )
+        standardized_mol = chemistry_utils.standardize_mol(mol, config=config)
+        mol_layers = chemistry_utils.generate_hash_layers(standardized_mol)
+        fields = {
+            "hash_mol": GetMolHash(mol_layers, matching_setting),
+            "canonical_smiles": mol_layers[HashLayer.CANONICAL_SMILES],
+            "hash_canonical_smiles": chemistry_utils.generate_uuid_from_string(mol_layers[HashLayer.CANONICAL_SMILES]),
+            "hash_tautomer": chemistry_utils.generate_uuid_from_string(mol_layers[HashLayer.TAUTOMER_HASH]),
+            "hash_no_stereo_smiles": chemistry_utils.generate_uuid_from_string(mol_layers[HashLayer.NO_STEREO_SMILES]),
+            "hash_no_stereo_tautomer": chemistry_utils.generate_uuid_from_string(
+                mol_layers[HashLayer.NO_STEREO_TAUTOMER_HASH]
+            ),
+        }
+    except Exception as e:
+        return {"error": _mol_error(e)}
+
+    try:
+        inchi = chemistry_utils.validate_rdkit_call(Chem.MolToInchi, mol, err_msg_prefix="Failed to generate InChI:")
+        fields["inchikey"] = chemistry_utils.validate_rdkit_call(
+            Chem.InchiToInchiKey, inchi, err_msg_prefix="Failed to generate InChIKey:"
+        )
+        fields["inchi"] = inchi
+        fields["formula"] = rdMolDescriptors.CalcMolFormula(mol)
+    except Exception as e:
+        fields["inchi_error"] = _mol_error(e)
+    return fields
+
+
+@dataclass(slots=True)
+class ExistingCompound:
+    # Column values of the compound, without its id
+    record: Dict[str, Any]
+    # property_id -> value
+    details: Dict[int, Any]
 
 
 class CompoundRegistrar(BaseRegistrar):
     def __init__(
-        self, db: Session, mapping: Optional[str], error_handling: str = enums.ErrorHandlingOptions.reject_all
+        self,
+        db: Session,
+        mapping: Optional[str],
+        error_handling: str = enums.ErrorHandlingOptions.reject_all,
+        parallel_workers: Optional[int] = None,
     ):
         if not hasattr(self, "entity_type"):
             self.entity_type = enums.EntityType.COMPOUND
-        super().__init__(db, mapping, error_handling)
-        self._compound_records_map = None
-        self._compound_details_map = None
-        # Precomputed map: compound_id -> property_id -> value
-        self._compound_details_by_compound_cache: Optional[Dict[int, Dict[int, Any]]] = None
+        super().__init__(db, mapping, error_handling, parallel_workers)
+        # Already registered compounds for the hashes of the current chunk; None marks a hash known to be new
+        self._existing_compounds: Dict[str, Optional[ExistingCompound]] = {}
 
         self.compounds_to_insert: Dict[str, Dict[str, Any]] = {}
+        self._id_pools: Dict[str, Deque[int]] = {}
+        # Timestamp shared by every record of the chunk being built, set at the top of build_sql
+        self.chunk_now: Optional[datetime] = None
+        # RDKit-derived primitives per (smiles, matching_setting) for the current chunk; never holds Mol objects
+        self._mol_fields_cache: Dict[Tuple[str, HashScheme], Dict[str, Any]] = {}
+        # Read once per registration, so an updated rule applies to the next upload in every worker process
         self.matching_setting = self._load_matching_setting()
         self.normalized_mapping = {}
 
         self.entity_type = enums.EntityType.COMPOUND
 
-    @property
-    def compound_records_map(self) -> Dict[str, models.Compound]:
-        if self._compound_records_map is None:
-            self._compound_records_map = self._load_reference_map(models.Compound, "hash_mol")
-        return self._compound_records_map
-
-    @property
-    def compound_details_map(self) -> Dict[int, models.CompoundDetail]:
-        if self._compound_details_map is None:
-            self._compound_details_map = self._load_reference_map(models.CompoundDetail, "id")
-        return self._compound_details_map
-
-    @property
-    def compound_details_by_compound_cache(self) -> Dict[int, Dict[int, Any]]:
-        if self._compound_details_by_compound_cache is None:
-            cache: Dict[int, Dict[int, Any]] = {}
-            for detail in self.compound_details_map.values():
-                cid = detail.compound_id
-                if cid not in cache:
-                    cache[cid] = {}
-                cache[cid][detail.property_id] = (
-                    detail.value_string or detail.value_num or detail.value_datetime or detail.value_uuid
-                )
-            self._compound_details_by_compound_cache = cache
-        return self._compound_details_by_compound_cache
-
-    def _next_molregno(self) -> int:
-        molregno = self.db.execute(text("SELECT nextval('moltrack.molregno_seq')")).scalar()
-        return molregno
-
     def _load_matching_setting(self) -> HashScheme:
         try:
             setting = self.db.execute(
@@ -75,67 +177,165 @@ class CompoundRegistrar(BaseRegistrar):
             logger.error(f"Error loading compound matching setting: {e}")
             return HashScheme.ALL_LAYERS
 
-    def _build_compound_record(self, compound_data: Dict[str, Any], new_details: dict) -> Dict[str, Any]:
+    def _prefetch_existing_compounds(self, hashes: List[str]):
+        """Load the existing compounds (with their details) matching `hashes` in a single query."""
+        pending = [hash_mol for hash_mol in dict.fromkeys(hashes) if hash_mol not in self._existing_compounds]
+        if not pending:
+            return
+
+        existing = self._existing_compounds
+        for hash_mol in pending:
+            existing[hash_mol] = None
+        rows = self.db.execute(_EXISTING_COMPOUNDS_SQL, {"hashes": pending}).all()
+        n_columns = len(_COMPOUND_COLUMNS)
+        for row in rows:
+            record = {column.key: value for column, value in zip(_COMPOUND_COLUMNS, row)}
+            property_id, value_string, value_num, value_datetime, value_uuid = row[n_columns:]
+            hash_mol = record["hash_mol"]
+            compound = existing.get(hash_mol)
+            if compound is None:
+                record.pop("id")
+                compound = existing[sys.intern(hash_mol)] = ExistingCompound(record, {})
+            if property_id is not None:
+                compound.details[property_id] = value_string or value_num or value_datetime or value_uuid
+
+    def _get_existing_compound(self, hash_mol: str) -> Optional[ExistingCompound]:
+        if hash_mol not in self._existing_compounds:
+            self._prefetch_existing_compounds([hash_mol])
+        return self._existing_compounds[hash_mol]
+
+    def reserve_chunk_ids(self, counts: Dict[str, int]):
+        self._id_pools = self._bulk_nextval(counts)
+
+    def _new_compound_hashes(self, chunk_mol_fields: List[Optional[Dict[str, Any]]]) -> set:
+        """Distinct hashes of the chunk that will be inserted as new compounds; needs the prefetch to have run."""
+        return {
+            fields["hash_mol"]
+            for fields in chunk_mol_fields
+            if fields is not None
+            and "hash_mol" in fields
+            and "inchi_error" not in fields
+            and self._existing_compounds.get(fields["hash_mol"]) is None
+        }
+
+    def _chunk_id_counts(
+        self, grouped_rows: List[Dict[str, Any]], chunk_mol_fields: List[Optional[Dict[str, Any]]]
+    ) -> Dict[str, int]:
+        """
+        Number of sequence values to reserve for the chunk: one molregno per new compound.
+        Existing compounds, repeated SMILES and rows failing in RDKit take none, so they leave no gaps.
+        Rows that still fail later only return their value unused; _next_id falls back to nextval if the pool runs out.
+        """
+        return {MOLREGNO_SEQ: len(self._new_compound_hashes(chunk_mol_fields))}
+
+    def _next_id(self, sequence: str) -> int:
+        pool = self._id_pools.get(sequence)
+        if pool:
+            return pool.popleft()
+        return self.db.execute(text(f"SELECT nextval('{sequence}')")).scalar()
+
+    def _next_molregno(self) -> int:
+        return self._next_id(MOLREGNO_SEQ)
+
+    def _compute_chunk_mol_fields(self, grouped_rows: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Run the RDKit stage for the whole chunk up front, in a process pool when parallel_workers > 1.
+        Returns None per row when it should be computed in-process by _build_compound_record instead.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(grouped_rows)
+        indexed_smiles = [
+            (idx, smiles)
+            for idx, grouped in enumerate(grouped_rows)
+            if (smiles := grouped.get("compound", {}).get("smiles"))
+        ]
+        if not indexed_smiles:
+            return results
+
+        try:
+            config = chemistry_utils.get_molecule_standardization_config(self.db).config
+        except Exception as e:
+            # Leave it to the per-row path, which reports the missing config against each row
+            logger.error(f"Error loading molecule standardization config: {e}")
+            return results
+
+        # Duplicate SMILES within the chunk are computed only once
+        pending = list(
+            dict.fromkeys(
+                smiles for _, smiles in indexed_smiles if (smiles, self.matching_setting) not in self._mol_fields_cache
+            )
+        )
+        if self.parallel_workers > 1 and len(pending) > 1:
+            chunksize = max(1, len(pending) // (self.parallel_workers * 4))
+            # The config travels with the tasks, as the shared workers outlive any one registration
+            computed = get_mol_pool(self.parallel_workers).map(
+                _compute_mol_fields, pending, repeat(self.matching_setting), repeat(config), chunksize=chunksize
+            )
+        else:
+            computed = (_compute_mol_fields(smiles, self.matching_setting, config) for smiles in pending)
+
+        try:
+            for smiles, fields in zip(pending, computed):
+                self._mol_fields_cache[(smiles, self.matching_setting)] = fields
+        except BrokenProcessPool:
+            # A worker died; drop the pool so that the next registration starts a fresh one
+            shutdown_mol_pool()
+            raise
+        for idx, smiles in indexed_smiles:
+            results[idx] = self._mol_fields_cache[(smiles, self.matching_setting)]
+        return results
+
+    def _build_compound_record(
+        self, compound_data: Dict[str, Any], new_details: dict, mol_fields: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         smiles = compound_data.get("smiles")
         if not smiles:
             raise HTTPException(status_code=400, detail="SMILES value is required for compound creation.")
 
-        mol = chemistry_utils.validate_rdkit_call(
-            Chem.MolFromSmiles, smiles, err_msg_prefix=f"Invalid SMILES '{smiles}':"
-        )
-        standardized_mol = chemistry_utils.standardize_mol(mol, self.db)
-        mol_layers = chemistry_utils.generate_hash_layers(standardized_mol)
-        hash_mol = GetMolHash(mol_layers, self.matching_setting)
+        if mol_fields is None:
+            mol_fields = self._mol_fields_cache.get((smiles, self.matching_setting))
+        if mol_fields is None:
+            config = chemistry_utils.get_molecule_standardization_config(self.db).config
+            mol_fields = _compute_mol_fields(smiles, self.matching_setting, config)
+            self._mol_fields_cache[(smiles, self.matching_setting)] = mol_fields
+        _raise_mol_error(mol_fields.get("error"))
+
+        # Interned: the same hash is used as a key in several per-chunk dicts
+        hash_mol = sys.intern(mol_fields["hash_mol"])
 
         existing_compound = self.check_existing_compound(hash_mol, new_details)
         if existing_compound:
-            compound_dict = self.model_to_dict(existing_compound)
-            compound_dict.pop("id", None)
-            return compound_dict
-
-        now = datetime.now()
+            return dict(existing_compound.record)
 
-        inchi = chemistry_utils.validate_rdkit_call(Chem.MolToInchi, mol, err_msg_prefix="Failed to generate InChI:")
-        inchikey = chemistry_utils.validate_rdkit_call(
-            Chem.InchiToInchiKey, inchi, err_msg_prefix="Failed to generate InChIKey:"
-        )
-        canonical_smiles = mol_layers[HashLayer.CANONICAL_SMILES]
-        hash_canonical_smiles = chemistry_utils.generate_uuid_from_string(mol_layers[HashLayer.CANONICAL_SMILES])
-        hash_tautomer = chemistry_utils.generate_uuid_from_string(mol_layers[HashLayer.TAUTOMER_HASH])
-        hash_no_stereo_smiles = chemistry_utils.generate_uuid_from_string(mol_layers[HashLayer.NO_STEREO_SMILES])
-        hash_no_stereo_tautomer = chemistry_utils.generate_uuid_from_string(
-            mol_layers[HashLayer.NO_STEREO_TAUTOMER_HASH]
-        )
+        _raise_mol_error(mol_fields.get("inchi_error"))
+        now = self.chunk_now or datetime.now()
+        uid = admin.admin_user_id
 
         compound = {
-            "canonical_smiles": canonical_smiles,
-            "inchi": inchi,
-            "inchikey": inchikey,
+            "canonical_smiles": mol_fields["canonical_smiles"],
+            "inchi": mol_fields["inchi"],
+            "inchikey": mol_fields["inchikey"],
             "original_molfile": compound_data.get("original_molfile", ""),
             "molregno": self._next_molregno(),
-            "formula": rdMolDescriptors.CalcMolFormula(mol),
+            "formula": mol_fields["formula"],
             "hash_mol": hash_mol,
-            "hash_tautomer": hash_tautomer,
-            "hash_canonical_smiles": hash_canonical_smiles,
-            "hash_no_stereo_smiles": hash_no_stereo_smiles,
-            "hash_no_stereo_tautomer": hash_no_stereo_tautomer,
+            "hash_tautomer": mol_fields["hash_tautomer"],
+            "hash_canonical_smiles": mol_fields["hash_canonical_smiles"],
+            "hash_no_stereo_smiles": mol_fields["hash_no_stereo_smiles"],
+            "hash_no_stereo_tautomer": mol_fields["hash_no_stereo_tautomer"],
             "created_at": now,
             "updated_at": now,
-            "created_by": admin.admin_user_id,
-            "updated_by": admin.admin_user_id,
+            "created_by": uid,
+            "updated_by": uid,
             "is_archived": compound_data.get("is_archived", False),
         }
 
-        del mol
-        del standardized_mol
-
         return compound
 
     def _check_existing_compound(self, hash_mol: str, new_details: dict, return_existing_if_details_match: bool):
-        existing_compound = self.compound_records_map.get(hash_mol)
+        existing_compound = self._get_existing_compound(hash_mol)
         if existing_compound:
             if return_existing_if_details_match:
-                if self._compare_compound_details(existing_compound.id, new_details):
+                if self._compare_compound_details(existing_compound.details, new_details):
                     return existing_compound
                 raise HTTPException(
                     status_code=400, detail=f"Compound with hash {hash_mol} already exists with different details."
@@ -153,54 +353,57 @@ class CompoundRegistrar(BaseRegistrar):
     def check_existing_compound(self, hash_mol: str, new_details: dict):
         return self._check_existing_compound(hash_mol, new_details, False)
 
-    def _compare_compound_details(self, compound_id: int, new_details: dict) -> bool:
-        existing_details = self.compound_details_by_compound_cache.get(compound_id, {})
-        property_name_to_id = {
-            name: prop.id
-            for name, props in self.property_records_map.items()
-            for prop in (props if isinstance(props, list) else [props])
-        }
-
+    def _compare_compound_details(self, existing_details: Dict[int, Any], new_details: dict) -> bool:
         for property_name, new_value in new_details.items():
-            prop_id = property_name_to_id.get(property_name)
+            prop_id = self.property_name_to_id.get(property_name)
             if prop_id is None:
                 return False
             if existing_details.get(prop_id) != new_value:
                 return False
         return True
 
-    def build_sql(self, rows: List[Dict[str, Any]]) -> str:
-        self.compounds_to_insert = {}
-        details_to_insert = []
-
-        for idx, row in enumerate(rows):
-
-            def process_row(row):
-                grouped = self._group_data(row)
-                compound_data = grouped.get("compound", {})
-                compound_details_data = grouped.get("compound_details", {})
+    def _process_one_row(self, row, grouped, prevalidated, mol_fields, details_to_insert):
+        compound_data = grouped.get("compound", {})
+        compound_details_data = grouped.get("compound_details", {})
+
+        compound = self._build_compound_record(compound_data, compound_details_data, mol_fields)
+        molregno = compound["molregno"]
+
+        # This step is performed here specifically to attach corporate IDs to the output row
+        self.inject_corporate_property(row, compound_details_data, molregno, enums.EntityType.COMPOUND)
+        inserted, compound_details = self.property_service.build_details_records(
+            models.CompoundDetail,
+            compound_details_data,
+            {"molregno": molregno},
+            enums.EntityType.COMPOUND,
+            True,
+            prevalidated=prevalidated,
+        )
 
-                compound = self._build_compound_record(compound_data, compound_details_data)
-                molregno = compound["molregno"]
+        self.get_additional_records(row, grouped, molregno, compound_details)
 
-                # This step is performed here specifically to attach corporate IDs to the output row
-                self.inject_corporate_property(row, compound_details_data, molregno, enums.EntityType.COMPOUND)
-                inserted, compound_details = self.property_service.build_details_records(
-                    models.CompoundDetail,
-                    compound_details_data,
-                    {"molregno": molregno},
-                    enums.EntityType.COMPOUND,
-                    True,
-                )
+        # Only add the resulting data after it has been fully processed
+        # to ensure that no partial or invalid data from this row gets registered.
+        self.compounds_to_insert[compound["hash_mol"]] = compound
+        details_to_insert.extend(inserted)
 
-                self.get_additional_records(row, grouped, molregno, compound_details)
+    def build_sql(self, rows: List[Dict[str, Any]]) -> str:
+        self.compounds_to_insert = {}
+        details_to_insert = []
+        self.chunk_now = datetime.now()
 
-                # Only add the resulting data after it has been fully processed
-                # to ensure that no partial or invalid data from this row gets registered.
-                self.compounds_to_insert[compound["hash_mol"]] = compound
-                details_to_insert.extend(inserted)
+        grouped_rows = [self._group_data(row) for row in rows]
+        numeric_prevalidated = self.property_service.prevalidate_numeric_columns(
+            [grouped.get("compound_details", {}) for grouped in grouped_rows], enums.EntityType.COMPOUND
+        )
+        chunk_mol_fields = self._compute_chunk_mol_fields(grouped_rows)
+        self._prefetch_existing_compounds(
+            [fields["hash_mol"] for fields in chunk_mol_fields if fields is not None and "hash_mol" in fields]
+        )
+        self.reserve_chunk_ids(self._chunk_id_counts(grouped_rows, chunk_mol_fields))
 
-            self._process_row(row, process_row)
+        for row, grouped, prevalidated, mol_fields in zip(rows, grouped_rows, numeric_prevalidated, chunk_mol_fields):
+            self._process_row(row, self._process_one_row, grouped, prevalidated, mol_fields, details_to_insert)
 
         extra_sql = self.get_additional_cte()
         all_compounds_list = list(self.compounds_to_insert.values())
@@ -234,39 +437,34 @@ class CompoundRegistrar(BaseRegistrar):
         if not compounds:
             return ""
 
-        cols = list(compounds[0].keys())
-        values_sql = sql_utils.values_sql(compounds, cols)
+        cols = sql_utils.copy_to_temp_table(self.db, "tmp_compounds", compounds, models.Compound.__table__)
         insert_cte = f"""
             inserted_compounds AS (
                 INSERT INTO moltrack.compounds ({", ".join(cols)})
-                VALUES {values_sql}
+                SELECT {", ".join(cols)} FROM tmp_compounds
                 ON CONFLICT (hash_mol) DO NOTHING
                 RETURNING id, molregno, hash_mol
             ),
         """
 
-        hash_mols = [f"'{c['hash_mol']}'" for c in compounds]
-        hash_mol_list = ", ".join(hash_mols)
-        available_cte = f"""
-            available_compounds AS (
-                SELECT id, molregno, hash_mol FROM inserted_compounds
-                UNION
-                SELECT id, molregno, hash_mol FROM moltrack.compounds
-                WHERE hash_mol IN ({hash_mol_list})
-            )
-        """
-        return insert_cte + available_cte
+        return "".join((insert_cte, _AVAILABLE_COMPOUNDS_CTE))
 
     def _generate_details_sql(self, details) -> str:
         if not details:
             return ""
 
-        cols_without_key, values_sql = sql_utils.prepare_sql_parts(details)
+        cols_without_key = sql_utils.copy_to_temp_table(
+            self.db,
+            "tmp_compound_details",
+            details,
+            models.CompoundDetail.__table__,
+            key=models.Compound.__table__.c.molregno,
+        )
         return f"""
             inserted_details AS (
                 INSERT INTO moltrack.compound_details (compound_id, {", ".join(cols_without_key)})
                 SELECT ic.id, {", ".join([f"d.{col}" for col in cols_without_key])}
-                FROM (VALUES {values_sql}) AS d(molregno, {", ".join(cols_without_key)})
+                FROM tmp_compound_details d
                 JOIN available_compounds ic ON d.molregno = ic.molregno
             )"""
 
@@ -275,10 +473,8 @@ class CompoundRegistrar(BaseRegistrar):
     ):
         entity_type_lower = entity_type.value.lower()
         prop_name = f"corporate_{entity_type_lower}_id"
-        props = self.property_records_map.get(prop_name, [])
-
-        prop = next((p for p in props if p.entity_type == entity_type), None)
-        if not prop:
+        prop = self.prop_by_name_entity.get((prop_name, entity_type))
+        if prop is None:
             return
 
         value = prop.pattern.format(entity_value)
@@ -288,12 +484,13 @@ class CompoundRegistrar(BaseRegistrar):
     def cleanup_chunk(self):
         super().cleanup_chunk()
         self.compounds_to_insert.clear()
+        self._id_pools = {}
+        self._mol_fields_cache.clear()
+        self._existing_compounds.clear()
 
     def cleanup(self):
         super().cleanup()
         self.cleanup_chunk()
-        self._compound_records_map = None
-        self._compound_details_map = None
         self.matching_setting = None
 
     def get_additional_cte(self):
@@ -35,16 +35,19 @@ class StreamingResultWriter:
             output.truncate(0)
 
     def _stream_json(self, rows_iter):
-        yield "["
+        # orjson produces bytes; yielding them directly avoids a decode and re-encode per row
+        yield b"["
         first = True
         for rows in rows_iter:
-            for row in rows:
-                if not first:
-                    yield ","
-                else:
-                    first = False
-                yield orjson.dumps(row).decode("utf-8")
-        yield "]"
+            if not rows:
+                continue
+            chunk = b",".join([orjson.dumps(row) for row in rows])
+            if first:
+                first = False
+                yield chunk
+            else:
+                yield b"," + chunk
+        yield b"]"
 
     def _stream_sdf(self, rows_iter):
         for rows in rows_iter:
@@ -3,7 +3,7 @@ Field resolver for advanced search functionality
 Handles resolution of field paths like 'compounds.details.chembl' to SQL components
 """
 
-from typing import Any, Dict, get_args
+from typing import Any, Dict, Tuple, get_args
 from sqlmodel import SQLModel
 from sqlalchemy import inspect
 from sqlalchemy.orm import Session
@@ -23,6 +23,10 @@ class FieldResolver:
 
     def __init__(self, db_schema: str, db: Session):
         self.db_schema = db_schema
+        # (table, field, search_level) -> direct field expression rewritten for the search level alias
+        self._direct_expression_cache: Dict[Tuple[str, str, str], str] = {}
+        # (table, property_alias, alias) -> CASE expression returned by get_details_sql
+        self._details_sql_cache: Dict[Tuple[str, str, str], str] = {}
         self._generate_table_config(db)
         self.join_resolver = JoinResolver(db_schema, self.table_configs)
 
@@ -49,6 +53,8 @@ class FieldResolver:
             config = {
                 "table": table,
                 "alias": alias,
+                # The main query aliases its level table with the doubled alias to keep it apart from subqueries
+                "base_alias": alias + alias,
                 "details_table": details_table,
                 "details_alias": f"{alias}d",
                 "details_fk": f"{singular_name}_id",
@@ -116,6 +122,7 @@ class FieldResolver:
             "search_level": {
                 "foreign_key": self.table_configs[search_level]["details_fk"],
                 "alias": self.table_configs[search_level]["alias"],
+                "base_alias": self.table_configs[search_level]["base_alias"],
             }
         }
         parts = field_path.split(".")
@@ -254,11 +261,16 @@ class FieldResolver:
                 f"{joins_sql} "
             )
 
-        search_level_alias = self.table_configs[search_level]["alias"]
+        cache_key = (table_config["table"], property_name, search_level)
+        sql_expression = self._direct_expression_cache.get(cache_key)
+        if sql_expression is None:
+            search_level_config = self.table_configs[search_level]
+            sql_expression = table_config["direct_fields"][property_name].replace(
+                f"{search_level_config['alias']}.", f"{search_level_config['base_alias']}."
+            )
+            self._direct_expression_cache[cache_key] = sql_expression
         return {
-            "sql_expression": table_config["direct_fields"][property_name].replace(
-                f"{search_level_alias}.", f"{search_level_alias}{search_level_alias}."
-            ),
+            "sql_expression": sql_expression,
             "sql_field": "",
             "is_dynamic": False,
             "table_alias": table_config["alias"],
@@ -273,6 +285,10 @@ class FieldResolver:
         """
         Get SQL for details table based on the main table
         """
+        cache_key = (table, property_alias, alias)
+        cached = self._details_sql_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         assay_parts = f"WHEN 'bool' THEN {alias}.value_bool::text " if table == "assay_results" else ""
         details_parts = (
@@ -289,4 +305,5 @@ class FieldResolver:
             f"{details_parts}"
             f"END"
         )
+        self._details_sql_cache[cache_key] = sql_expression
         return sql_expression
@@ -2,11 +2,84 @@
 Search operators and their SQL translations
 """
 
-from typing import Dict, Any, Tuple
+import enum
+import re
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from typing import Callable, Dict, Any, Tuple
 from datetime import datetime
 from app.utils import enums
 from app.utils.enums import OperatorType
 
+try:
+    # Optional C parser, much faster than strptime
+    from ciso8601 import parse_datetime as _fast_parse_datetime
+except ImportError:
+    _fast_parse_datetime = None
+
+_NULL_OPS = {
+    enums.CompareOp.EQUALS: "IS",
+    enums.CompareOp.NOT_EQUALS: "IS NOT",
+}
+
+
+class _OpKind(enum.IntEnum):
+    """How an operator's SQL is assembled, see _HANDLERS"""
+
+    STANDARD = 0
+    IN = 1
+    RANGE = 2
+    SIMILAR = 3
+    SUBSTR = 4
+    ON = 5
+    LT = 6
+    GT = 7
+
+
+_OPERATOR_KINDS = {
+    "IN": _OpKind.IN,
+    "RANGE": _OpKind.RANGE,
+    "IS SIMILAR": _OpKind.SIMILAR,
+    "HAS SUBSTRUCTURE": _OpKind.SUBSTR,
+    "IS SUBSTRUCTURE OF": _OpKind.SUBSTR,
+    "ON": _OpKind.ON,
+    "<": _OpKind.LT,
+    "<=": _OpKind.LT,
+    ">": _OpKind.GT,
+    ">=": _OpKind.GT,
+}
+
+# Parameter placeholders of the operator templates (:param, :param1, ...)
+_PARAM_RE = re.compile(r":param(\d*)\b")
+DEFAULT_PARAM_PREFIX = "param"
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}(?: \d{2}:\d{2})?$")
+
+# Operator definition flattened for dispatch; built once from SearchOperators.OPERATORS
+# handler is the module-level function from _HANDLERS that assembles the operator's SQL
+_CompiledOp = namedtuple("_CompiledOp", "sql_tmpl op_type n_params transform kind needs_threshold null_sql handler")
+
+
+# Value transforms of the operators that rewrite the bound value
+def _wrap_contains(value: Any) -> str:
+    return f"%{value}%"
+
+
+def _wrap_starts(value: Any) -> str:
+    return f"{value}%"
+
+
+def _wrap_ends(value: Any) -> str:
+    return f"%{value}"
+
+
+def _wrap_in(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _wrap_range(value: Any) -> Any:
+    return (value[0], value[1]) if isinstance(value, (list, tuple)) and len(value) == 2 else value
+
 
 class SearchOperators:
     """Maps search operators to SQL expressions and validation"""
@@ -28,28 +101,28 @@ class SearchOperators:
             "type": OperatorType.STRING,
             "params": 1,
             "description": "Case-insensitive contains",
-            "value_transform": lambda x: f"%{x}%",
+            "value_transform": _wrap_contains,
         },
         "STARTS WITH": {
             "sql": "ILIKE :param",
             "type": OperatorType.STRING,
             "params": 1,
             "description": "Starts with pattern",
-            "value_transform": lambda x: f"{x}%",
+            "value_transform": _wrap_starts,
         },
         "ENDS WITH": {
             "sql": "ILIKE :param",
             "type": OperatorType.STRING,
             "params": 1,
             "description": "Ends with pattern",
-            "value_transform": lambda x: f"%{x}",
+            "value_transform": _wrap_ends,
         },
         "IN": {
             "sql": "{field} IN {params}",
             "type": OperatorType.STRING,
             "params": 1,
             "description": "Match any value in list",
-            "value_transform": lambda x: tuple(x) if isinstance(x, list) else x,
+            "value_transform": _wrap_in,
         },
         # Numeric operators
         "<": {"sql": "< :param", "type": OperatorType.NUMERIC, "params": 1, "description": "Less than"},
@@ -61,7 +134,7 @@ class SearchOperators:
             "type": OperatorType.NUMERIC,
             "params": 2,
             "description": "Between two values (inclusive)",
-            "value_transform": lambda x: (x[0], x[1]) if isinstance(x, (list, tuple)) and len(x) == 2 else x,
+            "value_transform": _wrap_range,
         },
         # Datetime operators
         "BEFORE": {"sql": "< :param", "type": OperatorType.DATETIME, "params": 1, "description": "Before date/time"},
@@ -102,48 +175,32 @@ class SearchOperators:
             raise ValueError(f"Unsupported operator: {operator}")
         return cls.OPERATORS[operator]
 
+    @staticmethod
+    def _compiled(operator: str) -> _CompiledOp:
+        op = _COMPILED_OPS.get(operator)
+        if op is None:
+            raise ValueError(f"Unsupported operator: {operator}")
+        return op
+
     @classmethod
     def validate_operator_value(cls, operator: str, value: Any, threshold: float = None) -> bool:
         """Validate that a value is appropriate for the given operator"""
-        op_def = cls.get_operator(operator)
+        op = cls._compiled(operator)
 
         # Check if threshold is required
-        if op_def.get("requires_threshold", False) and threshold is None:
+        if op.needs_threshold and threshold is None:
             raise ValueError(f"Operator '{operator}' requires a threshold value")
 
         # Check value type based on operator
-        if operator == "IN" and not isinstance(value, (list, tuple)):
-            raise ValueError(f"Operator '{operator}' requires a list or tuple value")
-
-        if operator == "RANGE":
-            if not isinstance(value, (list, tuple)) or len(value) != 2:
-                raise ValueError(f"Operator '{operator}' requires a list/tuple with exactly 2 values")
-            if value[0] >= value[1]:
-                raise ValueError("RANGE operator requires first value to be less than second value")
-
-        if operator in ["ON", "BEFORE", "AFTER"]:
-
-            def check_date(date_str: str):
-                formats = ["%Y-%m-%d", "%Y-%m-%d %H:%M"]  # Supported formats: date-only and date-time
-                for fmt in formats:
-                    try:
-                        # Try to parse the date string using the YYYY-MM-DD format
-                        datetime.strptime(date_str, fmt)
-                        return True
-                    except ValueError:
-                        continue
-                return False
-
-            if not check_date(value):
-                raise ValueError("DATE value must be in format YYYY-MM-DD or YYYY-MM-DD hh:mm")
+        validator = _VALIDATORS.get(operator)
+        if validator is not None:
+            validator(operator, value)
         return True
 
     @classmethod
     def validate_operands(cls, operator: str, field: str):
         """Validate that operand is appropriate for operation"""
-        molecular_ops = {"IS SIMILAR", "HAS SUBSTRUCTURE", "IS SUBSTRUCTURE OF"}
-
-        if operator in molecular_ops:
+        if operator in _MOLECULAR_OPS:
             if not field.endswith(".structure"):
                 raise ValueError("Molecular operators can only be applied to compounds.structure")
         else:
@@ -152,6 +209,31 @@ class SearchOperators:
             if field.endswith(".structure"):
                 raise ValueError("Only molecular operators can be applied to compounds.structure")
 
+    @classmethod
+    def get_params(
+        cls, operator: str, value: Any, threshold: float = None, param_prefix: str = DEFAULT_PARAM_PREFIX
+    ) -> Dict[str, Any]:
+        """
+        Get the bind parameters of an operator, named as in the expression from get_sql_expression
+        """
+        op = cls._compiled(operator)
+
+        # Transform value if needed
+        if op.transform is not None:
+            value = op.transform(value)
+
+        kind = op.kind
+        if kind == _OpKind.IN:
+            # For IN clauses, we need to create multiple parameters
+            return {f"{param_prefix}{i}": val for i, val in enumerate(value, 1)}
+        if kind == _OpKind.RANGE:
+            return {f"{param_prefix}1": value[0], f"{param_prefix}2": value[1]}
+        if kind == _OpKind.SIMILAR:
+            return {f"{param_prefix}1": value, f"{param_prefix}2": value, f"{param_prefix}3": threshold}
+        if op.null_sql is not None and value is None:
+            return {}
+        return {param_prefix: value}
+
     @classmethod
     def get_sql_expression(
         cls,
@@ -161,81 +243,155 @@ class SearchOperators:
         threshold: float = None,
         alias: str = None,
         value_qualifier: bool = False,
+        param_prefix: str = DEFAULT_PARAM_PREFIX,
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Get SQL expression and parameters for an operator
 
+        Parameters are named param_prefix, param_prefix1, param_prefix2, ... so that several conditions can be
+        combined in one statement without renaming.
+
         Returns:
             Tuple of (sql_expression, parameters_dict)
         """
-        op_def = cls.get_operator(operator)
+        op = cls._compiled(operator)
+        params = cls.get_params(operator, value, threshold, param_prefix)
+        sql_expr = op.handler(op, field, value, params, alias, value_qualifier)
+        if param_prefix != DEFAULT_PARAM_PREFIX:
+            sql_expr = _PARAM_RE.sub(lambda match: f":{param_prefix}{match.group(1)}", sql_expr)
+        return sql_expr, params
 
-        null_ops = {
-            enums.CompareOp.EQUALS: "IS",
-            enums.CompareOp.NOT_EQUALS: "IS NOT",
-        }
 
-        # Transform value if needed
-        if "value_transform" in op_def:
-            value = op_def["value_transform"](value)
-
-        # Handle special cases
-        match operator:
-            case "IN":
-                # For IN clauses, we need to create multiple parameters
-                param_names = [f"param{i + 1}" for i in range(len(value))]
-                placeholders = "(" + ",".join([f":{name}" for name in param_names]) + ")"
-                sql_expr = op_def["sql"].format(field=field, params=placeholders)
-                params = {name: val for name, val in zip(param_names, value)}
-                return sql_expr, params
-            case "RANGE":
-                sql_expr = op_def["sql"].format(field=field)
-                if value_qualifier:
-                    sql_expr = (
-                        f"(("
-                        f"{alias}.value_qualifier = {enums.ValueQualifier.GREATER_THAN.value} AND {field} < :param2)"
-                        f" OR ("
-                        f"{alias}.value_qualifier = {enums.ValueQualifier.LESS_THAN.value} AND {field} > :param1)"
-                        f" OR ("
-                        f"{alias}.value_qualifier = {enums.ValueQualifier.EQUALS.value} AND {sql_expr})"
-                        f")"
-                    )
-                return sql_expr, {"param1": value[0], "param2": value[1]}
-            case "IS SIMILAR":
-                sql_expr = op_def["sql"].format(field=field)
-                return sql_expr, {"param1": value, "param2": value, "param3": threshold}
-            case "IS SUBSTRUCTURE OF" | "HAS SUBSTRUCTURE" | "ON":
-                sql_expr = op_def["sql"].format(field=field)
-                return sql_expr, {"param": value}
-            case "<" | "<=":
-                sql_expr = f"{field} {op_def['sql']}"
-                if value_qualifier:
-                    sql_expr = (
-                        f"(("
-                        f"{alias}.value_qualifier = {enums.ValueQualifier.LESS_THAN.value})"
-                        f" OR ("
-                        f"{alias}.value_qualifier = {enums.ValueQualifier.GREATER_THAN.value} AND {field} < :param)"
-                        f" OR ("
-                        f"{alias}.value_qualifier = {enums.ValueQualifier.EQUALS.value} AND {field} {op_def['sql']})"
-                        f")"
-                    )
-                return sql_expr, {"param": value}
-            case ">" | ">=":
-                sql_expr = f"{field} {op_def['sql']}"
-                if value_qualifier:
-                    sql_expr = (
-                        f"(("
-                        f"{alias}.value_qualifier = {enums.ValueQualifier.GREATER_THAN.value})"
-                        f" OR ("
-                        f"{alias}.value_qualifier = {enums.ValueQualifier.LESS_THAN.value} AND {field} > :param)"
-                        f" OR ("
-                        f"{alias}.value_qualifier = {enums.ValueQualifier.EQUALS.value} AND {field} {op_def['sql']})"
-                        f")"
-                    )
-                return sql_expr, {"param": value}
-            case _:
-                if operator in null_ops and value is None:
-                    return f"{field} {null_ops[operator]} NULL", {}
-                # Standard operator
-                sql_expr = f"{field} {op_def['sql']}"
-                return sql_expr, {"param": value}
+def _standard_sql(op: _CompiledOp, field: str, value: Any, params: Dict[str, Any], alias: str, value_qualifier: bool):
+    if op.null_sql is not None and value is None:
+        return f"{field} {op.null_sql} NULL"
+    return f"{field} {op.sql_tmpl}"
+
+
+@lru_cache(maxsize=128)
+def _in_placeholders(count: int) -> str:
+    """Placeholder list (:param1,...,:paramN) of an IN clause with count values"""
+    return "(" + ",".join(f":{DEFAULT_PARAM_PREFIX}{i}" for i in range(1, count + 1)) + ")"
+
+
+def _in_sql(op: _CompiledOp, field: str, value: Any, params: Dict[str, Any], alias: str, value_qualifier: bool):
+    return op.sql_tmpl.format(field=field, params=_in_placeholders(len(params)))
+
+
+_GT = enums.ValueQualifier.GREATER_THAN.value
+_LT = enums.ValueQualifier.LESS_THAN.value
+_EQ = enums.ValueQualifier.EQUALS.value
+
+# Qualifier-aware expressions; only alias, field and the operator SQL vary per condition
+_QUALIFIED_RANGE_TMPL = (
+    f"(({{alias}}.value_qualifier = {_GT} AND {{field}} < :param2)"
+    f" OR ({{alias}}.value_qualifier = {_LT} AND {{field}} > :param1)"
+    f" OR ({{alias}}.value_qualifier = {_EQ} AND {{range_sql}}))"
+)
+_QUALIFIED_LT_TMPL = (
+    f"(({{alias}}.value_qualifier = {_LT})"
+    f" OR ({{alias}}.value_qualifier = {_GT} AND {{field}} < :param)"
+    f" OR ({{alias}}.value_qualifier = {_EQ} AND {{field}} {{op_sql}}))"
+)
+_QUALIFIED_GT_TMPL = (
+    f"(({{alias}}.value_qualifier = {_GT})"
+    f" OR ({{alias}}.value_qualifier = {_LT} AND {{field}} > :param)"
+    f" OR ({{alias}}.value_qualifier = {_EQ} AND {{field}} {{op_sql}}))"
+)
+
+
+def _range_sql(op: _CompiledOp, field: str, value: Any, params: Dict[str, Any], alias: str, value_qualifier: bool):
+    sql_expr = op.sql_tmpl.format(field=field)
+    if value_qualifier:
+        return _QUALIFIED_RANGE_TMPL.format(alias=alias, field=field, range_sql=sql_expr)
+    return sql_expr
+
+
+def _field_format_sql(
+    op: _CompiledOp, field: str, value: Any, params: Dict[str, Any], alias: str, value_qualifier: bool
+):
+    return op.sql_tmpl.format(field=field)
+
+
+def _less_than_sql(op: _CompiledOp, field: str, value: Any, params: Dict[str, Any], alias: str, value_qualifier: bool):
+    if value_qualifier:
+        return _QUALIFIED_LT_TMPL.format(alias=alias, field=field, op_sql=op.sql_tmpl)
+    return f"{field} {op.sql_tmpl}"
+
+
+def _greater_than_sql(
+    op: _CompiledOp, field: str, value: Any, params: Dict[str, Any], alias: str, value_qualifier: bool
+):
+    if value_qualifier:
+        return _QUALIFIED_GT_TMPL.format(alias=alias, field=field, op_sql=op.sql_tmpl)
+    return f"{field} {op.sql_tmpl}"
+
+
+# Indexed by _OpKind
+_HANDLERS: Tuple[Callable[..., str], ...] = (
+    _standard_sql,
+    _in_sql,
+    _range_sql,
+    _field_format_sql,
+    _field_format_sql,
+    _field_format_sql,
+    _less_than_sql,
+    _greater_than_sql,
+)
+
+
+def _validate_in(operator: str, value: Any):
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"Operator '{operator}' requires a list or tuple value")
+
+
+def _validate_range(operator: str, value: Any):
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        raise ValueError(f"Operator '{operator}' requires a list/tuple with exactly 2 values")
+    if value[0] >= value[1]:
+        raise ValueError("RANGE operator requires first value to be less than second value")
+
+
+def _validate_date(operator: str, value: Any):
+    # Supported formats: date-only and date-time. The regex rejects malformed values before they are parsed.
+    if _DATE_RE.match(value):
+        try:
+            if _fast_parse_datetime is not None:
+                _fast_parse_datetime(value)
+            else:
+                datetime.strptime(value, "%Y-%m-%d" if len(value) == 10 else "%Y-%m-%d %H:%M")
+            return
+        except ValueError:
+            pass
+    raise ValueError("DATE value must be in format YYYY-MM-DD or YYYY-MM-DD hh:mm")
+
+
+_VALIDATORS: Dict[str, Callable[[str, Any], None]] = {
+    "IN": _validate_in,
+    "RANGE": _validate_range,
+    "ON": _validate_date,
+    "BEFORE": _validate_date,
+    "AFTER": _validate_date,
+}
+
+_MOLECULAR_OPS = frozenset({"IS SIMILAR", "HAS SUBSTRUCTURE", "IS SUBSTRUCTURE OF"})
+
+
+def _compile_operator(name: str, op_def: Dict[str, Any]) -> _CompiledOp:
+    kind = _OPERATOR_KINDS.get(name, _OpKind.STANDARD)
+    return _CompiledOp(
+        sql_tmpl=op_def["sql"],
+        op_type=op_def["type"],
+        n_params=op_def["params"],
+        transform=op_def.get("value_transform"),
+        kind=kind,
+        needs_threshold=op_def.get("requires_threshold", False),
+        null_sql=_NULL_OPS.get(name),
+        handler=_HANDLERS[kind],
+    )
+
+
+# Operator string -> compiled operator, so dispatch is a single dict lookup followed by a direct call
+_COMPILED_OPS: Dict[str, _CompiledOp] = {
+    sys.intern(name): _compile_operator(name, op_def) for name, op_def in SearchOperators.OPERATORS.items()
+}
@@ -1,10 +1,13 @@
-from typing import Any, Dict
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
 from app.services.search.field_resolver import FieldResolutionError, FieldResolver
-from app.services.search.operators import SearchOperators
+from app.services.search.operators import DEFAULT_PARAM_PREFIX, SearchOperators
 import app.models as models
 from app.services.search.utils.aggregation_operators import AggregationOperators
 from app.services.search.utils.helper_functions import get_qualifier_sql, sanitize_field_name
-from app.services.search.utils.join_tools import JoinOrderingTool
+from app.services.search.utils.join_tools import JoinOrderingTool, JoinToolPool
 
 
 class QueryBuildError(Exception):
@@ -13,14 +16,103 @@ class QueryBuildError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class QuerySignature:
+    """
+    Structure of a search request with the literal values left out.
+    Two requests with the same signature produce the same SQL and differ only in their bind parameters.
+    """
+
+    schema: str
+    level: str
+    limit: Optional[int]
+    alias_mapping: Tuple[Tuple[str, Hashable], ...]
+    filter: Hashable
+
+    @classmethod
+    def from_request(cls, schema: str, request: models.SearchRequest, alias_mapping: Dict[str, Any]):
+        return cls(
+            schema=schema,
+            level=request.level,
+            limit=request.limit,
+            alias_mapping=tuple(alias_mapping.items()),
+            filter=_filter_signature(request.filter, {}) if request.filter else None,
+        )
+
+
+# Outer select column of a dynamic field, with the value qualifier prepended when the details table has one
+_DYNAMIC_SELECT_TMPL = "{aggregate} FILTER (WHERE {sql}) AS {alias} "
+_DYNAMIC_SELECT_QUALIFIED_TMPL = "{qualifier} FILTER (WHERE {sql}) || {aggregate} FILTER (WHERE {sql}) AS {alias} "
+
+
+def _filter_signature(filter_obj: models.Filter, seen: Dict[Hashable, int]) -> Hashable:
+    if isinstance(filter_obj, models.AtomicCondition):
+        value = filter_obj.value
+        # The value only shapes the SQL when it is NULL or, for IN, through the number of placeholders
+        if value is None:
+            value_shape = None
+        elif isinstance(value, (list, tuple)):
+            value_shape = len(value)
+        else:
+            value_shape = ""
+        # Repeated conditions share their SQL, so which conditions repeat an earlier one shapes the SQL too
+        key = _subtree_key(filter_obj)
+        repeat_of = seen.setdefault(key, len(seen)) if key is not None else None
+        return (filter_obj.field, filter_obj.operator, value_shape, filter_obj.threshold is not None, repeat_of)
+    return (filter_obj.operator, tuple(_filter_signature(condition, seen) for condition in filter_obj.conditions))
+
+
+def _freeze_value(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(item) for item in value)
+    # The type keeps values that compare equal but bind differently apart, e.g. 1 and True
+    return (type(value), value)
+
+
+def _subtree_key(filter_obj: models.Filter) -> Optional[Hashable]:
+    """Structural key of a filter subtree including its values, or None when a value is not hashable"""
+    try:
+        if isinstance(filter_obj, models.AtomicCondition):
+            key = (filter_obj.field, filter_obj.operator, _freeze_value(filter_obj.value), filter_obj.threshold)
+        else:
+            child_keys = tuple(_subtree_key(condition) for condition in filter_obj.conditions)
+            if None in child_keys:
+                return None
+            key = (filter_obj.operator, child_keys)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _iter_conditions(filter_obj: models.Filter) -> Iterator[models.AtomicCondition]:
+    """Atomic conditions of a filter tree in the order build_filter_sql_parts visits them"""
+    if isinstance(filter_obj, models.AtomicCondition):
+        yield filter_obj
+    else:
+        for condition in filter_obj.conditions:
+            yield from _iter_conditions(condition)
+
+
 class QueryBuilder:
     """Builds dynamic SQL queries from search requests"""
 
+    # Compiled queries shared by all builders: signature -> (sql, parameter prefix of every atomic condition)
+    _plan_cache: "OrderedDict[QuerySignature, Tuple[str, Tuple[str, ...]]]" = OrderedDict()
+    _plan_cache_size = 512
+    _plan_cache_lock = threading.Lock()
+
     def __init__(self, field_resolver: FieldResolver):
         self.field_resolver = field_resolver
         self.operators = SearchOperators()
         self.dynamic_query_parts = {}
         self.parameter_counter = 0
+        # Parameter prefix of every atomic condition, in filter order
+        self._param_prefixes: List[str] = []
+        # (field_path, level, subquery) -> (resolved field, joins it added), for the request being built
+        self._resolve_memo: Dict[Tuple[str, str, bool], Tuple[Dict[str, Any], Tuple[List[str], List[str]]]] = {}
+        # Subtree key -> (sql, params, parameter prefixes) of filter subtrees already built for the request
+        self._subtree_cache: Dict[Hashable, Tuple[str, Dict[str, Any], Tuple[str, ...]]] = {}
 
     def build_query(self, request: models.SearchRequest, alias_mapping: Dict[str, str]) -> Dict[str, Any]:
         """
@@ -38,25 +130,35 @@ class QueryBuilder:
                 'params': Dict[str, Any] # Query parameters
             }
         """
+        schema = self.field_resolver.db_schema
+        signature = QuerySignature.from_request(schema, request, alias_mapping)
+        with self._plan_cache_lock:
+            plan = self._plan_cache.get(signature)
+            if plan is not None:
+                self._plan_cache.move_to_end(signature)
+        if plan is not None:
+            sql, param_prefixes = plan
+            return {"sql": sql, "params": self._bind_params(request.filter, param_prefixes)}
+
         self.alias_mapping = alias_mapping
+        self._resolve_memo = {}
+        self._subtree_cache = {}
         level = request.level
-        schema = self.field_resolver.db_schema
         table_config = self.field_resolver.table_configs[level]
 
         # Build SQL parts for base query
-        base_query_joins = JoinOrderingTool()
+        base_query_joins = JoinOrderingTool(table_config["alias"], table_config["base_alias"])
         output_info = self.build_base_sql_parts(level, base_query_joins)
 
         base_select_clause = output_info["select_clause"]
         select_direct_parts = output_info["select_direct_parts"]
         group_by = output_info["group_by"]
         table = table_config["table"]
-        alias = table_config["alias"]
 
         group_by_sql = f"GROUP BY {' ,'.join(group_by)} " if group_by else ""
 
         # Build FROM clause with primary table
-        base_from_clause = f"{schema}.{table} {alias}{alias}"
+        base_from_clause = f"{schema}.{table} {table_config['base_alias']}"
 
         query_params = {}
         filter_sql = ""
@@ -70,40 +172,93 @@ class QueryBuilder:
                 filter_sql = f"WHERE {sql_components['sql']}"
                 query_params.update(sql_components["params"])
 
-        # Convert joins to list and remove duplicates
-        base_joins = base_query_joins.getJoinSQL()
         # The main query needs to have a different alias compared to the subqueries
-        base_joins = base_joins.replace(
-            f" {table_config['alias']}.", f" {table_config['alias']}{table_config['alias']}."
-        )
+        base_joins = base_query_joins.getJoinSQL(doubled=True)
 
-        # Create a copy of select_direct_parts to avoid mutating the original, which could break the query syntax
-        select_clause = list(select_direct_parts)
-        select_clause.extend(self._create_select_for_dynamic_fields())
+        # Build a new list rather than extending select_direct_parts, which is still used for ORDER BY
+        select_clause = self._create_select_clause(select_direct_parts)
 
         # Build main query
-        base_sql = f"WITH base AS (SELECT {base_select_clause} FROM {base_from_clause} {base_joins} {filter_sql} ) "
         order_by_sql = f"ORDER BY {select_direct_parts[0]}" if select_direct_parts else ""
         limit_sql = f"LIMIT {request.limit}" if request.limit else ""
-        complete_sql = (
-            f"{base_sql} SELECT {' ,'.join(select_clause)} FROM base {group_by_sql} {order_by_sql} {limit_sql}"
-        )
-
-        return {"sql": complete_sql.strip(), "params": query_params}
+        sql_parts = [
+            "WITH base AS (SELECT ",
+            base_select_clause,
+            " FROM ",
+            base_from_clause,
+            " ",
+            base_joins,
+            " ",
+            filter_sql,
+            " )  SELECT ",
+            " ,".join(select_clause),
+            " FROM base ",
+            group_by_sql,
+            " ",
+            order_by_sql,
+            " ",
+            limit_sql,
+        ]
+
+        sql = "".join(sql_parts).strip()
+        with self._plan_cache_lock:
+            self._plan_cache[signature] = (sql, tuple(self._param_prefixes))
+            if len(self._plan_cache) > self._plan_cache_size:
+                self._plan_cache.popitem(last=False)
+
+        return {"sql": sql, "params": query_params}
+
+    def _bind_params(self, filter_obj: Optional[models.Filter], param_prefixes: Tuple[str, ...]) -> Dict[str, Any]:
+        """Bind the values of a request to the parameter names of a cached query"""
+        if filter_obj is None:
+            return {}
+        params = {}
+        for condition, param_prefix in zip(_iter_conditions(filter_obj), param_prefixes):
+            params.update(
+                self.operators.get_params(condition.operator, condition.value, condition.threshold, param_prefix)
+            )
+        return params
 
-    def _create_select_for_dynamic_fields(self):
-        select_clause = []
+    def _resolve_field(
+        self, field_path: str, level: str, joins: JoinOrderingTool, subquery: bool = False
+    ) -> Dict[str, Any]:
+        """
+        FieldResolver.resolve_field memoized for the current request.
+        On a repeat the joins added by the first resolution are replayed into `joins`.
+        """
+        key = (field_path, level, subquery)
+        cached = self._resolve_memo.get(key)
+        if cached is None:
+            join_count = joins.joinCount()
+            resolved = self.field_resolver.resolve_field(field_path, level, joins, subquery)
+            self._resolve_memo[key] = (resolved, (joins.joins[join_count:], joins.keys[join_count:]))
+            return resolved
+
+        resolved, (added_joins, added_keys) = cached
+        joins.add(added_joins, added_keys)
+        return resolved
+
+    def _create_select_clause(self, select_direct_parts: List[str]) -> List[str]:
+        """
+        Outer select list: the direct columns followed by one aggregate per dynamic field.
+        The list is sized once; select_direct_parts itself is not mutated.
+        """
+        direct_count = len(select_direct_parts)
+        select_clause = [None] * (direct_count + len(self.dynamic_query_parts))
+        select_clause[:direct_count] = select_direct_parts
+        i = direct_count
         for alias, details in self.dynamic_query_parts.items():
-            operation = details["operation"]
-            column_value = details["column_value"]
             sql = details["sql"]
-            statement = AggregationOperators.get_sql_expression(operation, column_value, sql)
-            statement += f" FILTER (WHERE {details['sql']})"
-            statement = statement + f" AS {alias} "
+            aggregate = AggregationOperators.get_sql_expression(details["operation"], details["column_value"], sql)
             qualifier = details.get("qualifier_field", None)
             if qualifier:
-                statement = f"{get_qualifier_sql(qualifier)} FILTER (WHERE {details['sql']}) || " + statement
-            select_clause.append(statement)
+                statement = _DYNAMIC_SELECT_QUALIFIED_TMPL.format(
+                    qualifier=get_qualifier_sql(qualifier), aggregate=aggregate, sql=sql, alias=alias
+                )
+            else:
+                statement = _DYNAMIC_SELECT_TMPL.format(aggregate=aggregate, sql=sql, alias=alias)
+            select_clause[i] = statement
+            i += 1
         return select_clause
 
     def build_base_sql_parts(
@@ -122,7 +277,7 @@ class QueryBuilder:
         has_dynamic = False
 
         for _, (_, (field_path, operation)) in self.alias_mapping.items():
-            resolved = self.field_resolver.resolve_field(field_path, search_level, all_joins)
+            resolved = self._resolve_field(field_path, search_level, all_joins)
             # Create alias for the field
             field_alias = sanitize_field_name(field_path, operation) if operation else sanitize_field_name(field_path)
             if not resolved["is_dynamic"]:
@@ -159,7 +314,7 @@ class QueryBuilder:
             id_field = f"{search_level}.id"
             id_alias = sanitize_field_name(id_field)
             if id_alias not in list_of_aliases:
-                resolved = self.field_resolver.resolve_field(id_field, search_level, all_joins)
+                resolved = self._resolve_field(id_field, search_level, all_joins)
                 select_fields.append(f"{resolved['sql_expression']} AS {id_alias}")
                 group_by.append(id_alias)
 
@@ -179,6 +334,7 @@ class QueryBuilder:
         if isinstance(filter_obj, models.AtomicCondition):
             # Handle single atomic condition
             cond_info = self.build_condition(filter_obj, level)
+            self._param_prefixes.append(DEFAULT_PARAM_PREFIX)
             return {
                 "sql": cond_info["sql"],
                 "params": cond_info["params"],
@@ -186,30 +342,42 @@ class QueryBuilder:
 
         elif isinstance(filter_obj, models.LogicalNode):
             # Handle logical node with multiple conditions
+            atomic_type = models.AtomicCondition
+            if all(type(condition) is atomic_type for condition in filter_obj.conditions):
+                return self._build_flat_filter_sql_parts(filter_obj, level)
+
             conditions = []
             all_params = {}
 
             for condition in filter_obj.conditions:
+                key = _subtree_key(condition)
+                cached = self._subtree_cache.get(key) if key is not None else None
+                if cached is not None:
+                    # Identical subtree seen earlier in the request: reuse its SQL and parameter names
+                    sql, params, param_prefixes = cached
+                    self._param_prefixes.extend(param_prefixes)
+                    conditions.append(sql)
+                    all_params.update(params)
+                    continue
+
+                first_prefix = len(self._param_prefixes)
                 if isinstance(condition, models.AtomicCondition):
-                    cond_info = self.build_condition(condition, level)
-                    # Rename parameters to avoid conflicts
-                    renamed_sql = cond_info["sql"]
-                    renamed_params = {}
-                    for old_name, value in cond_info["params"].items():
-                        new_name = f"{old_name}_{self.parameter_counter}"
-                        renamed_sql = renamed_sql.replace(f":{old_name}", f":{new_name}")
-                        renamed_params[new_name] = value
-
-                    conditions.append(renamed_sql)
-                    all_params.update(renamed_params)
+                    # Unique parameter names per condition avoid conflicts between the combined conditions
+                    param_prefix = f"c{self.parameter_counter}_param"
+                    cond_info = self.build_condition(condition, level, param_prefix)
+                    self._param_prefixes.append(param_prefix)
+                    sql = cond_info["sql"]
                     self.parameter_counter += 1
 
                 elif isinstance(condition, models.LogicalNode):
                     # Recursive filter handling
-                    nested_info = self.build_filter_sql_parts(condition, level)
+                    cond_info = self.build_filter_sql_parts(condition, level)
+                    sql = f"({cond_info['sql']})"
 
-                    conditions.append(f"({nested_info['sql']})")
-                    all_params.update(nested_info["params"])
+                conditions.append(sql)
+                all_params.update(cond_info["params"])
+                if key is not None:
+                    self._subtree_cache[key] = (sql, cond_info["params"], tuple(self._param_prefixes[first_prefix:]))
 
             # Combine conditions with operator
             operator = f" {filter_obj.operator.value} "
@@ -217,35 +385,62 @@ class QueryBuilder:
 
             return {"sql": combined_conditions, "params": all_params}
 
-    def build_condition(self, condition: models.AtomicCondition, level: str) -> Dict[str, Any]:
+    def _build_flat_filter_sql_parts(self, filter_obj: models.LogicalNode, level: str) -> Dict[str, Any]:
+        """Fast path of build_filter_sql_parts for a logical node whose conditions are all atomic"""
+        conditions = []
+        all_params = {}
+        for condition in filter_obj.conditions:
+            key = _subtree_key(condition)
+            cached = self._subtree_cache.get(key) if key is not None else None
+            if cached is None:
+                param_prefix = f"c{self.parameter_counter}_param"
+                self.parameter_counter += 1
+                cond_info = self.build_condition(condition, level, param_prefix)
+                cached = (cond_info["sql"], cond_info["params"], (param_prefix,))
+                if key is not None:
+                    self._subtree_cache[key] = cached
+            sql, params, param_prefixes = cached
+            self._param_prefixes.extend(param_prefixes)
+            conditions.append(sql)
+            all_params.update(params)
+
+        return {"sql": f" {filter_obj.operator.value} ".join(conditions), "params": all_params}
+
+    def build_condition(
+        self, condition: models.AtomicCondition, level: str, param_prefix: str = DEFAULT_PARAM_PREFIX
+    ) -> Dict[str, Any]:
         """
         Builds SQL parts for a single condition
 
         Returns:
             Dict with: {'sql': str, 'params': Dict[str, Any]}
         """
+        joins = JoinToolPool.acquire()
         try:
-            joins = JoinOrderingTool()
             # Resolve field to SQL components
-            field_info = self.field_resolver.resolve_field(condition.field, level, joins, True)
+            field_info = self._resolve_field(condition.field, level, joins, True)
 
             # Handle dynamic properties with property name filtering
             if field_info["is_dynamic"]:
-                return self._build_dynamic_condition(field_info, condition)
+                return self._build_dynamic_condition(field_info, condition, param_prefix)
             else:
-                return self._build_direct_condition(field_info, condition)
+                return self._build_direct_condition(field_info, condition, param_prefix)
 
         except FieldResolutionError as e:
             raise QueryBuildError(f"Field resolution error: {str(e)}")
         except ValueError as e:
             raise QueryBuildError(f"Condition validation error: {str(e)}")
+        finally:
+            JoinToolPool.release(joins)
 
-    def _build_direct_condition(self, field_info: Dict[str, Any], condition: models.AtomicCondition) -> Dict[str, Any]:
+    def _build_direct_condition(
+        self, field_info: Dict[str, Any], condition: models.AtomicCondition, param_prefix: str = DEFAULT_PARAM_PREFIX
+    ) -> Dict[str, Any]:
         """Build condition for direct field access"""
         field_sql = field_info["sql_expression"]
 
         sql_expr, params = self.operators.get_sql_expression(
-            condition.operator, field_sql, condition.value, condition.threshold
+            condition.operator, field_sql, condition.value, condition.threshold, param_prefix=param_prefix
         )
 
         sql = sql_expr
@@ -258,13 +453,15 @@ class QueryBuilder:
                 f"EXISTS ( "
                 f"{field_info['subquery']['sql']} "
                 f"WHERE {field_info['subquery']['alias']}.{key}="
-                f"{field_info['search_level']['alias']}{field_info['search_level']['alias']}.id "
+                f"{field_info['search_level']['base_alias']}.id "
                 f"AND {sql_expr})  "
             )
 
         return {"sql": sql, "params": params}
 
-    def _build_dynamic_condition(self, field_info: Dict[str, Any], condition: models.AtomicCondition) -> Dict[str, Any]:
+    def _build_dynamic_condition(
+        self, field_info: Dict[str, Any], condition: models.AtomicCondition, param_prefix: str = DEFAULT_PARAM_PREFIX
+    ) -> Dict[str, Any]:
         """Build condition for dynamic property access"""
         # For dynamic properties, we need to filter by property name AND value
         # Handle numeric operators specially to avoid type mismatches
@@ -280,6 +477,7 @@ class QueryBuilder:
             condition.threshold,
             field_info["table_alias"],
             field_info["value_qualifier"],
+            param_prefix,
         )
 
         if field_info["search_level"]["alias"] != field_info["subquery"]["alias"]:
@@ -294,7 +492,7 @@ class QueryBuilder:
             f"{exists_keyword} ( "
             f"{field_info['subquery']['sql']} "
             f"WHERE {field_info['subquery']['alias']}.{key}="
-            f"{field_info['search_level']['alias']}{field_info['search_level']['alias']}.id "
+            f"{field_info['search_level']['base_alias']}.id "
             f"AND {field_info['subquery']['property_filter']}"
         )
 
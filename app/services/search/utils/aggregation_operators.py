@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from app.utils.enums import AggregationNumericOp, AggregationStringOp
 
 
@@ -32,11 +34,12 @@ class AggregationOperators:
     }
 
     @classmethod
+    @lru_cache(maxsize=256)
     def get_sql_expression(cls, operator: str | None, column: str, condition: str) -> str:
         if not operator:
             return f"MAX({column})"
 
-        try:
-            return cls.OPERATORS[operator].format(column=column)
-        except KeyError:
+        template = cls.OPERATORS.get(operator)
+        if template is None:
             raise ValueError(f"Unsupported operator: {operator}")
+        return template.format(column=column)
@@ -1,22 +1,31 @@
 import csv
 from datetime import datetime
 import decimal
-from io import BytesIO, StringIO
-import json
+from functools import lru_cache
+from io import StringIO
+import orjson
 import re
-from typing import Any, Dict, List
-import uuid
+from typing import Any, Dict, List, Tuple
 from fastapi import Response
-import pandas as pd
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from app.models import Level, Aggregation
+from app.models import Level, Aggregation, DB_SCHEMA
 from app.utils import enums
 
 
-def get_qualifier_sql(field: str):
-    qualifier_sql = f"MAX(CASE {field} WHEN 0 THEN '' WHEN 1 THEN '<' WHEN 2 THEN '>' END)"
-    return qualifier_sql
+# Only the qualifier column varies, so the CASE over the ValueQualifier codes is laid out once
+_QUALIFIER_SQL_TMPL = (
+    "MAX(CASE {field}"
+    f" WHEN {enums.ValueQualifier.EQUALS.value} THEN ''"
+    f" WHEN {enums.ValueQualifier.LESS_THAN.value} THEN '<'"
+    f" WHEN {enums.ValueQualifier.GREATER_THAN.value} THEN '>' END)"
+)
+
+
+@lru_cache(maxsize=128)
+def get_qualifier_sql(field: str) -> str:
+    return _QUALIFIER_SQL_TMPL.format(field=field)
 
 
 def get_identity_field(level: Level) -> str:
@@ -26,19 +35,15 @@ def get_identity_field(level: Level) -> str:
 
 
 def create_alias_mapping(columns: List[str], aggregations: List[Aggregation]) -> Dict[str, str]:
+    # sanitize_field_name is memoized, so repeated requests do not re-run its regex
     output_aliases = {sanitize_field_name(field): (field, (field, None)) for field in columns}
-    output_aliases.update(
-        {
-            sanitize_field_name(agg.field, agg.operation): (
-                f"{agg.operation.value}({agg.field})",
-                (agg.field, agg.operation.value),
-            )
-            for agg in aggregations
-        }
-    )
+    for agg in aggregations:
+        field, operation = agg.field, agg.operation.value
+        output_aliases[sanitize_field_name(field, operation)] = (f"{operation}({field})", (field, operation))
     return output_aliases
 
 
+@lru_cache(maxsize=None)
 def create_alias(table: Level) -> str:
     if table != enums.SearchEntityType.ASSAY_RUNS.value:
         name_parts = table.split("_")
@@ -52,7 +57,19 @@ def create_alias(table: Level) -> str:
         return "rn"
 
 
+_SINGULAR = {
+    "compounds": "compound",
+    "batches": "batch",
+    "assays": "assay",
+    "assay_runs": "assay_run",
+    "assay_results": "assay_result",
+}
+
+
 def singularize(word: str) -> str:
+    singular = _SINGULAR.get(word)
+    if singular is not None:
+        return singular
     if word.endswith("es"):
         return word[:-2]
     elif word.endswith("s"):
@@ -69,25 +86,56 @@ def has_value_qualifier(table_name: str, session: Session):
     return "value_qualifier" in details_columns
 
 
+# engine -> {table name: column names} for every table of DB_SCHEMA; the schema does not change while the app is running
+_schema_columns_cache: Dict[Any, Dict[str, Tuple[str, ...]]] = {}
+
+_SCHEMA_COLUMNS_SQL = text(
+    "SELECT c.relname, a.attname FROM pg_catalog.pg_attribute a "
+    "JOIN pg_catalog.pg_class c ON c.oid = a.attrelid "
+    "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+    "WHERE n.nspname = :schema AND c.relkind IN ('r', 'v', 'm', 'p') AND a.attnum > 0 AND NOT a.attisdropped "
+    "ORDER BY c.relname, a.attnum"
+)
+
+
+def get_schema_columns(session: Session) -> Dict[str, Tuple[str, ...]]:
+    """
+    Columns of every table in the schema, read in a single catalog query the first time an engine is seen.
+    Call clear_table_columns_cache() after a schema change.
+    """
+
+    bind = session.get_bind()
+    columns = _schema_columns_cache.get(bind)
+    if columns is None:
+        grouped: Dict[str, List[str]] = {}
+        for table_name, column_name in session.execute(_SCHEMA_COLUMNS_SQL, {"schema": DB_SCHEMA}).fetchall():
+            grouped.setdefault(table_name, []).append(column_name)
+        columns = _schema_columns_cache[bind] = {table: tuple(names) for table, names in grouped.items()}
+    return columns
+
+
 def get_table_columns(table_name: str, session: Session) -> list:
     """
     Get the columns of a table in the database.
     """
 
-    result = session.execute(
-        text("SELECT column_name FROM information_schema.columns WHERE table_name = :table_name"),
-        {"table_name": table_name},
-    )
-    columns = [row[0] for row in result.fetchall()]
-    return columns
+    return list(get_schema_columns(session).get(table_name, ()))
+
+
+def clear_table_columns_cache():
+    _schema_columns_cache.clear()
+
 
+_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9_]")
 
+
+@lru_cache(maxsize=4096)
 def sanitize_field_name(field_name: str, agg_op: str = None) -> str:
     """Sanitize field name for use in SQL aliases"""
     # Replace dots and special characters with underscores
-    sanitized = re.sub(r"[^a-zA-Z0-9_]", "_", field_name)
+    sanitized = _SANITIZE_RE.sub("_", field_name)
     # Ensure it doesn't start with a number
-    if sanitized and sanitized[0].isdigit():
+    if sanitized[:1].isdigit():
         sanitized = f"field_{sanitized}"
     if agg_op:
         agg_op = agg_op.replace(" ", "_")
@@ -102,50 +150,93 @@ def convert_datetime(obj):
     return obj
 
 
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, uuid.UUID):
-            return str(o)
-        if isinstance(o, datetime):
-            return o.isoformat()
-        if isinstance(o, decimal.Decimal):
-            return float(o)
-        return super().default(o)
+# Exact type -> encoder for the values orjson does not handle natively
+_JSON_ENCODERS = {decimal.Decimal: float}
+
+
+def json_default(o):
+    """Serializes the values orjson does not handle natively"""
+    encoder = _JSON_ENCODERS.get(type(o))
+    if encoder is not None:
+        return encoder(o)
+    if isinstance(o, decimal.Decimal):
+        return float(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _iter_csv(results: List[Any], headers: List[str], chunk_size: int = 1000):
+    """Yields the CSV output chunk by chunk so it is never held in memory as a whole"""
+    output = StringIO()
+    writer = csv.writer(output)
+    writer.writerow(headers)
+    for start in range(0, len(results), chunk_size):
+        writer.writerows(results[start : start + chunk_size])
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate(0)
+    if output.tell():
+        yield output.getvalue()
+
+
+def _json_output(results: List[Any], headers: List[str]) -> Response:
+    # orjson serializes UUID and datetime values natively; Decimal goes through json_default
+    header_keys = tuple(headers)
+    return_obj = {
+        "status": "success",
+        "total_count": len(results),
+        "columns": headers,
+        "data": [dict(zip(header_keys, row)) for row in results],
+    }
+    json_output = orjson.dumps(return_obj, default=json_default)
+    return Response(
+        content=json_output,
+        media_type="application/json",
+        headers={"Content-Disposition": "attachment; filename=result.json"},
+    )
+
+
+def _csv_output(results: List[Any], headers: List[str]) -> StreamingResponse:
+    return StreamingResponse(
+        _iter_csv(results, headers),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=result.csv"},
+    )
+
+
+def _parquet_output(results: List[Any], headers: List[str]) -> Response:
+    # Imported on first use so JSON and CSV only workers never load pyarrow
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # Transpose once into columns; from_arrays keeps duplicate headers that a dict would merge
+    columns = zip(*results) if results else ([] for _ in headers)
+    table = pa.Table.from_arrays([pa.array(column) for column in columns], names=headers)
+    sink = pa.BufferOutputStream()
+    pq.write_table(
+        table,
+        sink,
+        compression="zstd",
+        compression_level=1,
+        row_group_size=65536,
+        write_statistics=False,
+    )
+    return Response(
+        # The Arrow buffer is handed over as a memoryview, without copying it into bytes
+        content=memoryview(sink.getvalue()),
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": "attachment; filename=result.parquet"},
+    )
+
+
+_OUTPUT_FORMATTERS = {
+    enums.SearchOutputFormat.json: _json_output,
+    enums.SearchOutputFormat.csv: _csv_output,
+    enums.SearchOutputFormat.parquet: _parquet_output,
+}
 
 
 def prepare_search_output(results: List[Any], headers: List[str], output_format: enums.SearchOutputFormat):
-    match output_format:
-        # UUID objects are not JSON serializable, so convert to str to prevent circular reference errors
-        case enums.SearchOutputFormat.json:
-            return_obj = {
-                "status": "success",
-                "total_count": len(results),
-                "columns": headers,
-                "data": [dict(zip(headers, row)) for row in results],
-            }
-            json_output = json.dumps(return_obj, cls=CustomJSONEncoder)
-            return Response(
-                content=json_output,
-                media_type="application/json",
-                headers={"Content-Disposition": "attachment; filename=result.json"},
-            )
-        case enums.SearchOutputFormat.csv:
-            output = StringIO()
-            writer = csv.writer(output)
-            writer.writerow(headers)
-            writer.writerows(results)
-            csv_content = output.getvalue()
-            return Response(
-                content=csv_content,
-                media_type="text/csv",
-                headers={"Content-Disposition": "attachment; filename=result.csv"},
-            )
-        case enums.SearchOutputFormat.parquet:
-            df = pd.DataFrame(results, columns=headers)
-            buffer = BytesIO()
-            df.to_parquet(buffer, engine="pyarrow", index=False)
-            return Response(
-                content=buffer.getvalue(),
-                media_type="application/octet-stream",
-                headers={"Content-Disposition": "attachment; filename=result.parquet"},
-            )
+    formatter = _OUTPUT_FORMATTERS.get(output_format)
+    if formatter is None:
+        return None
+    return formatter(results, headers)
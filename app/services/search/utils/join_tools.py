@@ -1,5 +1,7 @@
 from collections import deque
-from typing import List
+from functools import lru_cache
+import threading
+from typing import List, Optional
 from app.models import Level
 from app.services.search.utils.helper_functions import create_alias, singularize
 
@@ -13,9 +15,12 @@ class JoinOrderingTool:
     when building dynamic SQL queries.
     """
 
-    def __init__(self):
+    def __init__(self, alias: Optional[str] = None, base_alias: Optional[str] = None):
         self.keys = []
         self.joins = []
+        # Alias of the primary table and the one the main query uses for it instead
+        self.alias = alias
+        self.base_alias = base_alias
 
     def add(self, joins: List[str], keys: List[str]) -> bool:
         for i in range(len(joins)):
@@ -23,8 +28,19 @@ class JoinOrderingTool:
                 self.keys.append(keys[i])
                 self.joins.append(joins[i])
 
-    def getJoinSQL(self) -> str:
-        return " ".join(self.joins) if self.joins else ""
+    def reset(self, alias: Optional[str] = None, base_alias: Optional[str] = None):
+        """Empty the tool for reuse, keeping its lists"""
+        self.keys.clear()
+        self.joins.clear()
+        self.alias = alias
+        self.base_alias = base_alias
+
+    def getJoinSQL(self, doubled: bool = False) -> str:
+        if not self.joins:
+            return ""
+        if doubled:
+            return " ".join(_with_base_alias(join, self.alias, self.base_alias) for join in self.joins)
+        return " ".join(self.joins)
 
     def getLastTableAlias(self) -> str:
         if len(self.keys):
@@ -39,6 +55,35 @@ class JoinOrderingTool:
         return len(self.joins)
 
 
+class JoinToolPool:
+    """Per-thread free list of JoinOrderingTool objects for short-lived use"""
+
+    _local = threading.local()
+    _max_size = 32
+
+    @classmethod
+    def acquire(cls) -> JoinOrderingTool:
+        pool = getattr(cls._local, "pool", None)
+        if pool:
+            return pool.pop()
+        return JoinOrderingTool()
+
+    @classmethod
+    def release(cls, tool: JoinOrderingTool):
+        pool = getattr(cls._local, "pool", None)
+        if pool is None:
+            pool = cls._local.pool = []
+        if len(pool) < cls._max_size:
+            tool.reset()
+            pool.append(tool)
+
+
+@lru_cache(maxsize=1024)
+def _with_base_alias(join: str, alias: str, base_alias: str) -> str:
+    """Join with the primary table referenced through the main query's alias"""
+    return join.replace(f" {alias}.", f" {base_alias}.")
+
+
 class JoinResolutionError(Exception):
     """Custom exception for join resolution errors"""
 
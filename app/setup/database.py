@@ -12,11 +12,26 @@ DB_PORT = os.environ.get("DB_PORT", "5432")
 DB_NAME = os.environ.get("DB_NAME", "moltrack")
 DB_SCHEMA = os.environ.get("DB_SCHEMA", "moltrack")
 
+# Connection pool parameters. The limits apply per worker process: with N server workers the database can see up to
+# N * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections, so keep that below Postgres's max_connections (100 by default).
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+
 # Construct the database URL from the parameters
 SQLALCHEMY_DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 # Create the engine with the appropriate URL
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"options": f"-csearch_path={DB_SCHEMA},public"})
+# LIFO reuse keeps the most recently used connections warm; pre-ping replaces connections dropped by the server
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"options": f"-csearch_path={DB_SCHEMA},public"},
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    pool_use_lifo=True,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -48,7 +48,7 @@ def get_molecule_standardization_config(db: Optional[Session] = None):
     return molecule_standardization_config
 
 
-def standardize_mol(mol: Chem.Mol, db: Optional[Session] = None) -> Chem.Mol:
+def standardize_mol(mol: Chem.Mol, db: Optional[Session] = None, config: Optional[dict] = None) -> Chem.Mol:
     """
     Standardizes a given RDKit molecule using operations defined in the
     molecule standardization settings.
@@ -57,11 +57,13 @@ def standardize_mol(mol: Chem.Mol, db: Optional[Session] = None) -> Chem.Mol:
 
     Args:
         mol (Chem.Mol): The molecule to standardize.
+        config (dict, optional): Already loaded standardization config, used where no database session is available.
 
     Returns:
         Chem.Mol: The standardized molecule after performing all configured operations.
     """
-    config = get_molecule_standardization_config(db).config
+    if config is None:
+        config = get_molecule_standardization_config(db).config
     # Apply only the enabled operations in the order of declaration in the config.
     for operation in config.get("operations", []):
         operation_type = operation.get("type")
@@ -1,13 +1,29 @@
 import enum
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _members_by_lower_value(enum_class) -> dict:
+    """Lowercased value -> member, first member winning as in a linear scan"""
+    members = {}
+    for member in enum_class:
+        members.setdefault(member.value.lower(), member)
+    return members
+
+
+@lru_cache(maxsize=None)
+def _members_by_value(enum_class) -> dict:
+    members = {}
+    for member in enum_class:
+        members.setdefault(member.value, member)
+    return members
 
 
 class CaseInsensitiveEnum(str, enum.Enum):
     @classmethod
     def _missing_(cls, value):
         if isinstance(value, str):
-            for member in cls:
-                if member.value.lower() == value.lower():
-                    return member
+            return _members_by_lower_value(cls).get(value.lower())
         return None
 
 
@@ -184,10 +200,7 @@ class AggregationStringOp(str, enum.Enum):
 
 def lowercase_enum_values(enum_class, value):
     if isinstance(value, str):
-        v_norm = value.strip().upper()
-        for member in enum_class:
-            if member.value == v_norm:
-                return member
+        return _members_by_value(enum_class).get(value.strip().upper())
     return None
 
 
@@ -1,40 +1,12 @@
-from typing import List, Dict, Any
-from psycopg2.extensions import adapt
+import enum
+import io
+from datetime import date, datetime
+from typing import List, Dict, Any, Optional
+from sqlalchemy import Column, Integer, Table, text
+from sqlalchemy.exc import DBAPIError
 from sqlmodel import SQLModel
 from app.utils import enums
 
-column_types = {
-    "value_datetime": "timestamptz",
-    "value_num": "double precision",
-    "value_uuid": "uuid",
-    "value_string": "text",
-    "value_bool": "boolean",
-    "value_qualifier": "smallint",
-}
-
-
-def values_sql(data: List[Dict[str, Any]], columns: List[str]) -> str:
-    def escape_val(val, col_name):
-        if val is None:
-            sql_type = column_types.get(col_name)
-            if sql_type:
-                return f"NULL::{sql_type}"
-            return "NULL"
-        return adapt(val).getquoted().decode()
-
-    rows = []
-    for row in data:
-        values = [escape_val(row.get(col), col) for col in columns]
-        rows.append(f"({', '.join(values)})")
-    return ",\n".join(rows)
-
-
-def prepare_sql_parts(records: List[Dict[str, Any]]):
-    cols = list(records[0].keys())
-    key, *cols_without_key = cols
-    values_to_sql = values_sql(records, cols)
-    return cols_without_key, values_to_sql
-
 
 def generate_sql(*sql_parts: str, terminate_with_select: bool = True) -> str:
     filtered_parts = [part.strip() for part in sql_parts if part and part.strip()]
@@ -45,6 +17,81 @@ def generate_sql(*sql_parts: str, terminate_with_select: bool = True) -> str:
     return combined_sql
 
 
+# Join key for rows matched by their position in the chunk (the assay registrars' "rn")
+ROW_NUMBER_KEY = Column("rn", Integer)
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def copy_value(val: Any) -> str:
+    """Render a value for COPY ... FROM STDIN in Postgres' text format."""
+    if val is None:
+        return "\\N"
+    if isinstance(val, enum.Enum):
+        val = val.value
+    if isinstance(val, bool):
+        return "t" if val else "f"
+    if isinstance(val, (datetime, date)):
+        return val.isoformat()
+    return str(val).translate(_COPY_ESCAPES)
+
+
+def copy_to_temp_table(
+    db, temp_table: str, records: List[Dict[str, Any]], table: Table, key: Optional[Column] = None
+) -> List[str]:
+    """
+    Bulk-load `records` into a temporary table (dropped on commit) using COPY instead of inlined VALUES.
+    The temporary table is created from `table` by the database itself, so its column types are those of
+    the real columns (e.g. CHAR(40), timestamptz) rather than the ones declared on the model.
+    When `key` is given, the first value of every record is loaded into a leading column named after `key`
+    (the join key used by the registration CTEs).
+    A key belonging to a table is typed like that column; a standalone Column is typed by its own type.
+    Returns the names of the non-key columns.
+    """
+    record_keys = list(records[0].keys())
+    value_cols = record_keys[1:] if key is not None else record_keys
+
+    select_cols = [f"t.{col}" for col in value_cols]
+    source = f"{table.fullname} t"
+    if key is not None:
+        if getattr(key, "table", None) is not None:
+            select_cols.insert(0, f"k.{key.name}")
+            source += f" CROSS JOIN {key.table.fullname} k"
+        else:
+            key_type = key.type.compile(dialect=db.get_bind().dialect)
+            select_cols.insert(0, f"CAST(NULL AS {key_type}) AS {key.name}")
+    db.execute(
+        text(
+            f"CREATE TEMP TABLE {temp_table} ON COMMIT DROP AS SELECT {', '.join(select_cols)} FROM {source} WITH NO DATA"
+        )
+    )
+
+    buffer = io.StringIO()
+    for row in records:
+        buffer.write("\t".join(copy_value(row.get(col)) for col in record_keys))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    target_cols = ([key.name] if key is not None else []) + value_cols
+    copy_from_stdin(db, f"COPY {temp_table} ({', '.join(target_cols)}) FROM STDIN", buffer)
+    return value_cols
+
+
+def copy_from_stdin(db, copy_sql: str, buffer: io.StringIO):
+    """
+    Run a COPY ... FROM STDIN on the session's connection, inside its current transaction.
+    SQLAlchemy has no COPY API, so the driver connection is used directly; driver errors are wrapped in
+    sqlalchemy.exc.DBAPIError so callers see the same exceptions as from Session.execute.
+    """
+    connection = db.connection()
+    dbapi_error = connection.dialect.loaded_dbapi.Error
+    try:
+        with connection.connection.driver_connection.cursor() as cursor:
+            cursor.copy_expert(copy_sql, buffer)
+    except dbapi_error as e:
+        raise DBAPIError.instance(copy_sql, None, e, dbapi_error, dialect=connection.dialect) from e
+
+
 def chunked(lst, size):
     for i in range(0, len(lst), size):
         yield lst[i : i + size]
@@ -2,10 +2,9 @@ import json
 from typing import Optional
 import typer
 
-from app import models
 from client.config import settings
 from client.utils.api_helpers import handle_delete_request, handle_get_request, handle_put_request, make_headers
-from client.utils.data_ingest import report_csv_information, send_csv_upload_request
+from client.utils.data_ingest import report_csv_information, send_csv_upload_in_chunks, send_csv_upload_request
 from client.utils.display import display_additions_table
 from client.utils.file_utils import (
     load_and_validate_json,
@@ -20,20 +19,24 @@ ADDITIONS_ENDPOINTS = {
 }
 
 
-def register_additions_commands(app: typer.Typer):
-    for cmd_name, (endpoint_suffix, description) in ADDITIONS_ENDPOINTS.items():
+def _make_list_command(endpoint_suffix: str):
+    """List command for one additions endpoint; the suffix is closed over so it is not exposed as a CLI option"""
+
+    def command_func(
+        url: str = settings.API_BASE_URL,
+        output_format: str = typer.Option("table", "--output-format", "-o", help="Output format: table or json"),
+        output_file: str = typer.Option(None, "--output-file", "-of", help="Path to output file"),
+    ):
+        endpoint = f"{url}/v1/additions{endpoint_suffix}"
+        data = handle_get_request(endpoint, make_headers())
+        output_data(data, output_format, output_file, display_additions_table)
 
-        def command_func(
-            url: str = settings.API_BASE_URL,
-            output_format: str = typer.Option("table", "--output-format", "-o", help="Output format: table or json"),
-            output_file: str = typer.Option(None, "--output-file", "-of", help="Path to output file"),
-            _endpoint_suffix=endpoint_suffix,
-        ):
-            endpoint = f"{url}/v1/additions{_endpoint_suffix}"
-            data = handle_get_request(endpoint, make_headers())
-            output_data(data, output_format, output_file, display_additions_table)
+    return command_func
 
-        app.command(cmd_name, help=description)(command_func)
+
+def register_additions_commands(app: typer.Typer):
+    for cmd_name, (endpoint_suffix, description) in ADDITIONS_ENDPOINTS.items():
+        app.command(cmd_name, help=description)(_make_list_command(endpoint_suffix))
 
 
 additions_app = typer.Typer()
@@ -52,6 +55,8 @@ def update_addition(
     """
     Update information for the specified addition.
     """
+    from app import models
+
     # Load and validate the update data
     update_data = load_and_validate_json(file_path, models.AdditionUpdate)
     endpoint = f"{url}/v1/additions/{addition_id}"
@@ -97,6 +102,10 @@ def add_additions_from_csv(
     url: str = settings.API_BASE_URL,
     dry_run: bool = typer.Option(False, "--dry-run", help="Validate data without sending to server"),
     save_errors: bool = typer.Option(False, "--save-errors", help="Save error records to a JSON file"),
+    chunk_size: Optional[int] = typer.Option(
+        None, "--chunk-size", min=1, help="Send the rows in requests of this many rows instead of all at once"
+    ),
+    concurrency: int = typer.Option(4, "--concurrency", min=1, help="Maximum number of chunks sent at the same time"),
 ):
     """
     Add additions from a CSV file.
@@ -107,6 +116,8 @@ def add_additions_from_csv(
         url: API base URL. Defaults to settings.API_BASE_URL.
         dry_run: Validate data without sending it.
         save_errors: Save errors to JSON file.
+        chunk_size: Optional number of rows per request.
+        concurrency: Maximum number of concurrent chunk requests.
     """
     # Use utility functions for common steps
     csv_path, csv_data = validate_and_load_csv_data(csv_file, "additions", rows)
@@ -116,6 +127,20 @@ def add_additions_from_csv(
         typer.echo("✅ Dry run completed successfully!")
         return
 
+    if chunk_size:
+        send_csv_upload_in_chunks(
+            csv_path=csv_path,
+            csv_data=csv_data,
+            url=url,
+            endpoint="/v1/additions/",
+            headers=make_headers(),
+            entity_type="additions",
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            save_errors=save_errors,
+        )
+        return
+
     # Send the request using utility function
     send_csv_upload_request(
         csv_path=csv_path,
@@ -1,10 +1,10 @@
 import json
-import requests
 import typer
 
 from client.config import settings
 from app.utils import enums
 from client.utils.api_helpers import make_headers
+from client.utils.http_session import SESSION
 
 admin_app = typer.Typer()
 
@@ -12,7 +12,7 @@ admin_app = typer.Typer()
 def _update_admin_setting(name: enums.SettingName | str, value: str | int, url: str = settings.API_BASE_URL):
     """Helper for updating admin settings."""
     payload = {"name": name.value if hasattr(name, "value") else name, "value": value}
-    response = requests.patch(f"{url}/v1/admin/settings", data=payload, headers=make_headers())
+    response = SESSION.patch(f"{url}/v1/admin/settings", data=payload, headers=make_headers())
     response_dict = response.json()
 
     if response.ok:
@@ -1,4 +1,3 @@
-import requests
 import typer
 
 from client.config import settings
@@ -6,6 +5,7 @@ from client.utils.api_helpers import make_headers, print_response
 from client.utils.display import display_assays_table
 from client.utils.file_utils import load_and_validate_json
 from client.cli.shared import EntityCLI
+from client.utils.http_session import SESSION
 
 
 assays_app = typer.Typer()
@@ -36,7 +36,7 @@ class AssaysCLI(EntityCLI):
         Load assays from a JSON file using the /v1/assays endpoint.
         """
         assay_data = load_and_validate_json(file_path)
-        response = requests.post(f"{url}/{self.get_endpoint()}", json=assay_data, headers=headers)
+        response = SESSION.post(f"{url}/{self.get_endpoint()}", json=assay_data, headers=headers)
         print_response(response)
 
     def register_commands(self, app: typer.Typer):
@@ -1,3 +1,4 @@
+from functools import lru_cache
 import getpass
 import typer
 from client.config import settings
@@ -11,8 +12,11 @@ auth_app = typer.Typer(help="Authentication commands (login/logout)")
 
 def save_api_key(api_key: str):
     keyring.set_password(SERVICE_NAME, USERNAME, api_key)
+    get_api_key.cache_clear()
 
 
+# Each keyring read is an IPC call to the system secret store, so the key is read once per process
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
     key = keyring.get_password(SERVICE_NAME, USERNAME)
     if not key:
@@ -21,6 +25,7 @@ def get_api_key() -> str:
 
 
 def delete_api_key():
+    get_api_key.cache_clear()
     try:
         keyring.delete_password(SERVICE_NAME, USERNAME)
         typer.echo("✅ API key removed.")
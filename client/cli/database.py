@@ -1,29 +1,48 @@
-from sqlalchemy import text
-from sqlmodel import SQLModel
+from functools import lru_cache
 import typer
 
 from client.config import settings
-from client.utils.api_helpers import get_table_row_counts
+from client.utils.api_helpers import get_database, get_table_row_counts
 from client.utils.display import display_data_table, display_database_stats_table
 
-try:
-    from app.setup.database import engine, DB_SCHEMA
-except ImportError:
-    engine = None
-    DB_SCHEMA = None
-
 database_app = typer.Typer()
 
+_TABLES_TO_PRESERVE = ("semantic_types", "settings", "users", "api_keys")
+
+
+@lru_cache(maxsize=1)
+def _delete_properties_sql():
+    """Delete all properties except corporate_compound_id and corporate_batch_id"""
+    from sqlalchemy import text
+
+    return text("""
+        DELETE FROM properties
+        WHERE name NOT IN ('corporate_compound_id', 'corporate_batch_id')
+    """)
+
+
+@lru_cache(maxsize=1)
+def _tables_in_dependency_order() -> tuple[str, ...]:
+    """Table names with child tables first; the model metadata does not change at runtime, so it is sorted once"""
+    from sqlmodel import SQLModel
+
+    import app.models  # noqa: F401 - registers the tables on SQLModel.metadata
+
+    return tuple(t.name for t in reversed(SQLModel.metadata.sorted_tables))
+
 
 # Database Commands
 @database_app.command("stats")
-def database_stats():
+def database_stats(
+    exact: bool = typer.Option(False, "--exact", help="Count rows exactly instead of using planner estimates"),
+):
     """
     Show database table statistics with row counts.
     """
     try:
         # Get row counts for all tables using shared utility
-        row_counts = get_table_row_counts()
+        row_counts = get_table_row_counts(approximate=not exact)
+        _, DB_SCHEMA = get_database()
 
         # Convert to the format expected by display function
         table_stats = [(DB_SCHEMA, table_name, count) for table_name, count in row_counts.items()]
@@ -39,6 +58,9 @@ def database_stats():
 @database_app.command("clean")
 def database_clean(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt"),
+    with_counts: bool = typer.Option(
+        False, "--with-counts", help="Count rows before deleting even when --force skips the confirmation"
+    ),
     url: str = settings.API_BASE_URL,
 ):
     """
@@ -46,61 +68,58 @@ def database_clean(
 
     All assay, batch, compound, and property data are removed,
     while semantic_types, settings, and users are preserved.
+    With --force the pre-delete row counts are skipped unless --with-counts is given.
+    The clean runs as one transaction with synchronous_commit off, so a server crash
+    right after it finishes may lose the clean; rerun it if that happens.
     """
 
     try:
         # Tables to preserve
-        tables_to_preserve = ["semantic_types", "settings", "users", "api_keys"]
+        tables_to_preserve = _TABLES_TO_PRESERVE
 
         # Tables to clean in dependency order (child tables first)
-        tables_in_dependency_order = reversed(SQLModel.metadata.sorted_tables)
-        tables_to_clean = [t.name for t in tables_in_dependency_order if t.name not in tables_to_preserve]
+        tables_to_clean = [name for name in _tables_in_dependency_order() if name not in tables_to_preserve]
         tables_to_clean.append("rdk.mols")  # Include the rdkit mols table
 
         # Show what will be cleaned
         typer.echo("🗑️  Database Clean Operation")
         typer.echo("=" * 50)
         typer.echo("Tables to be cleaned (in dependency order):")
-        for i, table in enumerate(tables_to_clean, 1):
-            typer.echo(f"  {i:2d}. {table}")
+        typer.echo("\n".join(f"  {i:2d}. {table}" for i, table in enumerate(tables_to_clean, 1)))
 
         typer.echo("\nTables to be preserved:")
-        for table in tables_to_preserve:
-            typer.echo(f"  ✓ {table}")
-
-        # Get row counts before deletion
-        typer.echo("\n📊 Getting current row counts...")
-        row_counts = get_table_row_counts(tables_to_clean)
-
-        # Display current row counts in a rich table
-        typer.echo("\nCurrent row counts:")
-        table_data = [
-            {"table": table, "count": row_counts[table]} for table in tables_to_clean if row_counts[table] > 0
-        ]
-
-        if table_data:
-            # TODO: look for optimizations
-            # Create rich table for row counts
-            columns = [("Table Name", "cyan", {"no_wrap": True}), ("Row Count", "red", {"justify": "right"})]
-
-            def extract_count_row(item):
-                return [item["table"], f"{item['count']:,}"]
-
-            display_data_table(
-                data=table_data,
-                title="Tables to be cleaned",
-                columns=columns,
-                row_extractor=extract_count_row,
-                show_total=True,
-                total_label="TOTAL ROWS TO DELETE",
-            )
-        else:
-            typer.echo("  No tables have data to delete.")
-
-        total_rows = sum(row_counts.values())
-        if total_rows == 0:
-            typer.echo("\n✅ Database is already clean - no rows to delete.")
-            return
+        typer.echo("\n".join(f"  ✓ {table}" for table in tables_to_preserve))
+
+        # Counting every table is only needed to show the user what they are confirming
+        count_rows = not force or with_counts
+        row_counts = {}
+        if count_rows:
+            # Get row counts before deletion
+            typer.echo("\n📊 Getting current row counts...")
+            row_counts = get_table_row_counts(tables_to_clean)
+
+            # Display current row counts in a rich table
+            typer.echo("\nCurrent row counts:")
+            table_data = [(table, f"{row_counts[table]:,}") for table in tables_to_clean if row_counts[table] > 0]
+
+            if table_data:
+                # Create rich table for row counts
+                columns = [("Table Name", "cyan", {"no_wrap": True}), ("Row Count", "red", {"justify": "right"})]
+
+                display_data_table(
+                    data=table_data,
+                    title="Tables to be cleaned",
+                    columns=columns,
+                    show_total=True,
+                    total_label="TOTAL ROWS TO DELETE",
+                )
+            else:
+                typer.echo("  No tables have data to delete.")
+
+            total_rows = sum(row_counts.values())
+            if total_rows == 0:
+                typer.echo("\n✅ Database is already clean - no rows to delete.")
+                return
 
         # Confirm unless --force is used
         if not force:
@@ -114,63 +133,78 @@ def database_clean(
         typer.echo("\n🧹 Starting database cleanup...")
         deleted_counts = {}
 
-        with engine.connect() as connection:
+        tables_to_truncate = [
+            table for table in tables_to_clean if table != "properties" and (not count_rows or row_counts[table] > 0)
+        ]
+
+        # One transaction for the whole clean; the context manager commits it on success
+        from sqlalchemy import text
+
+        engine, _ = get_database()
+        with engine.connect() as connection, connection.begin():
+            # A throwaway bulk delete does not need a WAL flush per statement, only at the final commit
+            connection.execute(text("SET LOCAL synchronous_commit = off"))
+
+            # One TRUNCATE for all tables takes the locks once and saves a round trip per table
+            truncated = False
+            if tables_to_truncate:
+                quote = connection.dialect.identifier_preparer.quote
+                table_list = ", ".join(
+                    ".".join(quote(part) for part in table.split(".")) for table in tables_to_truncate
+                )
+                typer.echo(f"  Truncating {len(tables_to_truncate)} tables...", nl=False)
+                try:
+                    # Savepoint so a failed TRUNCATE does not abort the rest of the clean
+                    with connection.begin_nested():
+                        connection.execute(text(f"TRUNCATE TABLE {table_list} RESTART IDENTITY CASCADE"))
+                    typer.echo(" ✅")
+                    truncated = True
+                except Exception as e:
+                    typer.echo(f" ❌ Error: {e}")
+                    truncated = False
+
+            # Status lines are collected and written once for the whole phase
+            status_lines = []
             for table in tables_to_clean:
-                count = row_counts[table]
-                if count > 0:
+                count = row_counts.get(table)
+                if count == 0:
+                    status_lines.append(f"  Skipping {table} (already empty)")
+                    deleted_counts[table] = 0
+                elif table == "properties":
                     try:
-                        typer.echo(f"  Deleting from {table}...", nl=False)
-
-                        # Special handling for properties table to preserve corporate IDs
-                        if table == "properties":
-                            # Delete all properties except corporate_compound_id and corporate_batch_id
-                            delete_query = text("""
-                                DELETE FROM properties
-                                WHERE name NOT IN ('corporate_compound_id', 'corporate_batch_id')
-                            """)
-                            result = connection.execute(delete_query)
-                            deleted_count = result.rowcount
-                        else:
-                            # Use TRUNCATE for better performance on large tables
-                            # TRUNCATE is faster than DELETE as it doesn't generate individual row events
-                            delete_query = text(f"TRUNCATE TABLE {table} RESTART IDENTITY CASCADE")
-                            connection.execute(delete_query)
-                            # TRUNCATE doesn't return rowcount, so use the pre-operation count
-                            deleted_count = count
-
-                        deleted_counts[table] = deleted_count
-                        typer.echo(f" ✅ {deleted_count:,} rows deleted")
+                        with connection.begin_nested():
+                            result = connection.execute(_delete_properties_sql())
+                        deleted_counts[table] = result.rowcount
+                        status_lines.append(f"  Deleting from {table}... ✅ {result.rowcount:,} rows deleted")
                     except Exception as e:
-                        typer.echo(f" ❌ Error: {e}")
+                        status_lines.append(f"  Deleting from {table}... ❌ Error: {e}")
                         deleted_counts[table] = 0
+                elif count is None:
+                    status_lines.append(f"  {table}: {'cleaned' if truncated else 'not cleaned'}")
                 else:
-                    typer.echo(f"  Skipping {table} (already empty)")
-                    deleted_counts[table] = 0
-
-            # Commit the transaction after all deletions are complete
-            connection.commit()
+                    # TRUNCATE doesn't return rowcount, so use the pre-operation count
+                    deleted_counts[table] = count if truncated else 0
+                    status_lines.append(f"  {table}: {deleted_counts[table]:,} rows deleted")
+            typer.echo("\n".join(status_lines))
 
         # Summary
         typer.echo("\n✅ Database cleanup completed!")
 
+        if not count_rows:
+            typer.echo("Row counts were not collected (use --with-counts to report them).")
+            return
+
         # Create summary table for deleted rows
-        summary_data = [
-            {"table": table, "deleted": deleted_counts[table]} for table in tables_to_clean if deleted_counts[table] > 0
-        ]
+        summary_data = [(table, f"{deleted_counts[table]:,}") for table in tables_to_clean if deleted_counts[table] > 0]
 
         if summary_data:
-            # TODO: look for optimizations
             typer.echo("\nSummary of deleted rows:")
             columns = [("Table Name", "cyan", {"no_wrap": True}), ("Rows Deleted", "green", {"justify": "right"})]
 
-            def extract_summary_row(item):
-                return [item["table"], f"{item['deleted']:,}"]
-
             display_data_table(
                 data=summary_data,
                 title="Deletion Summary",
                 columns=columns,
-                row_extractor=extract_summary_row,
                 show_total=True,
                 total_label="TOTAL ROWS DELETED",
             )
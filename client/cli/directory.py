@@ -1,4 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import io
 from pathlib import Path
+import sys
+import threading
 import typer
 
 from client.cli.assays import assays_cli, assay_runs_cli, assay_results_cli
@@ -12,6 +17,60 @@ from client.utils.api_helpers import make_headers
 directory_app = typer.Typer()
 
 
+class _ThreadBufferedStream(io.TextIOBase):
+    """
+    Stands in for sys.stdout / sys.stderr while a wave of loads runs concurrently.
+    Threads that set a buffer on `local` write into it; any other thread writes straight to the wrapped stream.
+    """
+
+    def __init__(self, stream, local: threading.local):
+        self._stream = stream
+        self._local = local
+
+    def write(self, text):
+        if not isinstance(text, str):
+            raise TypeError(f"write() argument must be str, not {type(text).__name__}")
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            return self._stream.write(text)
+        buffer.append((self._stream, text))
+        return len(text)
+
+    def flush(self):
+        if getattr(self._local, "buffer", None) is None:
+            self._stream.flush()
+
+    def isatty(self):
+        return self._stream.isatty()
+
+    @property
+    def encoding(self):
+        return self._stream.encoding
+
+
+@contextmanager
+def _buffered_thread_output():
+    """
+    Route stdout and stderr through _ThreadBufferedStream, so that each concurrent load can collect its
+    output and the wave prints it task by task instead of interleaved.
+    """
+    local = threading.local()
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = _ThreadBufferedStream(stdout, local), _ThreadBufferedStream(stderr, local)
+    try:
+        yield local
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+
+def _run_buffered(local: threading.local, buffer: list, fn, *args):
+    local.buffer = buffer
+    try:
+        return fn(*args)
+    finally:
+        local.buffer = None
+
+
 @directory_app.command("load")
 def load_directory(
     directory_path: str = typer.Argument(..., help="Path to the directory containing files to load"),
@@ -35,6 +94,9 @@ def load_directory(
     typer.echo(f"📁 Loading contents from directory: {directory_path}")
     typer.echo("=" * 60)
 
+    # Every file is sent with the same credentials, so the headers are built once for the run
+    headers = make_headers()
+
     # Generic loader function
     def load_file(file_name, loader_fn, mapping_name=None, is_schema=False):
         file_path = directory / file_name
@@ -56,13 +118,13 @@ def load_directory(
 
         try:
             if loader_fn == load_assays_wrapper:
-                loader_fn(file_path=str(file_path), headers=make_headers(), url=url)
+                loader_fn(file_path=str(file_path), headers=headers, url=url)
             elif is_schema:
                 loader_fn(str(file_path), url)
             else:
                 loader_fn(
                     csv_file=str(file_path),
-                    headers=make_headers(),
+                    headers=headers,
                     mapping_file=mapping_path,
                     url=url,
                     error_handling=error_handling,
@@ -78,21 +140,44 @@ def load_directory(
     def load_assays_wrapper(file_path, url, headers, **kwargs):
         assays_cli.load_assays(file_path=file_path, url=url, headers=headers)
 
-    tasks = [
-        ("compounds_schema.json", add_schema_from_file, None, True),
-        ("compounds.csv", compound_cli.load_entity, "compounds_mapping.json", False),
-        ("batches_schema.json", add_schema_from_file, None, True),
-        ("batches.csv", batch_cli.load_entity, "batches_mapping.json", False),
-        ("assays_schema.json", add_schema_from_file, None, True),
-        ("assay_runs_schema.json", add_schema_from_file, None, True),
-        ("assay_results_schema.json", add_schema_from_file, None, True),
-        ("assays.json", load_assays_wrapper, None, False),
-        ("assay_runs.csv", assay_runs_cli.load_entity, "assay_runs_mapping.json", False),
-        ("assay_results.csv", assay_results_cli.load_entity, "assay_results_mapping.json", False),
+    # Files of the same wave do not depend on each other and are loaded concurrently; waves run in order
+    waves = [
+        [
+            ("compounds_schema.json", add_schema_from_file, None, True),
+            ("batches_schema.json", add_schema_from_file, None, True),
+            ("assays_schema.json", add_schema_from_file, None, True),
+            ("assay_runs_schema.json", add_schema_from_file, None, True),
+            ("assay_results_schema.json", add_schema_from_file, None, True),
+        ],
+        [
+            ("compounds.csv", compound_cli.load_entity, "compounds_mapping.json", False),
+            ("assays.json", load_assays_wrapper, None, False),
+        ],
+        [("batches.csv", batch_cli.load_entity, "batches_mapping.json", False)],
+        [("assay_runs.csv", assay_runs_cli.load_entity, "assay_runs_mapping.json", False)],
+        [("assay_results.csv", assay_results_cli.load_entity, "assay_results_mapping.json", False)],
     ]
 
     # Execute all tasks
-    for file_name, loader_fn, mapping_name, is_schema in tasks:
-        load_file(file_name, loader_fn, mapping_name, is_schema)
+    for wave in waves:
+        # Under reject_all the first failure has to stop the files after it, so the wave runs in order
+        if len(wave) == 1 or error_handling == "reject_all":
+            for task in wave:
+                load_file(*task)
+            continue
+        buffers = [[] for _ in wave]
+        with _buffered_thread_output() as local, ThreadPoolExecutor(max_workers=len(wave)) as executor:
+            futures = [
+                executor.submit(_run_buffered, local, buffer, load_file, *task) for task, buffer in zip(wave, buffers)
+            ]
+        # Print each file's output in one piece, in wave order
+        for buffer in buffers:
+            for stream, text in buffer:
+                stream.write(text)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # Re-raise the first unexpected failure once the wave has finished
+        for future in futures:
+            future.result()
 
     typer.echo("\n✅ Directory loading completed!")
@@ -1,11 +1,11 @@
-import json
+import orjson
 import typer
 import requests
 from client.utils.api_helpers import handle_get_request, make_headers
 from client.utils.display import display_properties_table
-from client.utils.file_utils import load_and_validate_json, write_result_to_file
-from app.models import SchemaPayload
+from client.utils.file_utils import load_and_validate_json_bytes, write_result_to_file
 from client.config.settings import settings
+from client.utils.http_session import SESSION
 
 
 SCHEMA_ENDPOINTS = {
@@ -20,21 +20,28 @@ SCHEMA_SYNONYMS_ENDPOINTS = {
 }
 
 
-def register_schema_commands(app: typer.Typer, endpoints: dict, synonym: bool = False):
-    for cmd_name, (endpoint_suffix, description) in endpoints.items():
-
-        def command_func(
-            url: str = settings.API_BASE_URL,
-            output_format: str = typer.Option("table", "--output-format", "-o", help="Output format: table or json"),
-            max_rows: int | None = typer.Option(
-                None, "--max-rows", "-m", help="Maximum number of rows to display in table output"
-            ),
-            output_file: str | None = typer.Option(None, "--output-file", "-of", help="Path to output file"),
-            _endpoint_suffix=endpoint_suffix,
-        ):
-            endpoint = f"{url}/v1/schema{_endpoint_suffix}"
-            get_schema_data(endpoint, make_headers(), output_format, max_rows, output_file, synonym=synonym)
+def _make_schema_command(endpoints: dict, synonym: bool):
+    """One list command shared by every endpoint in the group; the endpoint is looked up by the invoked name"""
+
+    def command_func(
+        ctx: typer.Context,
+        url: str = settings.API_BASE_URL,
+        output_format: str = typer.Option("table", "--output-format", "-o", help="Output format: table or json"),
+        max_rows: int | None = typer.Option(
+            None, "--max-rows", "-m", help="Maximum number of rows to display in table output"
+        ),
+        output_file: str | None = typer.Option(None, "--output-file", "-of", help="Path to output file"),
+    ):
+        endpoint_suffix, _ = endpoints[ctx.info_name]
+        endpoint = f"{url}/v1/schema{endpoint_suffix}"
+        get_schema_data(endpoint, make_headers(), output_format, max_rows, output_file, synonym=synonym)
+
+    return command_func
 
+
+def register_schema_commands(app: typer.Typer, endpoints: dict, synonym: bool = False):
+    command_func = _make_schema_command(endpoints, synonym)
+    for cmd_name, (_, description) in endpoints.items():
         app.command(cmd_name, help=description)(command_func)
 
 
@@ -82,17 +89,20 @@ def add_schema_from_file(
         ]
     }
     """
+    from app.models import SchemaPayload
+
     # Load and validate schema using utility function
-    schema_data = load_and_validate_json(file_path, SchemaPayload)
-    typer.echo(schema_data)
+    schema_content, schema = load_and_validate_json_bytes(file_path, SchemaPayload)
 
     # Send request to server
     try:
         typer.echo(f"Adding schema from file '{file_path}' to {url}...")
-        response = requests.post(f"{url}/v1/schema", json=schema_data, headers=make_headers())
+        # The validated file is sent as is rather than loaded into Python objects and serialized again
+        headers = {**make_headers(), "Content-Type": "application/json"}
+        response = SESSION.post(f"{url}/v1/schema", data=schema_content, headers=headers)
 
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             typer.echo("✅ Schema added successfully!")
 
             # Report detailed statistics
@@ -124,17 +134,17 @@ def add_schema_from_file(
                         typer.echo(f"⏭️  Synonym types skipped: {synonyms_skipped}")
 
             # Report total counts from input file
-            input_properties = len(schema_data.get("properties", []))
-            input_synonyms = len(schema_data.get("synonym_types", []))
+            input_properties = len(schema.properties)
+            input_synonyms = len(schema.synonym_types)
 
             if input_properties > 0 or input_synonyms > 0:
                 typer.echo(f"📊 Summary: {input_properties} properties and {input_synonyms} synonym types processed")
         else:
             typer.echo(f"❌ Error: {response.status_code}")
             try:
-                error_detail = response.json()
-                typer.echo(f"Details: {json.dumps(error_detail, indent=2)}")
-            except (json.JSONDecodeError, ValueError):
+                error_detail = orjson.loads(response.content)
+                typer.echo(f"Details: {orjson.dumps(error_detail, option=orjson.OPT_INDENT_2).decode()}")
+            except orjson.JSONDecodeError:
                 typer.echo(f"Response: {response.text}")
 
     except requests.exceptions.ConnectionError:
@@ -152,7 +162,7 @@ def get_schema_data(endpoint, headers, output_format, max_rows, output_file, syn
     schema = handle_get_request(endpoint, headers)
 
     if output_format == "json":
-        typer.echo(f"Schema:\n{json.dumps(schema, indent=2)}")
+        typer.echo(f"Schema:\n{orjson.dumps(schema, option=orjson.OPT_INDENT_2).decode()}")
     else:
         if isinstance(schema, list):
             schema_props = schema
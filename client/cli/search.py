@@ -2,7 +2,6 @@ import typer
 
 from client.config import settings
 from client.utils.api_helpers import make_headers, run_advanced_search
-import click
 
 search_app = typer.Typer()
 
@@ -85,57 +84,58 @@ Example usage:
 }
 
 
+def _make_search_command(search_entities: dict):
+    """One search command shared by every entity; the endpoint is looked up by the invoked name"""
+
+    def command_func(
+        ctx: typer.Context,
+        output: str = typer.Option(
+            None,
+            "--output",
+            "-oc",
+            help="Comma-separated list of columns to return or path to JSON file",
+        ),
+        filter: str = typer.Option(None, "--filter", "-f", help="Filter as JSON string or path to JSON file"),
+        aggregations: str = typer.Option(
+            None, "--aggregations", "-a", help="Aggregations as JSON string or path to JSON file"
+        ),
+        url: str = settings.API_BASE_URL,
+        output_format: str = typer.Option("json", "--output-format", "-o", help="Output format: table, json, or csv"),
+        max_rows: int = typer.Option(
+            None, "--max-rows", "-m", help="Maximum number of rows to display in table output"
+        ),
+        input_file: str = typer.Option(None, "--input-file", "-if", help="Get search input from file"),
+        output_file: str = typer.Option(
+            None, "--output-file", "-of", help="File to write output to (json, csv, or parquet)"
+        ),
+    ):
+        entity_name = ctx.info_name
+        validate_mutually_exclusive(ctx)
+        run_advanced_search(
+            entity_name,
+            search_entities[entity_name]["endpoint"],
+            output,
+            aggregations,
+            filter,
+            input_file,
+            url,
+            make_headers(),
+            output_file,
+            output_format,
+            max_rows=max_rows,
+        )
+
+    return command_func
+
+
 def create_search_command(app: typer.Typer, search_entities: dict):
     """
     Dynamically create and register search commands for all entities in search_entities.
     """
 
+    command_func = _make_search_command(search_entities)
     for entity_name, info in search_entities.items():
-        endpoint = info["endpoint"]
-        doc = info["doc"]
-
-        def command_func(
-            output: str = typer.Option(
-                None,
-                "--output",
-                "-oc",
-                help="Comma-separated list of columns to return or path to JSON file",
-            ),
-            filter: str = typer.Option(None, "--filter", "-f", help="Filter as JSON string or path to JSON file"),
-            aggregations: str = typer.Option(
-                None, "--aggregations", "-a", help="Aggregations as JSON string or path to JSON file"
-            ),
-            url: str = settings.API_BASE_URL,
-            output_format: str = typer.Option(
-                "json", "--output-format", "-o", help="Output format: table, json, or csv"
-            ),
-            max_rows: int = typer.Option(
-                None, "--max-rows", "-m", help="Maximum number of rows to display in table output"
-            ),
-            input_file: str = typer.Option(None, "--input-file", "-if", help="Get search input from file"),
-            output_file: str = typer.Option(
-                None, "--output-file", "-of", help="File to write output to (json, csv, or parquet)"
-            ),
-            _endpoint=endpoint,
-            _entity_name=entity_name,
-        ):
-            validate_mutually_exclusive(click.get_current_context())
-            run_advanced_search(
-                _entity_name,
-                _endpoint,
-                output,
-                aggregations,
-                filter,
-                input_file,
-                url,
-                make_headers(),
-                output_file,
-                output_format,
-                max_rows=max_rows,
-            )
-
-        command_func.__doc__ = doc
-        app.command(entity_name, help=doc)(command_func)
+        app.command(entity_name, help=info["doc"])(command_func)
 
 
 create_search_command(search_app, SEARCH_ENTITIES)
@@ -1,19 +1,12 @@
 # client.py
+import importlib
 import sys
 from pathlib import Path
 import typer
+from typer.core import TyperGroup
 
 
-from client.cli.batches import batch_app
-from client.cli.schema import schema_app
-from client.cli.compounds import compound_app
-from client.cli.additions import additions_app
-from client.cli.assays import assays_app
-from client.cli.database import database_app
-from client.cli.directory import directory_app
-from client.cli.search import search_app
-from client.cli.admin import admin_app
-from client.cli.auth import auth_app, global_api_key_option
+from client.cli.auth import global_api_key_option
 
 
 # Add parent directory to Python path for imports
@@ -22,17 +15,54 @@ parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir))
 
 
-app = typer.Typer(callback=global_api_key_option)
-app.add_typer(schema_app, name="schema", help="Schema management commands")
-app.add_typer(compound_app, name="compounds", help="Compound management commands")
-app.add_typer(batch_app, name="batches", help="Batch management commands")
-app.add_typer(additions_app, name="additions", help="Addition management commands")
-app.add_typer(assays_app, name="assays", help="Assays management commands")
-app.add_typer(database_app, name="database", help="Database management commands")
-app.add_typer(directory_app, name="directory", help="Directory loading commands")
-app.add_typer(search_app, name="search", help="Search functionality")
-app.add_typer(admin_app, name="admin", help="Administrative functions")
-app.add_typer(auth_app, name="auth", help="Authentication commands (login/logout)")
+# name -> (module, Typer attribute, help). The sub-apps pull in requests, rich and the server models,
+# so each one is imported only when its command is actually run.
+SUBAPPS = {
+    "schema": ("client.cli.schema", "schema_app", "Schema management commands"),
+    "compounds": ("client.cli.compounds", "compound_app", "Compound management commands"),
+    "batches": ("client.cli.batches", "batch_app", "Batch management commands"),
+    "additions": ("client.cli.additions", "additions_app", "Addition management commands"),
+    "assays": ("client.cli.assays", "assays_app", "Assays management commands"),
+    "database": ("client.cli.database", "database_app", "Database management commands"),
+    "directory": ("client.cli.directory", "directory_app", "Directory loading commands"),
+    "search": ("client.cli.search", "search_app", "Search functionality"),
+    "admin": ("client.cli.admin", "admin_app", "Administrative functions"),
+    "auth": ("client.cli.auth", "auth_app", "Authentication commands (login/logout)"),
+}
+
+
+class LazySubApp(TyperGroup):
+    """
+    Placeholder for a sub-app that only carries its name and help for the top-level listing.
+    Building a context for it (running or completing one of its commands) imports the real sub-app.
+    """
+
+    def __init__(self, name: str, module: str, attr: str, help: str):
+        super().__init__(name=name, help=help)
+        self._module = module
+        self._attr = attr
+        self._loaded = None
+
+    def load(self):
+        if self._loaded is None:
+            sub_app = getattr(importlib.import_module(self._module), self._attr)
+            self._loaded = typer.main.get_group(sub_app)
+            self._loaded.name = self.name
+            self._loaded.help = self._loaded.help or self.help
+        return self._loaded
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        return self.load().make_context(info_name, args, parent=parent, **extra)
+
+
+class LazyGroup(TyperGroup):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for name, (module, attr, help) in SUBAPPS.items():
+            self.add_command(LazySubApp(name, module, attr, help))
+
+
+app = typer.Typer(cls=LazyGroup, callback=global_api_key_option)
 
 if __name__ == "__main__":
     app()
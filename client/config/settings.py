@@ -1,19 +1,43 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
 
 
-class Settings(BaseSettings):
+@lru_cache(maxsize=1)
+def get_settings():
     """
-    Application settings.
+    Build the settings on first use.
+
+    pydantic-settings is imported here rather than at module level so that
+    commands which never read a setting (e.g. --help) skip its import and env scan.
+    """
+    from pydantic_settings import BaseSettings
+
+    class Settings(BaseSettings):
+        """
+        Application settings.
+        """
+
+        API_BASE_URL: str = "http://localhost:8000"
+        API_KEY: str | None = None
+        REQUEST_TIMEOUT: int = 30
+
+        # class Config:
+        #     env_file = ".env"
+        #     env_file_encoding = "utf-8"
+
+    return Settings()
+
+
+class _LazySettings:
+    """
+    Stands in for the settings instance; reads and writes go to get_settings().
     """
 
-    API_BASE_URL: str = "http://localhost:8000"
-    API_KEY: str | None = None
-    REQUEST_TIMEOUT: int = 30
+    def __getattr__(self, name):
+        return getattr(get_settings(), name)
 
-    # class Config:
-    #     env_file = ".env"
-    #     env_file_encoding = "utf-8"
+    def __setattr__(self, name, value):
+        setattr(get_settings(), name, value)
 
 
 # singleton instance
-settings = Settings()
+settings = _LazySettings()
@@ -1,7 +1,6 @@
-import json
+from functools import lru_cache
 from typing import Any, Callable, Dict, Optional
-import requests
-from sqlalchemy import text
+import orjson
 import typer
 from requests.exceptions import RequestException, Timeout
 
@@ -10,27 +9,42 @@ from client.config import settings
 from client.utils.data_ingest import parse_arg
 from client.utils.display import display_search_csv, display_search_table
 from client.utils.file_utils import write_result_to_file, load_input_from_file
+from client.utils.http_session import SESSION
 
-try:
-    from app.models import SearchRequest
-    from app.setup.database import engine, DB_SCHEMA
-except ImportError:
-    SearchRequest = None
-    engine = None
-    DB_SCHEMA = None
+
+# The server packages are slow to import and may be missing in a client-only install,
+# so they are loaded on first use rather than when the CLI starts
+@lru_cache(maxsize=1)
+def get_search_request_model():
+    try:
+        from app.models import SearchRequest
+    except ImportError:
+        return None
+    return SearchRequest
+
+
+@lru_cache(maxsize=1)
+def get_database():
+    """Return (engine, DB_SCHEMA), or (None, None) when the server packages are not available"""
+    try:
+        from app.setup.database import engine, DB_SCHEMA
+    except ImportError:
+        return None, None
+    return engine, DB_SCHEMA
 
 
 def print_response(response):
     if response.status_code == 200:
-        print(response.json())
+        print(orjson.loads(response.content))
     else:
-        print(f"Error: {response.status_code}: {response.json()}")
+        print(f"Error: {response.status_code}: {orjson.loads(response.content)}")
 
 
 def validate_search_request(level, output, filter_obj, aggregations, output_format, limit):
     """
     Validate the search request using the SearchRequest model if available.
     """
+    SearchRequest = get_search_request_model()
     if SearchRequest is not None:
         try:
             req = SearchRequest(
@@ -87,40 +101,50 @@ def run_advanced_search(
             typer.secho("❌ Output file extention must match --output-format", fg=typer.colors.RED, err=True)
             raise typer.Exit(1)
 
-    response = requests.post(f"{url}{endpoint}", json=payload, headers=headers)
+    headers = {**headers, "Content-Type": "application/json"}
+    response = SESSION.post(f"{url}{endpoint}", data=orjson.dumps(payload), headers=headers)
     if response.status_code == 200:
         write_result_to_file(response, cli_output_format, output_file, parsed=False)
         if cli_output_format == "json":
-            resp = response.json()
-            print(json.dumps(response.json(), indent=2))
+            resp = orjson.loads(response.content)
+            print(orjson.dumps(resp, option=orjson.OPT_INDENT_2).decode())
         elif cli_output_format == "csv":
             resp = response.text
             display_search_csv(resp, max_rows=max_rows)
         else:
-            resp = response.json()
+            resp = orjson.loads(response.content)
             display_search_table(resp, max_rows=max_rows)
     else:
         typer.secho(f"❌ Error: {response.status_code}", fg=typer.colors.RED, err=True)
         try:
-            error_detail = response.json()
-            typer.secho(f"Details: {json.dumps(error_detail, indent=2)}", fg=typer.colors.RED, err=True)
+            error_detail = orjson.loads(response.content)
+            typer.secho(
+                f"Details: {orjson.dumps(error_detail, option=orjson.OPT_INDENT_2).decode()}",
+                fg=typer.colors.RED,
+                err=True,
+            )
         except Exception:
             typer.secho(f"Response: {response.text}", fg=typer.colors.RED, err=True)
 
 
-def get_table_row_counts(specific_tables: Optional[list[str]] = None) -> dict[str, int]:
+def get_table_row_counts(specific_tables: Optional[list[str]] = None, approximate: bool = False) -> dict[str, int]:
     """
     Get row counts for database tables.
 
     Args:
         specific_tables: List of specific table names to count. If None, counts all tables.
+        approximate: Read the planner's row estimates from pg_class instead of scanning the tables.
+            Tables that have never been analyzed are still counted exactly.
 
     Returns:
         Dictionary mapping table names to row counts.
     """
+    engine, DB_SCHEMA = get_database()
     if engine is None or DB_SCHEMA is None:
         raise ImportError("Database connection not available - engine or DB_SCHEMA is None")
 
+    from sqlalchemy import text
+
     with engine.connect() as connection:
         # Get all tables in the schema
         tables_query = text("""
@@ -139,12 +163,28 @@ def get_table_row_counts(specific_tables: Optional[list[str]] = None) -> dict[st
         if not all_tables:
             return {}
 
-        union_queries = " UNION ALL ".join(
-            f"SELECT '{table}' AS table_name, COUNT(*) AS row_count FROM {table}" for table in all_tables
-        )
-        count_query = text(union_queries)
-        result = connection.execute(count_query)
-        return {row["table_name"]: row["row_count"] for row in result.mappings()}
+        counts = {}
+        if approximate:
+            # reltuples is -1 until the table is first vacuumed or analyzed
+            estimates_query = text("""
+                SELECT CASE WHEN n.nspname = :schema THEN c.relname ELSE n.nspname || '.' || c.relname END,
+                       c.reltuples::bigint
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE (n.nspname = :schema AND c.relname = ANY(:tables)) OR (n.nspname = 'rdk' AND c.relname = 'mols')
+            """)
+            estimates = connection.execute(estimates_query, {"schema": DB_SCHEMA, "tables": all_tables})
+            counts = {table: count for table, count in estimates if count >= 0 and table in all_tables}
+
+        tables_to_count = [table for table in all_tables if table not in counts]
+        if tables_to_count:
+            union_queries = " UNION ALL ".join(
+                f"SELECT '{table}' AS table_name, COUNT(*) AS row_count FROM {table}" for table in tables_to_count
+            )
+            result = connection.execute(text(union_queries))
+            counts.update({row["table_name"]: row["row_count"] for row in result.mappings()})
+
+        return {table: counts[table] for table in all_tables}
 
 
 def handle_request(method: Callable, endpoint: str, headers: dict[str, str], **kwargs) -> Dict[str, Any]:
@@ -153,29 +193,29 @@ def handle_request(method: Callable, endpoint: str, headers: dict[str, str], **k
         response.raise_for_status()
     except (RequestException, Timeout) as e:
         try:
-            err_detail = response.json().get("detail")
+            err_detail = orjson.loads(response.content).get("detail")
             typer.secho(f"❌ Error: {err_detail}", fg=typer.colors.RED, err=True)
         except Exception:
             typer.secho(f"❌ Request failed: {e}", fg=typer.colors.RED, err=True)
         raise typer.Exit(code=1)
 
     try:
-        return response.json()
-    except (json.JSONDecodeError, ValueError):
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
         typer.secho(f"❌ Failed to parse JSON. Response: {response.text}", fg=typer.colors.RED, err=True)
         raise typer.Exit(code=1)
 
 
 def handle_get_request(endpoint: str, headers: dict[str, str], params: Optional[Dict[str, Any]] = None):
-    return handle_request(requests.get, endpoint, headers, params=params)
+    return handle_request(SESSION.get, endpoint, headers, params=params)
 
 
 def handle_delete_request(endpoint: str, headers: dict[str, str]):
-    return handle_request(requests.delete, endpoint, headers)
+    return handle_request(SESSION.delete, endpoint, headers)
 
 
 def handle_put_request(endpoint: str, headers: dict[str, str], json_data: Dict[str, Any]):
-    return handle_request(requests.put, endpoint, headers, json=json_data)
+    return handle_request(SESSION.put, endpoint, headers, json=json_data)
 
 
 def make_headers() -> dict[str, str]:
@@ -1,12 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
 import csv
 from datetime import datetime
-import json
+import io
 import os
 from pathlib import Path
 import tempfile
-from typing import Optional
+from typing import Any, BinaryIO, Optional
+import uuid
+import orjson
 import requests
 import typer
+from client.utils.http_session import SESSION
+
+
+class MultipartFileStream:
+    """
+    multipart/form-data body that reads the file from disk while it is being sent.
+
+    Passing files= to requests builds the whole body in memory first. This object has a length,
+    so the Content-Length header is still set, and read() walks the form fields, the open file
+    and the closing boundary in turn.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, Optional[str]],
+        file_field: str,
+        file_name: str,
+        file_obj: BinaryIO,
+        file_content_type: str = "text/csv",
+    ):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        # Fields set to None are left out, as requests does for form data
+        head = "".join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+            for name, value in fields.items()
+            if value is not None
+        )
+        head += (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; filename="{file_name}"\r\n'
+            f"Content-Type: {file_content_type}\r\n\r\n"
+        )
+        head_bytes = head.encode("utf-8")
+        tail_bytes = f"\r\n--{boundary}--\r\n".encode("utf-8")
+        file_size = os.fstat(file_obj.fileno()).st_size - file_obj.tell()
+
+        self._parts = [io.BytesIO(head_bytes), file_obj, io.BytesIO(tail_bytes)]
+        self._length = len(head_bytes) + file_size + len(tail_bytes)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        while self._parts and size != 0:
+            chunk = self._parts[0].read(size)
+            if not chunk:
+                self._parts.pop(0)
+                continue
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b"".join(chunks)
 
 
 def report_csv_information(
@@ -82,66 +139,36 @@ def send_csv_upload_request(
 
             with open(file_to_send, "rb") as f:
                 file_field = "csv_file" if entity_type == "additions" else "file"
-                files = {file_field: (csv_path.name, f, "text/csv")}
 
                 data = {"error_handling": error_handling, "output_format": output_format}
 
                 if mapping_data:
-                    data["mapping"] = json.dumps(mapping_data)
+                    data["mapping"] = orjson.dumps(mapping_data).decode()
+
+                # Stream the file instead of letting requests hold the whole body in memory
+                body = MultipartFileStream(data, file_field, csv_path.name, f)
 
                 typer.echo(f"🚀 Sending {csv_path.name} to {url}{endpoint}...")
 
-                response = requests.post(f"{url}{endpoint}", files=files, data=data, headers=headers)
+                response = SESSION.post(
+                    f"{url}{endpoint}", data=body, headers={**headers, "Content-Type": body.content_type}
+                )
 
                 if response.status_code == 200:
                     typer.echo(f"✅ {entity_type.capitalize()} registered successfully!")
 
                     # Parse the result based on output format
-                    data_list = response.json()
+                    data_list = orjson.loads(response.content)
                     if entity_type == "additions":
                         data_list = data_list.get("additions", [])
-                    success_count = sum(
-                        1
-                        for item in data_list
-                        if item.get("registration_status", "") == "success" or item.get("status", "") == "success"
-                    )
-                    error_count = len(data_list) - success_count
-                    typer.echo(f"📊 Results: {success_count} successful, {error_count} errors")
-
-                    # Show any errors
-                    errors = {}
-                    for i, item in enumerate(data_list):
-                        if item.get("registration_status") != "success":
-                            errors[i] = item["registration_error_message"]
-                    if errors:
-                        typer.echo("❌ Errors found:")
-                        for key, value in errors.items():
-                            if key == 5:
-                                break
-                            typer.echo(f"  - Row {key}: {value}")
-                        if len(errors) > 5:
-                            typer.echo(f"  ... and {len(errors) - 5} more errors")
-
-                        # Save errors to file if requested
-                        if save_errors:
-                            # Generate filename based on endpoint
-                            endpoint_name = endpoint.strip("/").replace("/", "_")
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                            error_filename = f"{endpoint_name}_errors_{timestamp}.json"
-
-                            try:
-                                with open(error_filename, "w") as error_file:
-                                    json.dump(errors, error_file, indent=2)
-                                typer.echo(f"💾 Error records saved to: {error_filename}")
-                            except Exception as e:
-                                typer.echo(f"⚠️  Warning: Could not save error file: {e}")
+                    report_upload_results(data_list, endpoint, save_errors)
 
                 else:
                     typer.echo(f"❌ Error: {response.status_code}")
                     try:
-                        error_detail = response.json()
-                        typer.echo(f"Details: {json.dumps(error_detail, indent=2)}")
-                    except (json.JSONDecodeError, ValueError):
+                        error_detail = orjson.loads(response.content)
+                        typer.echo(f"Details: {orjson.dumps(error_detail, option=orjson.OPT_INDENT_2).decode()}")
+                    except orjson.JSONDecodeError:
                         typer.echo(f"Response: {response.text}")
         finally:
             # Clean up temporary file
@@ -162,6 +189,148 @@ def send_csv_upload_request(
         raise typer.Exit(1)
 
 
+def report_upload_results(
+    data_list: list[dict[str, Any]],
+    endpoint: str,
+    save_errors: bool = False,
+    row_numbers: Optional[list[int]] = None,
+):
+    """
+    Print the success and error counts of an upload response and optionally save the errors.
+
+    Args:
+        data_list: Per-row results returned by the server
+        endpoint: API endpoint the rows were sent to, used to name the error file
+        save_errors: Whether to save error records to a file
+        row_numbers: Row of the uploaded file each result belongs to; defaults to its position in data_list
+    """
+    success_count = sum(
+        1
+        for item in data_list
+        if item.get("registration_status", "") == "success" or item.get("status", "") == "success"
+    )
+    error_count = len(data_list) - success_count
+    typer.echo(f"📊 Results: {success_count} successful, {error_count} errors")
+
+    # Show any errors
+    errors = {}
+    for i, item in zip(row_numbers if row_numbers is not None else range(len(data_list)), data_list):
+        if item.get("registration_status") != "success":
+            errors[i] = item["registration_error_message"]
+    if errors:
+        typer.echo("❌ Errors found:")
+        for key, value in errors.items():
+            if key == 5:
+                break
+            typer.echo(f"  - Row {key}: {value}")
+        if len(errors) > 5:
+            typer.echo(f"  ... and {len(errors) - 5} more errors")
+
+        # Save errors to file if requested
+        if save_errors:
+            # Generate filename based on endpoint
+            endpoint_name = endpoint.strip("/").replace("/", "_")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            error_filename = f"{endpoint_name}_errors_{timestamp}.json"
+
+            try:
+                # Row indices are the keys, so non-string keys are allowed
+                with open(error_filename, "wb") as error_file:
+                    error_file.write(orjson.dumps(errors, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                typer.echo(f"💾 Error records saved to: {error_filename}")
+            except Exception as e:
+                typer.echo(f"⚠️  Warning: Could not save error file: {e}")
+
+
+def _post_csv_chunk(
+    rows: list[dict[str, str]], file_name: str, url: str, endpoint: str, headers: dict[str, str], file_field: str
+) -> requests.Response:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=rows[0].keys())
+    writer.writeheader()
+    writer.writerows(rows)
+    files = {file_field: (file_name, buffer.getvalue().encode("utf-8"), "text/csv")}
+    data = {"output_format": "json"}
+    return SESSION.post(f"{url}{endpoint}", files=files, data=data, headers=headers)
+
+
+def send_csv_upload_in_chunks(
+    csv_path: Path,
+    csv_data: list[dict[str, str]],
+    url: str,
+    endpoint: str,
+    headers: dict[str, str],
+    entity_type: str,
+    chunk_size: int,
+    concurrency: int = 4,
+    save_errors: bool = False,
+) -> None:
+    """
+    Send CSV rows in chunks of chunk_size, with up to concurrency requests in flight.
+    Results are reported in row order, as for a single upload.
+
+    Args:
+        csv_path: Path to the CSV file
+        csv_data: Loaded CSV rows
+        url: Server URL
+        endpoint: API endpoint to send requests to
+        headers: Request headers
+        entity_type: Type of entity for user messages
+        chunk_size: Number of rows per request
+        concurrency: Maximum number of concurrent requests
+        save_errors: Whether to save error records to a file
+    """
+    chunks = [csv_data[start : start + chunk_size] for start in range(0, len(csv_data), chunk_size)]
+    file_field = "csv_file" if entity_type == "additions" else "file"
+    typer.echo(f"🚀 Sending {csv_path.name} to {url}{endpoint} in {len(chunks)} chunks...")
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            responses = list(
+                executor.map(
+                    lambda rows: _post_csv_chunk(rows, csv_path.name, url, endpoint, headers, file_field), chunks
+                )
+            )
+    except requests.exceptions.ConnectionError:
+        typer.echo(f"❌ Error: Could not connect to server at {url}", err=True)
+        raise typer.Exit(1)
+    except requests.exceptions.RequestException as e:
+        typer.echo(f"❌ Error making request: {e}", err=True)
+        raise typer.Exit(1)
+
+    data_list = []
+    # Row of the file each result belongs to, so errors keep their row numbers whatever chunks failed
+    row_numbers = []
+    failed = False
+    for index, (rows, response) in enumerate(zip(chunks, responses)):
+        offset = index * chunk_size
+        if response.status_code != 200:
+            failed = True
+            typer.echo(f"❌ Error: {response.status_code} for rows starting at {offset}")
+            try:
+                error_detail = orjson.loads(response.content)
+                typer.echo(f"Details: {orjson.dumps(error_detail, option=orjson.OPT_INDENT_2).decode()}")
+            except orjson.JSONDecodeError:
+                typer.echo(f"Response: {response.text}")
+            # Every row of the chunk failed; report them rather than dropping them from the results
+            chunk_results = [
+                {
+                    "registration_status": "failed",
+                    "registration_error_message": f"Chunk request failed with status {response.status_code}",
+                }
+            ] * len(rows)
+        else:
+            chunk_results = orjson.loads(response.content)
+            if entity_type == "additions":
+                chunk_results = chunk_results.get("additions", [])
+        data_list.extend(chunk_results)
+        row_numbers.extend(range(offset, offset + len(chunk_results)))
+
+    if not failed:
+        typer.echo(f"✅ {entity_type.capitalize()} registered successfully!")
+    report_upload_results(data_list, endpoint, save_errors, row_numbers)
+
+
 def parse_arg(arg, arg_type="json", default_value=None, allow_comma_separated=False):
     """
     Parse an argument, which can be a JSON string, a path to a JSON file, or a comma-separated string.
@@ -180,7 +349,7 @@ def parse_arg(arg, arg_type="json", default_value=None, allow_comma_separated=Fa
 
     # Try to parse as JSON string
     try:
-        return json.loads(arg)
+        return orjson.loads(arg)
     except Exception:
         # If JSON parsing fails and comma-separated is allowed, try that
         if allow_comma_separated:
@@ -30,7 +30,7 @@ def display_data_table(
     data: list[dict],
     title: str,
     columns: list[tuple[str, str, dict]],
-    row_extractor: callable,
+    row_extractor: callable = None,
     show_total: bool = False,
     total_label: str = "TOTAL",
     max_rows: int = None,
@@ -39,10 +39,10 @@ def display_data_table(
     Display data in a rich table format.
 
     Args:
-        data: List of data dictionaries
+        data: List of data dictionaries, or of row value sequences when no row_extractor is given
         title: Table title
         columns: List of (header, style, kwargs) tuples for each column
-        row_extractor: Function that extracts row values from a data item
+        row_extractor: Function that extracts row values from a data item; None if the items are the rows
         show_total: Whether to show a total row
         total_label: Label for the total row
         max_rows: Maximum number of rows to display (None = all)
@@ -57,7 +57,7 @@ def display_data_table(
     typer.echo(f"Rows: {len(data)} (total available: {total_rows})")
 
     for item in data:
-        row_values = row_extractor(item)
+        row_values = row_extractor(item) if row_extractor is not None else item
         table.add_row(*row_values)
 
         # Update total if needed and if the last value is numeric
@@ -1,6 +1,7 @@
 import csv
 import json
 from pathlib import Path
+from typing import Any
 
 import typer
 
@@ -55,6 +56,29 @@ def load_and_validate_json(file_path: str, model_class=None) -> dict:
     return data
 
 
+def load_and_validate_json_bytes(file_path: str, model_class) -> tuple[bytes, Any]:
+    """
+    Read a JSON file and validate it against a Pydantic model, returning the raw file content and the model.
+    The content is parsed once by Pydantic and can be sent as a request body without re-serializing it.
+    """
+    file_path_obj = validate_file_exists(file_path)
+
+    try:
+        content = file_path_obj.read_bytes()
+    except Exception as e:
+        typer.echo(f"Error reading file '{file_path}': {e}", err=True)
+        raise typer.Exit(1)
+
+    model_name = model_class.__name__
+    try:
+        model = model_class.model_validate_json(content)
+    except Exception as e:
+        typer.secho(f"❌ JSON validation failed using {model_name} model: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+    typer.echo(f"✅ JSON validation passed using {model_name} model!")
+    return content, model
+
+
 def load_csv_data(file_path: str, max_rows: int | None = None) -> list[dict[str, str]]:
     """Load CSV data from a file and return as list of dictionaries."""
     file_path_obj = validate_file_exists(file_path)
@@ -0,0 +1,12 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared by every CLI request so keep-alive connections to the API are reused instead of reopened per call.
+# Retry only covers idempotent methods, connection errors and gateway errors; POST uploads are never resent.
+# Once retries run out the last response is returned so callers still report the server's error detail.
+SESSION = requests.Session()
+_retry = Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504), raise_on_status=False)
+_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=_retry)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from client.client import SUBAPPS, LazySubApp, app
+from client.config import settings
+
+runner = CliRunner()
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_sub_apps_are_not_imported_with_the_cli():
+    code = "import sys, client.client; print(sorted(m for m in sys.modules if m.startswith('client.cli.')))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "['client.cli.auth']"
+
+
+def test_top_level_help_lists_every_sub_app():
+    result = runner.invoke(app, ["--help"])
+
+    assert result.exit_code == 0, result.output
+    for name, (_, _, help) in SUBAPPS.items():
+        assert name in result.output
+        assert help in result.output
+
+
+def test_lazy_sub_app_loads_on_first_use():
+    module, attr, help = SUBAPPS["schema"]
+    stub = LazySubApp("schema", module, attr, help)
+
+    loaded = stub.load()
+    assert loaded is stub.load()
+    assert loaded.name == "schema"
+    assert loaded.help
+    assert "list" in loaded.commands
+
+
+def test_sub_app_help_comes_from_the_loaded_group(monkeypatch):
+    # The global callback stores the key in the settings; restore it afterwards
+    monkeypatch.setattr(settings, "API_KEY", settings.API_KEY)
+    result = runner.invoke(app, ["--api-key", "test-key", "directory", "--help"])
+
+    assert result.exit_code == 0, result.output
+    assert "load" in result.output
+    assert "--install-completion" not in result.output
@@ -0,0 +1,154 @@
+from email import policy
+from email.parser import BytesParser
+from pathlib import Path
+
+import orjson
+import pytest
+
+from client.utils import data_ingest
+from client.utils.data_ingest import MultipartFileStream, report_upload_results, send_csv_upload_in_chunks
+
+
+def ok(message=""):
+    return {"registration_status": "success", "registration_error_message": message}
+
+
+def failed(message):
+    return {"registration_status": "failed", "registration_error_message": message}
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.content = orjson.dumps(payload)
+        self.text = self.content.decode()
+
+
+def saved_errors(path: Path):
+    (error_file,) = path.glob("*_errors_*.json")
+    return orjson.loads(error_file.read_bytes())
+
+
+def test_report_upload_results_numbers_rows_by_position(capsys, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    report_upload_results([ok(), failed("bad smiles"), ok(), failed("unknown property")], "/v1/compounds", True)
+
+    out = capsys.readouterr().out
+    assert "2 successful, 2 errors" in out
+    assert "Row 1: bad smiles" in out
+    assert "Row 3: unknown property" in out
+    assert saved_errors(tmp_path) == {"1": "bad smiles", "3": "unknown property"}
+
+
+def test_report_upload_results_uses_given_row_numbers(capsys):
+    report_upload_results([failed("a"), ok(), failed("b")], "/v1/compounds", row_numbers=[10, 11, 12])
+
+    out = capsys.readouterr().out
+    assert "Row 10: a" in out
+    assert "Row 12: b" in out
+
+
+def test_report_upload_results_truncates_error_listing(capsys):
+    report_upload_results([failed(f"error {i}") for i in range(8)], "/v1/compounds")
+
+    out = capsys.readouterr().out
+    assert "Row 4: error 4" in out
+    assert "Row 5" not in out
+    assert "... and 3 more errors" in out
+
+
+@pytest.fixture
+def chunk_responses(monkeypatch):
+    # Responses by the first row of each chunk
+    responses = {}
+
+    def fake_post(rows, file_name, url, endpoint, headers, file_field):
+        return responses[rows[0]["smiles"]]
+
+    monkeypatch.setattr(data_ingest, "_post_csv_chunk", fake_post)
+    return responses
+
+
+def test_send_csv_upload_in_chunks_keeps_row_numbers_after_failed_chunk(chunk_responses, capsys, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    rows = [{"smiles": f"C{i}"} for i in range(6)]
+    chunk_responses.update(
+        {
+            "C0": FakeResponse(200, [ok(), failed("row 1 failed")]),
+            "C2": FakeResponse(500, {"detail": "server error"}),
+            "C4": FakeResponse(200, [failed("row 4 failed"), ok()]),
+        }
+    )
+
+    send_csv_upload_in_chunks(
+        tmp_path / "compounds.csv", rows, "http://server", "/v1/compounds", {}, "compounds", 2, save_errors=True
+    )
+
+    out = capsys.readouterr().out
+    assert "Error: 500 for rows starting at 2" in out
+    assert "2 successful, 4 errors" in out
+    assert "Row 1: row 1 failed" in out
+    assert "Row 4: row 4 failed" in out
+    assert saved_errors(tmp_path) == {
+        "1": "row 1 failed",
+        "2": "Chunk request failed with status 500",
+        "3": "Chunk request failed with status 500",
+        "4": "row 4 failed",
+    }
+
+
+def test_send_csv_upload_in_chunks_all_successful(chunk_responses, capsys, tmp_path):
+    rows = [{"smiles": f"C{i}"} for i in range(3)]
+    chunk_responses.update({"C0": FakeResponse(200, [ok(), ok()]), "C2": FakeResponse(200, [ok()])})
+
+    send_csv_upload_in_chunks(tmp_path / "compounds.csv", rows, "http://server", "/v1/compounds", {}, "compounds", 2)
+
+    out = capsys.readouterr().out
+    assert "in 2 chunks" in out
+    assert "Compounds registered successfully!" in out
+    assert "3 successful, 0 errors" in out
+
+
+def read_all(stream, size):
+    chunks = []
+    while chunk := stream.read(size):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def parse_multipart(content_type, body):
+    message = BytesParser(policy=policy.HTTP).parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+    return {part.get_param("name", header="content-disposition"): part for part in message.iter_parts()}
+
+
+@pytest.mark.parametrize("read_size", [-1, 1, 7, 4096])
+def test_multipart_file_stream_body(tmp_path, read_size):
+    csv_path = tmp_path / "compounds.csv"
+    csv_path.write_bytes(b"smiles,name\r\nCCO,ethanol\r\n")
+
+    with open(csv_path, "rb") as f:
+        body = MultipartFileStream({"error_handling": "reject_row", "mapping": None}, "file", "compounds.csv", f)
+        content = read_all(body, read_size)
+
+    assert len(body) == len(content)
+    assert body.read() == b""
+    parts = parse_multipart(body.content_type, content)
+    assert set(parts) == {"error_handling", "file"}
+    assert parts["error_handling"].get_content() == "reject_row"
+    assert parts["file"].get_filename() == "compounds.csv"
+    assert parts["file"].get_content_type() == "text/csv"
+    assert parts["file"].get_payload(decode=True) == b"smiles,name\r\nCCO,ethanol\r\n"
+
+
+def test_multipart_file_stream_starts_at_file_position(tmp_path):
+    csv_path = tmp_path / "compounds.csv"
+    csv_path.write_bytes(b"\xef\xbb\xbfsmiles\nCCO\n")
+
+    with open(csv_path, "rb") as f:
+        f.seek(3)  # e.g. after skipping a BOM
+        body = MultipartFileStream({}, "file", "compounds.csv", f)
+        content = read_all(body, 5)
+
+    assert len(body) == len(content)
+    assert parse_multipart(body.content_type, content)["file"].get_payload(decode=True) == b"smiles\nCCO\n"
@@ -0,0 +1,89 @@
+import threading
+
+import typer
+from typer.testing import CliRunner
+
+from client.cli import directory
+from client.cli.directory import directory_app
+
+runner = CliRunner()
+
+
+def test_concurrent_loads_do_not_interleave_output(tmp_path, monkeypatch):
+    schema_files = ["compounds_schema.json", "batches_schema.json", "assays_schema.json"]
+    for name in schema_files:
+        (tmp_path / name).write_text("{}")
+
+    # Every loader waits for the others, so their lines would interleave if written directly
+    barrier = threading.Barrier(len(schema_files))
+
+    def fake_add_schema(file_path, url):
+        name = file_path.rsplit("/", 1)[-1]
+        typer.echo(f"{name}: first")
+        barrier.wait(timeout=5)
+        typer.echo(f"{name}: second")
+
+    monkeypatch.setattr(directory, "add_schema_from_file", fake_add_schema)
+    monkeypatch.setattr(directory, "make_headers", dict)
+
+    # Files of a wave only load concurrently when a failure does not have to stop the others
+    result = runner.invoke(directory_app, [str(tmp_path), "--error-handling", "reject_row"])
+
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    for name in schema_files:
+        start = lines.index(f"📥 Loading {name}...")
+        assert lines[start + 1 : start + 4] == [f"{name}: first", f"{name}: second", f"✅ {name} loaded successfully!"]
+    # Loads are reported in wave order
+    assert [line for line in lines if line.startswith("📥")] == [f"📥 Loading {name}..." for name in schema_files]
+    assert "Directory loading completed!" in lines[-1]
+
+
+def test_reject_all_stops_at_first_failed_load(tmp_path, monkeypatch):
+    schema_files = ["compounds_schema.json", "batches_schema.json", "assays_schema.json"]
+    for name in schema_files:
+        (tmp_path / name).write_text("{}")
+    posted = []
+
+    def fake_add_schema(file_path, url):
+        name = file_path.rsplit("/", 1)[-1]
+        posted.append(name)
+        if name == "batches_schema.json":
+            raise ValueError("invalid schema")
+        typer.echo(f"{name} posted")
+
+    monkeypatch.setattr(directory, "add_schema_from_file", fake_add_schema)
+    monkeypatch.setattr(directory, "make_headers", dict)
+
+    result = runner.invoke(directory_app, [str(tmp_path)])
+
+    assert result.exit_code == 1
+    # The schema after the failing one is never sent
+    assert posted == ["compounds_schema.json", "batches_schema.json"]
+    assert "compounds_schema.json posted" in result.output
+    assert "❌ Error loading batches_schema.json: invalid schema" in result.output
+    assert "Directory loading completed!" not in result.output
+
+
+def test_reject_row_loads_rest_of_wave_after_failure(tmp_path, monkeypatch):
+    schema_files = ["compounds_schema.json", "batches_schema.json", "assays_schema.json"]
+    for name in schema_files:
+        (tmp_path / name).write_text("{}")
+    posted = []
+
+    def fake_add_schema(file_path, url):
+        name = file_path.rsplit("/", 1)[-1]
+        posted.append(name)
+        if name == "batches_schema.json":
+            raise ValueError("invalid schema")
+
+    monkeypatch.setattr(directory, "add_schema_from_file", fake_add_schema)
+    monkeypatch.setattr(directory, "make_headers", dict)
+
+    result = runner.invoke(directory_app, [str(tmp_path), "--error-handling", "reject_row"])
+
+    assert result.exit_code == 0, result.output
+    assert sorted(posted) == sorted(schema_files)
+    assert "❌ Error loading batches_schema.json: invalid schema" in result.output
+    assert "✅ assays_schema.json loaded successfully!" in result.output
+    assert "Directory loading completed!" in result.output
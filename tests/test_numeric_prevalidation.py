@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.properties.property_service import PropertyService
+from app.services.properties.property_validator import PropertyValidator
+from app.utils import enums
+
+COMPOUND = enums.EntityType.COMPOUND
+
+
+def make_property(name, value_type="double", min=None, max=None, input_type=None, entity_type=COMPOUND):
+    return SimpleNamespace(
+        name=name, value_type=value_type, min=min, max=max, input_type=input_type, entity_type=entity_type
+    )
+
+
+@pytest.fixture
+def service():
+    # Skip __init__: it loads the validators from the database
+    service = object.__new__(PropertyService)
+    service.property_records_map = {
+        prop.name: [prop]
+        for prop in (
+            make_property("MolLogP", min=-10, max=10),
+            make_property("Purity", min=0),
+            make_property("Count", value_type="int", min=0),
+            make_property("Tags", input_type="list", min=0, max=1),
+            make_property("BatchOnly", entity_type=enums.EntityType.BATCH, min=0),
+        )
+    }
+    return service
+
+
+def test_validate_numeric_column_masks_out_of_range_and_unparsable():
+    prop = make_property("MolLogP", min=-10, max=10)
+    mask = PropertyValidator.validate_numeric_column(["1.5", 3, "-10", "10.5", "-11", "abc", None, "nan"], prop)
+    assert mask.tolist() == [True, True, True, False, False, False, False, False]
+
+
+def test_validate_numeric_column_without_bounds_only_checks_parsing():
+    mask = PropertyValidator.validate_numeric_column(["1e300", "x"], make_property("Any"))
+    assert mask.tolist() == [True, False]
+
+
+def test_prevalidate_numeric_columns_marks_in_range_values(service):
+    rows = [
+        {"MolLogP": "2.5", "Purity": "99"},
+        {"MolLogP": "11", "Purity": "-1"},  # out of range
+        {"MolLogP": "abc", "Purity": "oops"},  # unparsable
+        {"MolLogP": ">5", "Purity": "=3"},  # qualifiers are stripped before the range check
+    ]
+    assert service.prevalidate_numeric_columns(rows, COMPOUND) == [
+        {"MolLogP", "Purity"},
+        set(),
+        set(),
+        {"MolLogP", "Purity"},
+    ]
+
+
+def test_prevalidate_numeric_columns_leaves_other_properties_to_scalar_path(service):
+    rows = [
+        {
+            "Unknown": "1",
+            "BatchOnly": "1",  # wrong entity type
+            "Count": "1",  # not a double
+            "Tags": [0.5, 0.7],  # list input
+            "MolLogP": None,
+            "Purity": "",
+        },
+        {"Tags": "none", "MolLogP": "none"},
+    ]
+    assert service.prevalidate_numeric_columns(rows, COMPOUND) == [set(), set()]
+
+
+def test_prevalidate_numeric_columns_empty_chunk(service):
+    assert service.prevalidate_numeric_columns([], COMPOUND) == []
+    assert service.prevalidate_numeric_columns([{}, {}], COMPOUND) == [set(), set()]
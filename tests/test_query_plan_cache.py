@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app import models
+from app.services.search import query_builder
+from app.services.search.query_builder import QueryBuilder, QuerySignature, _filter_signature, _iter_conditions
+
+
+def cond(field, operator, value, threshold=None):
+    return models.AtomicCondition(field=field, operator=operator, value=value, threshold=threshold)
+
+
+def node(operator, *conditions):
+    return models.LogicalNode(operator=operator, conditions=list(conditions))
+
+
+def request(filter_obj=None, level="compounds", limit=None):
+    return models.SearchRequest(level=level, output=["compounds.canonical_smiles"], filter=filter_obj, limit=limit)
+
+
+def signature(filter_obj, **kwargs):
+    return QuerySignature.from_request("moltrack", request(filter_obj, **kwargs), {})
+
+
+def test_signature_ignores_literal_values():
+    first = node("AND", cond("compounds.details.mw", ">", 100), cond("compounds.canonical_smiles", "=", "CCO"))
+    second = node("AND", cond("compounds.details.mw", ">", 250.5), cond("compounds.canonical_smiles", "=", "c1ccccc1"))
+    assert signature(first) == signature(second)
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        cond("compounds.details.mw", "<", 100),  # operator
+        cond("compounds.details.logp", ">", 100),  # field
+        cond("compounds.details.mw", ">", None),  # NULL changes the SQL
+    ],
+)
+def test_signature_depends_on_structure(other):
+    assert signature(cond("compounds.details.mw", ">", 100)) != signature(other)
+
+
+def test_signature_depends_on_in_list_length():
+    short = cond("compounds.canonical_smiles", "IN", ["C", "CC"])
+    assert signature(short) == signature(cond("compounds.canonical_smiles", "IN", ["N", "O"]))
+    assert signature(short) != signature(cond("compounds.canonical_smiles", "IN", ["C", "CC", "CCC"]))
+
+
+def test_signature_depends_on_request_options():
+    filter_obj = cond("compounds.details.mw", ">", 100)
+    assert signature(filter_obj) != signature(filter_obj, limit=10)
+    assert signature(filter_obj) != signature(filter_obj, level="batches")
+
+
+def test_signature_tracks_repeated_subtrees():
+    # Identical conditions share their SQL, so a repeat is a different plan from two distinct values
+    repeated = node("OR", cond("compounds.details.mw", ">", 100), cond("compounds.details.mw", ">", 100))
+    distinct = node("OR", cond("compounds.details.mw", ">", 100), cond("compounds.details.mw", ">", 200))
+    assert signature(repeated) != signature(distinct)
+    assert _filter_signature(repeated, {})[1][0][-1] == _filter_signature(repeated, {})[1][1][-1] == 0
+    assert [sig[-1] for sig in _filter_signature(distinct, {})[1]] == [0, 1]
+
+
+def test_signature_of_unhashable_values():
+    filter_obj = cond("compounds.details.tags", "=", {"nested": ["value"]})
+    assert _filter_signature(filter_obj, {})[-1] is None
+
+
+def test_iter_conditions_visits_filter_order():
+    a, b, c = (cond(f"compounds.details.p{i}", "=", i) for i in range(3))
+    assert list(_iter_conditions(node("AND", a, node("OR", b, c)))) == [a, b, c]
+
+
+def test_bind_params_rebinds_values_to_cached_prefixes():
+    builder = QueryBuilder(field_resolver=None)
+    filter_obj = node(
+        "AND",
+        cond("compounds.details.mw", ">", 250),
+        cond("compounds.canonical_smiles", "IN", ["C", "CC"]),
+        cond("compounds.details.logp", "RANGE", [1, 3]),
+    )
+    assert builder._bind_params(filter_obj, ("p1_", "p2_", "p3_")) == {
+        "p1_": 250,
+        "p2_1": "C",
+        "p2_2": "CC",
+        "p3_1": 1,
+        "p3_2": 3,
+    }
+    assert builder._bind_params(None, ()) == {}
+
+
+@pytest.fixture
+def plan_cache(monkeypatch):
+    cache = query_builder.OrderedDict()
+    monkeypatch.setattr(QueryBuilder, "_plan_cache", cache)
+    return cache
+
+
+def test_build_query_reuses_cached_plan(plan_cache):
+    builder = QueryBuilder(field_resolver=SimpleNamespace(db_schema="moltrack"))
+    cached = request(node("AND", cond("compounds.details.mw", ">", 100), cond("compounds.details.mw", "<", 500)))
+    plan_cache[QuerySignature.from_request("moltrack", cached, {})] = ("SELECT cached", ("a_", "b_"))
+    plan_cache[signature(None)] = ("SELECT other", ())
+
+    rebound = request(node("AND", cond("compounds.details.mw", ">", 7), cond("compounds.details.mw", "<", 9)))
+    assert builder.build_query(rebound, {}) == {"sql": "SELECT cached", "params": {"a_": 7, "b_": 9}}
+    # The hit becomes the most recently used entry
+    assert list(plan_cache.values())[-1] == ("SELECT cached", ("a_", "b_"))
@@ -0,0 +1,204 @@
+from collections import deque
+
+import pytest
+from rdkit.Chem.RegistrationHash import HashScheme
+
+from app.services.registrars import compound_registrar
+from app.services.registrars.batch_registrar import BATCH_REGNO_SEQ, BatchRegistrar
+from app.services.registrars.compound_registrar import MOLREGNO_SEQ, CompoundRegistrar, ExistingCompound
+
+
+class FakeSession:
+    def __init__(self):
+        self.rolled_back = False
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def make_registrar(db, build_sql, registrar_class=CompoundRegistrar):
+    # Skip __init__: it loads properties and settings from the database
+    registrar = object.__new__(registrar_class)
+    registrar.db = db
+    registrar.output_rows = []
+    registrar.stop_registration = False
+    registrar.build_sql = build_sql.__get__(registrar)
+    return registrar
+
+
+def test_register_all_fails_whole_chunk_on_error():
+    db = FakeSession()
+    rows = [{"smiles": "C"}, {"smiles": "invalid"}, {"smiles": "CC"}]
+
+    def build_sql(self, rows):
+        self._add_output_row(rows[0], "success")
+        self._add_output_row(rows[1], "failed", "Invalid SMILES")
+        raise RuntimeError("copy failed")
+
+    registrar = make_registrar(db, build_sql)
+    registrar.register_all(rows)
+
+    assert db.rolled_back
+    assert registrar.output_rows == rows
+    assert [row["registration_status"] for row in registrar.output_rows] == ["failed"] * 3
+    assert rows[0]["registration_error_message"] == "Chunk was not registered: copy failed"
+    # Rows that already failed keep their own error
+    assert rows[1]["registration_error_message"] == "Invalid SMILES"
+    assert rows[2]["registration_error_message"] == "Chunk was not registered: copy failed"
+
+
+@pytest.mark.parametrize("status", ["failed", "not_processed"])
+def test_fail_chunk_keeps_existing_row_errors(status):
+    registrar = make_registrar(FakeSession(), lambda self, rows: "")
+    rows = [{"smiles": "C"}]
+    registrar._add_output_row(rows[0], status, "earlier error")
+
+    registrar._fail_chunk(rows, RuntimeError("boom"))
+
+    assert rows[0]["registration_status"] == status
+    assert rows[0]["registration_error_message"] == "earlier error"
+
+
+class PrefetchSession(FakeSession):
+    def __init__(self, rows):
+        super().__init__()
+        self.rows = rows
+        self.queries = []
+
+    def execute(self, statement, params=None):
+        self.queries.append(params)
+        rows = self.rows
+
+        class Result:
+            def all(self):
+                return rows
+
+        return Result()
+
+
+def compound_row(compound_id, hash_mol, *detail):
+    record = {column.key: None for column in compound_registrar._COMPOUND_COLUMNS}
+    record.update(id=compound_id, hash_mol=hash_mol, molregno=100 + compound_id, canonical_smiles="C")
+    values = tuple(record[column.key] for column in compound_registrar._COMPOUND_COLUMNS)
+    return values + (detail or (None, None, None, None, None))
+
+
+def test_prefetch_existing_compounds_loads_records_and_details():
+    db = PrefetchSession(
+        [
+            compound_row(1, "hash-a", 10, "red", None, None, None),
+            compound_row(1, "hash-a", 11, None, 2.5, None, None),
+            compound_row(2, "hash-b"),
+        ]
+    )
+    registrar = make_registrar(db, lambda self, rows: "")
+    registrar._existing_compounds = {}
+
+    registrar._prefetch_existing_compounds(["hash-a", "hash-b", "hash-c", "hash-a"])
+
+    assert db.queries == [{"hashes": ["hash-a", "hash-b", "hash-c"]}]
+    existing = registrar._existing_compounds
+    assert existing["hash-c"] is None
+    assert existing["hash-a"].details == {10: "red", 11: 2.5}
+    assert existing["hash-b"].details == {}
+    assert "id" not in existing["hash-a"].record
+    assert existing["hash-a"].record["molregno"] == 101
+    assert existing["hash-b"].record["hash_mol"] == "hash-b"
+
+    # Already known hashes are not queried again
+    registrar._prefetch_existing_compounds(["hash-a", "hash-c"])
+    assert len(db.queries) == 1
+
+
+def test_chunk_id_counts_only_reserve_for_inserted_rows():
+    registrar = make_registrar(FakeSession(), lambda self, rows: "", BatchRegistrar)
+    registrar._property_name_to_id = {"color": 10}
+    registrar._existing_compounds = {
+        "new": None,
+        "other-new": None,
+        "known": ExistingCompound({}, {10: "red"}),
+    }
+    chunk_mol_fields = [
+        {"hash_mol": "new"},
+        {"hash_mol": "new"},  # repeated SMILES within the chunk
+        {"hash_mol": "other-new", "inchi_error": (None, "Failed to generate InChI")},
+        {"error": (400, "Invalid SMILES")},
+        None,  # no SMILES
+        {"hash_mol": "known"},
+        {"hash_mol": "known"},
+        {"hash_mol": "known"},  # existing compound with different details
+    ]
+    grouped_rows = [{} for _ in chunk_mol_fields]
+    grouped_rows[-1] = {"compound_details": {"color": "blue"}}
+    grouped_rows[-2] = {"compound_details": {"color": "red"}}
+
+    assert CompoundRegistrar._chunk_id_counts(registrar, grouped_rows, chunk_mol_fields) == {MOLREGNO_SEQ: 1}
+    assert registrar._chunk_id_counts(grouped_rows, chunk_mol_fields) == {MOLREGNO_SEQ: 1, BATCH_REGNO_SEQ: 3}
+
+
+class NextvalSession(FakeSession):
+    def __init__(self):
+        super().__init__()
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        self.statements.append((str(statement), params))
+
+        class Result:
+            def all(self):
+                # Emulates CASE WHEN g <= :nX: nothing is drawn past each sequence's count
+                return [
+                    tuple(100 * (i + 1) + g if g <= params[f"n{i}"] else None for i in range(len(params) - 1))
+                    for g in range(1, params["n"] + 1)
+                ]
+
+        return Result()
+
+
+def test_bulk_nextval_draws_each_sequence_up_to_its_count():
+    db = NextvalSession()
+    registrar = make_registrar(db, lambda self, rows: "")
+
+    pools = registrar._bulk_nextval({MOLREGNO_SEQ: 1, BATCH_REGNO_SEQ: 3})
+
+    assert pools == {MOLREGNO_SEQ: deque([101]), BATCH_REGNO_SEQ: deque([201, 202, 203])}
+    sql, params = db.statements[0]
+    assert f"CASE WHEN g <= :n0 THEN nextval('{MOLREGNO_SEQ}') END" in sql
+    assert params == {"n": 3, "n0": 1, "n1": 3}
+
+
+def test_bulk_nextval_skips_query_when_nothing_to_reserve():
+    db = NextvalSession()
+    registrar = make_registrar(db, lambda self, rows: "")
+
+    assert registrar._bulk_nextval({MOLREGNO_SEQ: 0}) == {MOLREGNO_SEQ: deque()}
+    assert db.statements == []
+
+
+def test_compute_mol_fields_uses_empty_config_as_given():
+    # An empty config (no operations) must not fall back to the database
+    fields = compound_registrar._compute_mol_fields("OCC", HashScheme.ALL_LAYERS, {})
+
+    assert "error" not in fields
+    assert fields["canonical_smiles"] == "CCO"
+
+
+def test_existing_compounds_query_binds_hashes_as_bpchar():
+    # Comparing the CHAR(40) hash_mol with text[] would rule out its unique index
+    assert "c.hash_mol = ANY(CAST(:hashes AS bpchar[]))" in compound_registrar._EXISTING_COMPOUNDS_SQL.text
+
+
+def test_mol_pool_is_shared_until_shutdown():
+    pool = compound_registrar.get_mol_pool(2)
+    try:
+        assert compound_registrar.get_mol_pool(2) is pool
+        fields = list(pool.map(compound_registrar._compute_mol_fields, ["OCC"], [HashScheme.ALL_LAYERS], [{}]))
+        assert fields[0]["canonical_smiles"] == "CCO"
+    finally:
+        compound_registrar.shutdown_mol_pool()
+
+    new_pool = compound_registrar.get_mol_pool(2)
+    try:
+        assert new_pool is not pool
+    finally:
+        compound_registrar.shutdown_mol_pool()
@@ -0,0 +1,126 @@
+import enum
+import io
+import uuid
+from datetime import UTC, date, datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app import models
+from app.utils import sql_utils
+from app.utils.sql_utils import copy_value
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (None, "\\N"),
+        (True, "t"),
+        (False, "f"),
+        (0, "0"),
+        (1.5, "1.5"),
+        ("", ""),
+        ("plain", "plain"),
+        (Color.RED, "red"),
+        (date(2024, 1, 2), "2024-01-02"),
+        (datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC), "2024-01-02T03:04:05+00:00"),
+        (uuid.UUID("12345678-1234-5678-1234-567812345678"), "12345678-1234-5678-1234-567812345678"),
+    ],
+)
+def test_copy_value_renders_text_format(value, expected):
+    assert copy_value(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("a\tb", "a\\tb"),
+        ("line1\nline2", "line1\\nline2"),
+        ("line1\r\nline2", "line1\\r\\nline2"),
+        ("C:\\path", "C:\\\\path"),
+        # A literal backslash-N must not be read back as NULL
+        ("\\N", "\\\\N"),
+        ("\\\t", "\\\\\\t"),
+    ],
+)
+def test_copy_value_escapes_special_characters(value, expected):
+    assert copy_value(value) == expected
+
+
+def test_copy_value_keeps_molfile_on_one_line():
+    molfile = "\n  RDKit          2D\n\n  1  0  0  0  0  0  0  0  0  0999 V2000\nM  END"
+    rendered = copy_value(molfile)
+    assert "\n" not in rendered and "\t" not in rendered
+    assert rendered.replace("\\n", "\n") == molfile
+
+
+class FakeBind:
+    dialect = postgresql.dialect()
+
+
+class FakeSession:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+
+    def get_bind(self):
+        return FakeBind()
+
+
+@pytest.fixture
+def copied(monkeypatch):
+    calls = []
+
+    def fake_copy_from_stdin(db, copy_sql, buffer: io.StringIO):
+        calls.append((copy_sql, buffer.read()))
+
+    monkeypatch.setattr(sql_utils, "copy_from_stdin", fake_copy_from_stdin)
+    return calls
+
+
+def test_copy_to_temp_table_uses_database_column_types(copied):
+    db = FakeSession()
+    records = [{"hash_mol": "abc", "molregno": 1}, {"hash_mol": "d\te", "molregno": None}]
+
+    cols = sql_utils.copy_to_temp_table(db, "tmp_compounds", records, models.Compound.__table__)
+
+    assert cols == ["hash_mol", "molregno"]
+    create_sql = (
+        "CREATE TEMP TABLE tmp_compounds ON COMMIT DROP AS SELECT t.hash_mol, t.molregno "
+        "FROM moltrack.compounds t WITH NO DATA"
+    )
+    assert db.statements == [create_sql]
+    assert copied == [("COPY tmp_compounds (hash_mol, molregno) FROM STDIN", "abc\t1\nd\\te\t\\N\n")]
+
+
+def test_copy_to_temp_table_key_from_other_table(copied):
+    db = FakeSession()
+    records = [{"molregno": 7, "property_id": 2, "value_num": 1.0}]
+
+    cols = sql_utils.copy_to_temp_table(
+        db, "tmp_compound_details", records, models.CompoundDetail.__table__, key=models.Compound.__table__.c.molregno
+    )
+
+    assert cols == ["property_id", "value_num"]
+    assert "SELECT k.molregno, t.property_id, t.value_num" in db.statements[0]
+    assert "FROM moltrack.compound_details t CROSS JOIN moltrack.compounds k" in db.statements[0]
+    assert copied[0] == ("COPY tmp_compound_details (molregno, property_id, value_num) FROM STDIN", "7\t2\t1.0\n")
+
+
+def test_copy_to_temp_table_standalone_key(copied):
+    db = FakeSession()
+    records = [{"rn": 1, "assay_id": 3}]
+
+    cols = sql_utils.copy_to_temp_table(
+        db, "tmp_assay_runs", records, models.AssayRun.__table__, key=sql_utils.ROW_NUMBER_KEY
+    )
+
+    assert cols == ["assay_id"]
+    assert "SELECT CAST(NULL AS INTEGER) AS rn, t.assay_id FROM moltrack.assay_runs t WITH NO DATA" in db.statements[0]
+    assert copied[0] == ("COPY tmp_assay_runs (rn, assay_id) FROM STDIN", "1\t3\n")